@@ -110,20 +110,17 @@ def _mcp_server_from_registry(
     message_id: int | None = None,
 ) -> Any:
     """Build an SDK MCP server that wraps the tool registry for the allowed tools."""
-    from ..ai.tools.schemas import TOOL_SCHEMAS
+    from ..ai.tools.schemas import TOOL_SPECS_BY_NAME
 
     try:
         from claude_agent_sdk import SdkMcpTool, create_sdk_mcp_server
     except ImportError:
         return None
 
-    schema_by_name = {
-        s["name"]: s for s in TOOL_SCHEMAS if s["name"] in allowed_tool_names
-    }
     tools: list[Any] = []
 
     for name in allowed_tool_names:
-        schema = schema_by_name.get(name)
+        schema = TOOL_SPECS_BY_NAME.get(name)
         if not schema:
             continue
 
@@ -142,9 +139,9 @@ def _mcp_server_from_registry(
 
         tools.append(
             SdkMcpTool(
-                name=schema["name"],
-                description=schema["description"],
-                input_schema=schema["input_schema"],
+                name=schema.name,
+                description=schema.description,
+                input_schema=schema.input_schema,
                 handler=_handler,
             )
         )
@@ -12,6 +12,8 @@ import logging
 import re
 import time
 from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from ..config import settings
@@ -26,6 +28,8 @@ _SAFE_MEMORY_TAG = re.compile(
     re.IGNORECASE,
 )
 _ANY_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+# Same as _ANY_TAG but never crosses the NUL separator used by sanitize_many().
+_ANY_TAG_NO_NUL = re.compile(r"</?[a-zA-Z][^>\x00]*>")
 
 # Shell metacharacters that could trigger injection
 # NOTE: Patterns are intentionally narrow to avoid false positives on normal prose.
@@ -184,6 +188,17 @@ def validate_command_input(command: str, arg: str = "") -> tuple[bool, Optional[
     return True, None
 
 
+@lru_cache(maxsize=32)
+def _resolved_bases(allowed_bases: tuple[str, ...]) -> tuple[Path, ...]:
+    """
+    Resolve the allowed base directories once per process.
+
+    Only the configured bases are cached — the requested path itself is
+    resolved on every call so a re-pointed symlink is always re-checked.
+    """
+    return tuple(Path(allowed).resolve() for allowed in allowed_bases)
+
+
 def sanitize_file_path(
     path: str, allowed_bases: list[str]
 ) -> tuple[Optional[str], Optional[str]]:
@@ -203,8 +218,6 @@ def sanitize_file_path(
             return err
         # Safe to use path
     """
-    from pathlib import Path
-
     try:
         # Expand ~ and resolve to absolute path
         resolved = Path(path).expanduser().resolve()
@@ -215,14 +228,13 @@ def sanitize_file_path(
         for part in resolved.parts:
             if part in _DENIED_NAMES:
                 return None, f"Access denied: '{part}' is a protected file or directory"
-            if any(part.startswith(pfx) for pfx in _DENIED_PREFIXES):
+            if part.startswith(_DENIED_PREFIXES):
                 return None, f"Access denied: '{part}' is a protected file or directory"
         if resolved.suffix.lower() in _DENIED_SUFFIXES:
             return None, f"Access denied: '{resolved.name}' has a protected extension"
 
         # Check if it's under an allowed base
-        for allowed in allowed_bases:
-            allowed_path = Path(allowed).resolve()
+        for allowed_path in _resolved_bases(tuple(allowed_bases)):
             try:
                 resolved.relative_to(allowed_path)
                 # Safe — it's under the allowed base
@@ -238,6 +250,26 @@ def sanitize_file_path(
         return None, f"Invalid path '{path}': {e}"
 
 
+def _escape_unsafe_tags(text: str, pattern: re.Pattern[str]) -> str:
+    """Single regex pass: escape every tag matched by pattern that is not a safe memory tag."""
+    if "<" not in text:
+        # Every tag starts with "<"; a C-level substring scan skips the regex.
+        return text
+    warned = False
+
+    def _repl(m: re.Match[str]) -> str:
+        nonlocal warned
+        tag = m.group(0)
+        if _SAFE_MEMORY_TAG.match(tag):
+            return tag
+        if not warned:
+            logger.debug("Escaped structural-lookalike tag in memory injection: %s", tag)
+            warned = True
+        return tag.replace("<", "&lt;").replace(">", "&gt;")
+
+    return pattern.sub(_repl, text)
+
+
 def sanitize_memory_injection(text: str) -> str:
     """
     Escape any XML-like tags in injected memory content that are not part of
@@ -247,16 +279,17 @@ def sanitize_memory_injection(text: str) -> str:
     tags. Any other tag found (e.g. <system>, <instructions>, </memory>) is
     user-derived and could be used for prompt injection — escape it.
     """
-    found_tags = _ANY_TAG.findall(text)
-    sanitized = text
-    warned = False
-    for tag in set(found_tags):
-        if not _SAFE_MEMORY_TAG.match(tag):
-            escaped = tag.replace("<", "&lt;").replace(">", "&gt;")
-            sanitized = sanitized.replace(tag, escaped)
-            if not warned:
-                logger.debug(
-                    "Escaped structural-lookalike tag in memory injection: %s", tag
-                )
-                warned = True
-    return sanitized
+    return _escape_unsafe_tags(text, _ANY_TAG)
+
+
+def sanitize_many(texts: list[str]) -> list[str]:
+    """
+    Apply sanitize_memory_injection to several strings with one regex pass.
+
+    The strings are joined with NUL separators (tags never match across one),
+    sanitised together, and split back. Falls back to per-string calls if any
+    input already contains a NUL.
+    """
+    if any("\x00" in t for t in texts):
+        return [sanitize_memory_injection(t) for t in texts]
+    return _escape_unsafe_tags("\x00".join(texts), _ANY_TAG_NO_NUL).split("\x00")
@@ -1,7 +1,32 @@
-"""Utilities for parsing JSON from Claude's responses."""
+"""Utilities for parsing JSON from Claude's responses and (de)serialising tool turns."""
 
 from __future__ import annotations
 
+import json
+from typing import Any
+
+# orjson serialises straight to bytes in C; fall back to stdlib json if absent.
+try:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        """Serialise obj to a compact JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON. Raises json.JSONDecodeError (orjson's error subclasses it)."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover
+
+    def dumps(obj: Any) -> str:
+        """Serialise obj to a compact JSON string."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON. Raises json.JSONDecodeError on invalid input."""
+        return json.loads(data)
+
 
 def strip_code_fences(text: str) -> str:
     """
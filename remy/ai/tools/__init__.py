@@ -25,9 +25,11 @@ The package is organised into domain-specific modules:
 Re-exports:
     ToolRegistry: Main class for dispatching tool calls
     TOOL_SCHEMAS: List of Anthropic tool schemas
+    ToolSchema: Typed, immutable view of a single tool schema
+    TOOL_SPECS: Tuple of ToolSchema, one per entry in TOOL_SCHEMAS
 """
 
 from .registry import ToolRegistry
-from .schemas import TOOL_SCHEMAS
+from .schemas import TOOL_SCHEMAS, TOOL_SPECS, ToolSchema
 
-__all__ = ["ToolRegistry", "TOOL_SCHEMAS"]
+__all__ = ["ToolRegistry", "TOOL_SCHEMAS", "TOOL_SPECS", "ToolSchema"]
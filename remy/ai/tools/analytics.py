@@ -2,39 +2,62 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import timedelta, timezone, datetime as _dt
 from typing import TYPE_CHECKING
 
+from ...analytics.costs import CostAnalyzer
+
 if TYPE_CHECKING:
     from .registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+# Look-back window for "completed recently" on the goal dashboard
+_GOAL_STATUS_WINDOW = timedelta(days=30)
+
+_STATUS_EMOJI = {"queued": "⏳", "running": "🔄", "done": "✅", "failed": "❌"}
+
 
 async def exec_get_stats(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Show conversation usage statistics for a time period."""
     if registry._conversation_analyzer is None:
         return "Conversation analytics not available — ConversationAnalyzer not initialised."
     period = inp.get("period", "30d")
+    key = (user_id, "stats", period)
+    cached = registry._summary_cache.get(key)
+    if cached is not None:
+        return cached
     try:
         stats = await registry._conversation_analyzer.get_stats(user_id, period)
-        return registry._conversation_analyzer.format_stats_message(stats)
+        output = registry._conversation_analyzer.format_stats_message(stats)
     except Exception as e:
         return f"Could not compute stats: {e}"
+    registry._summary_cache.set(key, output)
+    return output
 
 
 async def exec_get_goal_status(registry: ToolRegistry, user_id: int) -> str:
     """Show a goal tracking dashboard."""
     if registry._conversation_analyzer is None:
         return "Conversation analytics not available."
-    since = _dt.now(timezone.utc) - timedelta(days=30)
+    key = (user_id, "goal_status")
+    cached = registry._summary_cache.get(key)
+    if cached is not None:
+        return cached
+    since = _dt.now(timezone.utc) - _GOAL_STATUS_WINDOW
     try:
-        active = await registry._conversation_analyzer.get_active_goals_with_age(user_id)
-        completed = await registry._conversation_analyzer.get_completed_goals_since(user_id, since)
-        return registry._conversation_analyzer.format_goal_status_message(active, completed)
+        analyzer = registry._conversation_analyzer
+        active, completed = await asyncio.gather(
+            analyzer.get_active_goals_with_age(user_id),
+            analyzer.get_completed_goals_since(user_id, since),
+        )
+        output = analyzer.format_goal_status_message(active, completed)
     except Exception as e:
         return f"Could not load goal status: {e}"
+    registry._summary_cache.set(key, output)
+    return output
 
 
 async def exec_generate_retrospective(registry: ToolRegistry, inp: dict, user_id: int) -> str:
@@ -95,15 +118,14 @@ async def exec_list_background_jobs(registry: ToolRegistry, inp: dict, user_id:
         return "Job tracking not available."
     status_filter = inp.get("status_filter", "all")
     try:
-        jobs = await registry._job_store.list_recent(user_id, limit=10)
+        jobs = await registry._job_store.list_recent(
+            user_id, limit=10, status=None if status_filter == "all" else status_filter
+        )
     except Exception as e:
         return f"Could not fetch background jobs: {e}"
-    if status_filter != "all":
-        jobs = [j for j in jobs if j["status"] == status_filter]
     if not jobs:
         suffix = f" with status '{status_filter}'" if status_filter != "all" else ""
         return f"No background jobs{suffix} found."
-    _STATUS_EMOJI = {"queued": "⏳", "running": "🔄", "done": "✅", "failed": "❌"}
     lines = []
     for job in jobs:
         emoji = _STATUS_EMOJI.get(job["status"], "❓")
@@ -127,16 +149,20 @@ async def exec_get_costs(registry: ToolRegistry, inp: dict, user_id: int) -> str
     if db is None:
         return "Cost tracking not available — database not configured."
 
-    from ...analytics.costs import CostAnalyzer
-
     period = inp.get("period", "30d")
     valid_periods = {"7d", "30d", "90d", "all"}
     if period not in valid_periods:
         period = "30d"
 
+    key = (user_id, "costs", period)
+    cached = registry._summary_cache.get(key)
+    if cached is not None:
+        return cached
     try:
         cost_analyzer = CostAnalyzer(db)
         summary = await cost_analyzer.get_cost_summary(user_id, period)
-        return cost_analyzer.format_cost_message(summary)
+        output = cost_analyzer.format_cost_message(summary)
     except Exception as e:
         return f"Could not calculate costs: {e}"
+    registry._summary_cache.set(key, output)
+    return output
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import logging
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import TYPE_CHECKING, Any
 
+from ...config import settings
+from ...models import KnowledgeItem
+
 if TYPE_CHECKING:
     from .registry import ToolRegistry
 
@@ -32,23 +37,21 @@ _DOW_NAMES = {
     "*": "every day",
 }
 
+# Grocery items may be separated by commas or semicolons
+_ITEM_SEP_RE = re.compile(r"[;,]")
 
-async def exec_schedule_reminder(
-    registry: ToolRegistry, inp: dict, user_id: int
-) -> str:
-    """Create a recurring reminder that fires daily or weekly."""
-    if registry._automation_store is None:
-        return "Automation store not available."
 
-    label = inp.get("label", "").strip()
-    frequency = inp.get("frequency", "daily")
-    time_str = inp.get("time", "09:00").strip()
-    day = inp.get("day", "mon").strip().lower()
-    mediated = inp.get("mediated", False) is True
+@lru_cache(maxsize=256)
+def _format_cron(cron: str) -> tuple[str, str]:
+    """Return (frequency, HH:MM) for a 'minute hour * * dow' reminder cron."""
+    minute, hour, _, _, dow = cron.split()
+    freq = "daily" if dow == "*" else f"every {_DOW_NAMES.get(dow, dow)}"
+    return freq, f"{int(hour):02d}:{int(minute):02d}"
 
-    if not label:
-        return "Please provide a label for the reminder."
 
+@lru_cache(maxsize=256)
+def _reminder_cron(frequency: str, time_str: str, day: str) -> tuple[str, str]:
+    """Return (cron, human description) for a daily/weekly reminder at HH:MM."""
     parts = time_str.split(":")
     if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
         hour = int(parts[0])
@@ -58,30 +61,112 @@ async def exec_schedule_reminder(
 
     if frequency == "weekly":
         dow = _DOW_MAP.get(day, "1")
-        cron = f"{minute} {hour} * * {dow}"
         day_name = _DOW_NAMES.get(dow, day.capitalize())
-        freq_desc = f"every {day_name} at {hour:02d}:{minute:02d}"
+        return (
+            f"{minute} {hour} * * {dow}",
+            f"every {day_name} at {hour:02d}:{minute:02d}",
+        )
+    return f"{minute} {hour} * * *", f"every day at {hour:02d}:{minute:02d}"
+
+
+def _input_list(inp: dict, many_key: str, one_key: str, default: str = "") -> list[str]:
+    """Up to 10 non-empty strings from inp[many_key], else [inp[one_key]]."""
+    values = [str(v).strip() for v in inp.get(many_key) or []]
+    values = [v for v in values if v][:10]
+    return values or [(inp.get(one_key) or default).strip()]
+
+
+async def _save_reminders(
+    registry: ToolRegistry,
+    user_id: int,
+    label: str,
+    schedules: list[tuple[str, str | None]],
+    mediated: bool = False,
+) -> list[int]:
+    """Persist (cron, fire_at) reminders sharing a label and register them."""
+    store = registry._automation_store
+    if len(schedules) == 1:
+        cron, fire_at = schedules[0]
+        if fire_at is None:
+            ids = [await store.add(user_id, label, cron, mediated=mediated)]
+        else:
+            ids = [await store.add(user_id, label, cron=cron, fire_at=fire_at)]
     else:
-        cron = f"{minute} {hour} * * *"
-        freq_desc = f"every day at {hour:02d}:{minute:02d}"
+        ids = await store.add_many(
+            user_id, [(label, cron, fire_at, mediated) for cron, fire_at in schedules]
+        )
+
+    sched = registry._scheduler_ref.get("proactive_scheduler")
+    if sched is not None:
+        for automation_id, (cron, fire_at) in zip(ids, schedules):
+            if fire_at is None:
+                sched.add_automation(
+                    automation_id, user_id, label, cron, mediated=mediated
+                )
+            else:
+                sched.add_automation(
+                    automation_id, user_id, label, cron=cron, fire_at=fire_at
+                )
+    return ids
+
+
+async def exec_schedule_reminder(
+    registry: ToolRegistry, inp: dict, user_id: int
+) -> str:
+    """Create one or more recurring reminders that fire daily or weekly."""
+    if registry._automation_store is None:
+        return "Automation store not available."
+
+    label = inp.get("label", "").strip()
+    frequency = inp.get("frequency", "daily")
+    day = inp.get("day", "mon").strip().lower()
+    mediated = inp.get("mediated", False) is True
+
+    if not label:
+        return "Please provide a label for the reminder."
+
+    crons = [
+        _reminder_cron(frequency, t, day)
+        for t in _input_list(inp, "times", "time", "09:00")
+    ]
 
     try:
-        automation_id = await registry._automation_store.add(
-            user_id, label, cron, mediated=mediated
+        ids = await _save_reminders(
+            registry, user_id, label, [(c, None) for c, _ in crons], mediated
         )
     except Exception as e:
         return f"Failed to save reminder: {e}"
 
-    sched = registry._scheduler_ref.get("proactive_scheduler")
-    if sched is not None:
-        sched.add_automation(automation_id, user_id, label, cron, mediated=mediated)
-
     delivery = (
         "mediated (Remy composes at fire time)" if mediated else "direct (static text)"
     )
+    if len(ids) == 1:
+        return (
+            f"✅ Reminder set (ID {ids[0]}): '{label}'\n"
+            f"Fires {crons[0][1]}. Delivery: {delivery}."
+        )
     return (
-        f"✅ Reminder set (ID {automation_id}): '{label}'\n"
-        f"Fires {freq_desc}. Delivery: {delivery}."
+        f"✅ {len(ids)} reminders set: '{label}'\n"
+        + "\n".join(f"• ID {i} — fires {desc}" for i, (_, desc) in zip(ids, crons))
+        + f"\nDelivery: {delivery}."
+    )
+
+
+def _format_reminder(row: dict) -> str:
+    """One list_reminders line for an automations row."""
+    delivery = "mediated" if row.get("mediated", 0) else "direct"
+    if row.get("fire_at"):
+        try:
+            fire_dt = datetime.fromisoformat(row["fire_at"])
+            display = fire_dt.strftime("%a %d %b %Y at %H:%M")
+        except (ValueError, TypeError):
+            display = row["fire_at"]
+        return f"[ID {row['id']}] '{row['label']}' — once at {display} ({delivery})"
+    freq, time_fmt = _format_cron(row["cron"])
+    last = row["last_run_at"] or "never"
+    return (
+        f"[ID {row['id']}] '{row['label']}' — {freq} at {time_fmt} "
+        f"| last run: {last} ({delivery})"
     )
 
 
@@ -94,30 +179,9 @@ async def exec_list_reminders(registry: ToolRegistry, user_id: int) -> str:
     if not rows:
         return "No reminders scheduled. Use schedule_reminder to create one."
 
-    lines = [f"Scheduled reminders ({len(rows)}):"]
-    for row in rows:
-        last = row["last_run_at"] or "never"
-        mediated = bool(row.get("mediated", 0))
-        delivery = "mediated" if mediated else "direct"
-        if row.get("fire_at"):
-            try:
-                fire_dt = datetime.fromisoformat(row["fire_at"])
-                display = fire_dt.strftime("%a %d %b %Y at %H:%M")
-            except (ValueError, TypeError):
-                display = row["fire_at"]
-            lines.append(
-                f"[ID {row['id']}] '{row['label']}' — once at {display} ({delivery})"
-            )
-        else:
-            cron_parts = row["cron"].split()
-            minute, hour, _, _, dow = cron_parts
-            time_fmt = f"{int(hour):02d}:{int(minute):02d}"
-            freq = "daily" if dow == "*" else f"every {_DOW_NAMES.get(dow, dow)}"
-            lines.append(
-                f"[ID {row['id']}] '{row['label']}' — {freq} at {time_fmt} | last run: {last} ({delivery})"
-            )
-
-    return "\n".join(lines)
+    return f"Scheduled reminders ({len(rows)}):\n" + "\n".join(
+        map(_format_reminder, rows)
+    )
 
 
 async def exec_remove_reminder(registry: ToolRegistry, inp: dict, user_id: int) -> str:
@@ -143,61 +207,74 @@ async def exec_remove_reminder(registry: ToolRegistry, inp: dict, user_id: int)
 async def exec_set_one_time_reminder(
     registry: ToolRegistry, inp: dict, user_id: int
 ) -> str:
-    """Set a one-time reminder that fires at a specific date and time."""
+    """Set one or more one-time reminders that fire at specific dates and times."""
     if registry._automation_store is None:
         return "Automation store not available."
 
     label = inp.get("label", "").strip()
-    fire_at_str = inp.get("fire_at", "").strip()
+    fire_ats = _input_list(inp, "fire_ats", "fire_at")
 
     if not label:
         return "Please provide a label for the reminder."
-    if not fire_at_str:
+    if not fire_ats[0]:
         return "Please provide a fire_at datetime."
 
-    try:
-        fire_dt = datetime.fromisoformat(fire_at_str)
-    except ValueError:
-        return (
-            f"Invalid fire_at format: {fire_at_str!r}. "
-            "Use ISO 8601, e.g. '2026-02-27T15:30:00'."
-        )
+    # Naive fire_at values are local times: the scheduler runs one-time jobs in
+    # scheduler_timezone, so the past-time check must use the same zone. zoneinfo
+    # follows that zone's DST changes, unlike a fixed offset.
+    local_tz = ZoneInfo(settings.scheduler_timezone)
+    fire_dts = []
+    now = datetime.now(timezone.utc)
+    for fire_at_str in fire_ats:
+        try:
+            fire_dt = datetime.fromisoformat(fire_at_str)
+        except ValueError:
+            return (
+                f"Invalid fire_at format: {fire_at_str!r}. "
+                "Use ISO 8601, e.g. '2026-02-27T15:30:00'."
+            )
 
-    # Treat naive datetimes as local (AEST/AEDT). Using zoneinfo handles
-    # DST correctly — ZoneInfo("Australia/Canberra") is UTC+10 in winter
-    # and UTC+11 in summer, unlike a hardcoded offset.
-    _local_tz = ZoneInfo("Australia/Canberra")
-    if fire_dt.tzinfo is None:
-        fire_dt_aware = fire_dt.replace(tzinfo=_local_tz)
-    else:
-        fire_dt_aware = fire_dt.astimezone(timezone.utc)
+        # Treat naive datetimes as scheduler-local; aware ones compare directly.
+        if fire_dt.tzinfo is None:
+            fire_dt_aware = fire_dt.replace(tzinfo=local_tz)
+        else:
+            fire_dt_aware = fire_dt
 
-    if fire_dt_aware <= datetime.now(timezone.utc):
-        return "That time is already in the past. Please provide a future datetime."
+        if fire_dt_aware <= now:
+            return "That time is already in the past. Please provide a future datetime."
+        fire_dts.append(fire_dt)
 
     try:
-        automation_id = await registry._automation_store.add(
-            user_id, label, cron="", fire_at=fire_at_str
+        ids = await _save_reminders(
+            registry, user_id, label, [("", f) for f in fire_ats]
         )
     except Exception as e:
         return f"Failed to save reminder: {e}"
 
-    sched = registry._scheduler_ref.get("proactive_scheduler")
-    if sched is not None:
-        sched.add_automation(
-            automation_id, user_id, label, cron="", fire_at=fire_at_str
+    display_times = []
+    for fire_dt, fire_at_str in zip(fire_dts, fire_ats):
+        try:
+            display_times.append(fire_dt.strftime("%a %d %b at %H:%M"))
+        except Exception as e:
+            logger.debug("Failed to format display time: %s", e)
+            display_times.append(fire_at_str)
+
+    if len(ids) == 1:
+        return (
+            f"✅ One-time reminder set (ID {ids[0]}): '{label}'\n"
+            f"Fires {display_times[0]}."
         )
+    return f"✅ {len(ids)} one-time reminders set: '{label}'\n" + "\n".join(
+        f"• ID {i} — fires {t}" for i, t in zip(ids, display_times)
+    )
 
-    try:
-        display_time = fire_dt.strftime("%a %d %b at %H:%M")
-    except Exception as e:
-        logger.debug("Failed to format display time: %s", e)
-        display_time = fire_at_str
 
-    return (
-        f"✅ One-time reminder set (ID {automation_id}): '{label}'\n"
-        f"Fires {display_time}."
-    )
+_BREAKDOWN_SYSTEM = (
+    "You are an ADHD-friendly task coach. When given a task, break it down into "
+    "exactly 5 clear, concrete, actionable steps. Each step should be completable "
+    "in under 30 minutes. Number them 1–5. Be specific and encouraging. "
+    "After the steps, add one brief motivational sentence."
+)
 
 
 async def exec_breakdown_task(registry: ToolRegistry, inp: dict) -> str:
@@ -209,16 +286,10 @@ async def exec_breakdown_task(registry: ToolRegistry, inp: dict) -> str:
     if registry._claude_client is None:
         return "Claude client not available for task breakdown."
 
-    system = (
-        "You are an ADHD-friendly task coach. When given a task, break it down into "
-        "exactly 5 clear, concrete, actionable steps. Each step should be completable "
-        "in under 30 minutes. Number them 1–5. Be specific and encouraging. "
-        "After the steps, add one brief motivational sentence."
-    )
     try:
         response = await registry._claude_client.complete(
             messages=[{"role": "user", "content": f"Break down this task: {task}"}],
-            system=system,
+            system=_BREAKDOWN_SYSTEM,
             max_tokens=600,
         )
     except Exception as e:
@@ -237,18 +308,19 @@ async def grocery_list_impl(
     Single implementation for grocery/shopping list (KnowledgeStore).
 
     Used by both the grocery_list tool and the /grocery-list command.
-    store must have get_by_type(user_id, entity_type, limit), upsert(user_id, items), delete(user_id, item_id).
+    store must have get_by_type_projected(user_id, entity_type, limit),
+    upsert(user_id, items), delete(user_id, item_id),
+    delete_containing(user_id, entity_type, needle) and
+    delete_by_type(user_id, entity_type).
     """
-    from ...models import KnowledgeItem
-
     action = (action or "show").strip().lower()
     items_raw = (items_raw or "").strip()
 
     if action == "show":
-        items = await store.get_by_type(user_id, "shopping_item", limit=100)
-        if not items:
+        rows = await store.get_by_type_projected(user_id, "shopping_item", limit=100)
+        if not rows:
             return "Shopping list is empty."
-        lines = [f"• [ID:{i.id}] {i.content}" for i in items]
+        lines = [f"• [ID:{item_id}] {content}" for item_id, content in rows]
         return (
             "Shopping list:\n"
             + "\n".join(lines)
@@ -258,9 +330,7 @@ async def grocery_list_impl(
     if action == "add":
         if not items_raw:
             return "Please specify what to add."
-        new_items = [
-            s.strip() for s in items_raw.replace(";", ",").split(",") if s.strip()
-        ]
+        new_items = [s for s in (t.strip() for t in _ITEM_SEP_RE.split(items_raw)) if s]
         ki_list = [
             KnowledgeItem(entity_type="shopping_item", content=it) for it in new_items
         ]
@@ -277,18 +347,13 @@ async def grocery_list_impl(
                 if removed
                 else f"Item {items_raw} not found."
             )
-        all_items = await store.get_by_type(user_id, "shopping_item", limit=100)
-        removed_count = 0
-        for item in all_items:
-            if items_raw.lower() in item.content.lower():
-                await store.delete(user_id, item.id)
-                removed_count += 1
+        removed_count = await store.delete_containing(
+            user_id, "shopping_item", items_raw
+        )
         return f"✅ Removed {removed_count} item(s) matching '{items_raw}'."
 
     if action == "clear":
-        all_items = await store.get_by_type(user_id, "shopping_item", limit=500)
-        for item in all_items:
-            await store.delete(user_id, item.id)
+        await store.delete_by_type(user_id, "shopping_item")
         return "✅ Shopping list cleared."
 
     return f"Unknown action: {action}"
@@ -59,40 +59,33 @@ async def exec_list_bookmarks(registry: ToolRegistry, inp: dict, user_id: int) -
     tag_filter = (inp.get("tag") or inp.get("filter", "")).strip().lower()
     if tag_filter not in BOOKMARK_TAGS:
         tag_filter = ""
+    else:
+        filt = ""
 
     if registry._knowledge_store is not None:
-        items = await registry._knowledge_store.get_by_type(user_id, "fact", limit=50)
-        bookmarks = [
-            {"content": i.content, "tag": i.metadata.get("tag")}
-            for i in items
-            if i.metadata.get("category") == "bookmark"
-        ]
-        if tag_filter:
-            bookmarks = [b for b in bookmarks if b.get("tag") == tag_filter]
-    elif registry._fact_store is not None:
-        bookmarks = await registry._fact_store.get_by_category(user_id, "bookmark")
-        bookmarks = [{"content": b.get("content", "")} for b in bookmarks]
+        total, contents = await registry._knowledge_store.get_facts_matching(
+            user_id, "bookmark", tag=tag_filter or None, contains=filt, limit=20
+        )
     else:
-        bookmarks = []
-
-    if not bookmarks:
+        facts = await registry._fact_store.get_by_category(user_id, "bookmark")
+        contents = [f.get("content", "") for f in facts]
+        if filt:
+            contents = [c for c in contents if filt in c.lower()]
+        total = len(contents)
+
+    if not contents:
+        if filt:
+            return f"🔖 No bookmarks matching '{filt}'."
         return "🔖 No bookmarks saved yet. Use save_bookmark to add one."
 
-    if filt and not tag_filter:
-        bookmarks = [b for b in bookmarks if filt in b.get("content", "").lower()]
-
-    if not bookmarks:
-        return f"🔖 No bookmarks matching '{filt}'."
-
     suffix = ""
     if tag_filter:
         suffix = f" (tag: {tag_filter})"
     elif filt:
         suffix = " (filtered)"
-    lines = [f"🔖 Bookmarks{suffix} — {len(bookmarks)} item(s):\n"]
-    for i, b in enumerate(bookmarks[:20], 1):
-        lines.append(f"{i}. {b.get('content', '')}")
-    if len(bookmarks) > 20:
-        lines.append(f"…and {len(bookmarks) - 20} more")
+    lines = [f"🔖 Bookmarks{suffix} — {total} item(s):\n"]
+    lines.extend(f"{i}. {c}" for i, c in enumerate(contents[:20], 1))
+    if total > 20:
+        lines.append(f"…and {total - 20} more")
 
     return "\n".join(lines)
@@ -19,9 +19,14 @@ async def exec_calendar_events(registry: ToolRegistry, inp: dict) -> str:
             "Run scripts/setup_google_auth.py to set it up."
         )
     days = min(int(inp.get("days", 7)), 30)
+    key = ("calendar_events", days)
+    cached = registry._calendar_cache.get(key)
+    if cached is not None:
+        return cached
     err: Exception | None = None
     try:
-        events = await registry._calendar.list_events(days=days)
+        async with registry._sem_calendar:
+            events = await registry._calendar.list_events(days=days)
     except Exception as e:
         err = e
     if err is not None:
@@ -29,12 +34,14 @@ async def exec_calendar_events(registry: ToolRegistry, inp: dict) -> str:
 
     if not events:
         period = "today" if days == 1 else f"the next {days} days"
-        return f"No events scheduled for {period}."
-
-    lines = [f"Calendar events (next {days} day{'s' if days != 1 else ''}):"]
-    for ev in events:
-        lines.append(registry._calendar.format_event(ev))
-    return "\n".join(lines)
+        output = f"No events scheduled for {period}."
+    else:
+        lines = [f"Calendar events (next {days} day{'s' if days != 1 else ''}):"]
+        for ev in events:
+            lines.append(registry._calendar.format_event(ev))
+        output = "\n".join(lines)
+    registry._calendar_cache.set(key, output)
+    return output
 
 
 async def exec_create_calendar_event(registry: ToolRegistry, inp: dict) -> str:
@@ -55,15 +62,17 @@ async def exec_create_calendar_event(registry: ToolRegistry, inp: dict) -> str:
 
     err: Exception | None = None
     try:
-        event = await registry._calendar.create_event(
-            title, date, time, duration, description
-        )
+        async with registry._sem_calendar:
+            event = await registry._calendar.create_event(
+                title, date, time, duration, description
+            )
     except ValueError as e:
         err = e
         return f"Invalid date/time: {err}"
     except Exception as e:
         err = e
         return f"Failed to create calendar event: {err}"
+    registry._calendar_cache.clear()
 
     link = event.get("htmlLink", "")
     return (
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from ...google.contacts import _extract_name, format_contact
+
 if TYPE_CHECKING:
     from .registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
 
+def _contact_summary(person: dict) -> str:
+    """'• name | 📧 first email | 📞 first phone' for a search result."""
+    parts = [_extract_name(person) or "(no name)"]
+    emails = person.get("emailAddresses")
+    if emails:
+        parts.append(f"📧 {emails[0]['value']}")
+    phones = person.get("phoneNumbers")
+    if phones:
+        parts.append(f"📞 {phones[0]['value']}")
+    return "• " + " | ".join(parts)
+
+
 async def exec_search_contacts(registry: ToolRegistry, inp: dict) -> str:
     """Search Google Contacts for a person by name or email."""
     if registry._contacts is None:
@@ -21,28 +36,20 @@ async def exec_search_contacts(registry: ToolRegistry, inp: dict) -> str:
     query = inp.get("query", "").strip()
     if not query:
         return "Please provide a name or email to search for."
-
-    try:
-        results = await registry._contacts.search_contacts(query, max_results=5)
-    except Exception as e:
-        return f"Could not search contacts: {e}"
-
-    if not results:
+    # Only the result lines are cached; the header echoes this caller's query.
+    key = ("search_contacts", query.casefold())
+    body = registry._contacts_cache.get(key)
+    if body is None:
+        try:
+            results = await registry._contacts.search_contacts(query, max_results=5)
+        except Exception as e:
+            return f"Could not search contacts: {e}"
+        body = "\n".join(map(_contact_summary, results))
+        registry._contacts_cache.set(key, body)
+
+    if not body:
         return f"No contacts found matching '{query}'."
-
-    from ...google.contacts import _extract_name
-    lines = [f"Contacts matching '{query}':"]
-    for person in results:
-        name = _extract_name(person) or "(no name)"
-        emails = [e["value"] for e in person.get("emailAddresses", [])]
-        phones = [p["value"] for p in person.get("phoneNumbers", [])]
-        parts = [name]
-        if emails:
-            parts.append(f"📧 {emails[0]}")
-        if phones:
-            parts.append(f"📞 {phones[0]}")
-        lines.append("• " + " | ".join(parts))
-    return "\n".join(lines)
+    return f"Contacts matching '{query}':\n{body}"
 
 
 async def exec_upcoming_birthdays(registry: ToolRegistry, inp: dict) -> str:
@@ -53,57 +60,66 @@ async def exec_upcoming_birthdays(registry: ToolRegistry, inp: dict) -> str:
             "Run scripts/setup_google_auth.py to set it up."
         )
     days = min(int(inp.get("days", 14)), 90)
+    key = ("upcoming_birthdays", days)
+    cached = registry._contacts_cache.get(key)
+    if cached is not None:
+        return cached
     try:
         upcoming = await registry._contacts.get_upcoming_birthdays(days=days)
     except Exception as e:
         return f"Could not fetch birthdays: {e}"
 
     if not upcoming:
-        return f"No birthdays in the next {days} days."
-
-    from ...google.contacts import _extract_name
-    lines = [f"Upcoming birthdays (next {days} days):"]
-    for bday_date, person in upcoming[:10]:
-        name = _extract_name(person) or "Someone"
-        lines.append(f"• 🎂 {name} — {bday_date.strftime('%d %b')}")
-    return "\n".join(lines)
-
-
-async def exec_get_contact_details(registry: ToolRegistry, inp: dict) -> str:
-    """Get full details for a contact."""
-    if registry._contacts is None:
-        return "Google Contacts not configured."
-
-    name = inp.get("name", "").strip()
-    if not name:
-        return "Please provide a contact name."
+        output = f"No birthdays in the next {days} days."
+    else:
+        output = f"Upcoming birthdays (next {days} days):\n" + "\n".join(
+            f"• 🎂 {_extract_name(person) or 'Someone'} — {bday_date.strftime('%d %b')}"
+            for bday_date, person in upcoming[:10]
+        )
+    registry._contacts_cache.set(key, output)
+    return output
 
-    try:
-        people = await registry._contacts.search_contacts(name, max_results=5)
-    except Exception as e:
-        return f"Search failed: {e}"
 
+def _format_contact_details(name: str, people: list[dict] | BaseException) -> str:
+    """Render one get_contact_details result (or its search error)."""
+    if isinstance(people, BaseException):
+        return f"Search failed: {people}"
     if not people:
         return f"No contact found matching '{name}'."
 
-    from ...google.contacts import format_contact, _extract_name
-
-    top = people[0]
-    resource_name = top.get("resourceName", "")
-    try:
-        if resource_name:
-            top = await registry._contacts.get_contact(resource_name)
-    except Exception as e:
-        logger.debug("Failed to fetch full contact details: %s", e)
-
-    lines = ["👤 Contact details:\n", format_contact(top, verbose=True)]
+    lines = ["👤 Contact details:\n", format_contact(people[0], verbose=True)]
     if len(people) > 1:
         others = [_extract_name(p) or "?" for p in people[1:]]
         lines.append(f"\n_Also matched: {', '.join(others)}_")
-
     return "\n".join(lines)
 
 
+async def exec_get_contact_details(registry: ToolRegistry, inp: dict) -> str:
+    """Get full details for one or more contacts."""
+    if registry._contacts is None:
+        return "Google Contacts not configured."
+
+    names = [str(n).strip() for n in inp.get("names") or []]
+    names = [n for n in names if n][:10]
+    if not names:
+        name = inp.get("name", "").strip()
+        if not name:
+            return "Please provide a contact name."
+        names = [name]
+
+    # One full-field search per name, all in flight at once.
+    results = await asyncio.gather(
+        *(
+            registry._contacts.search_contacts(n, max_results=5, full_details=True)
+            for n in names
+        ),
+        return_exceptions=True,
+    )
+    return "\n\n---\n\n".join(
+        _format_contact_details(n, people) for n, people in zip(names, results)
+    )
+
+
 async def exec_update_contact_note(registry: ToolRegistry, inp: dict) -> str:
     """Add or update a note on a contact in Google Contacts."""
     if registry._contacts is None:
@@ -125,17 +141,16 @@ async def exec_update_contact_note(registry: ToolRegistry, inp: dict) -> str:
     if not people:
         return f"No contact matching '{name}'."
 
-    from ...google.contacts import _extract_name
-
     person = people[0]
     resource_name = person.get("resourceName", "")
     contact_name = _extract_name(person) or name
 
     try:
         await registry._contacts.update_note(resource_name, note)
-        return f"✅ Note updated for {contact_name}:\n_{note}_"
     except Exception as e:
         return f"Could not update note: {e}"
+    registry._contacts_cache.clear()
+    return f"✅ Note updated for {contact_name}:\n_{note}_"
 
 
 async def exec_find_sparse_contacts(registry: ToolRegistry) -> str:
@@ -151,12 +166,8 @@ async def exec_find_sparse_contacts(registry: ToolRegistry) -> str:
     if not sparse:
         return "✅ All contacts have at least an email or phone number."
 
-    from ...google.contacts import _extract_name
-
     lines = [f"🗑 {len(sparse)} contact(s) with no email or phone:\n"]
-    for p in sparse[:30]:
-        name = _extract_name(p) or "(no name)"
-        lines.append(f"• {name}")
+    lines.extend(f"• {_extract_name(p) or '(no name)'}" for p in sparse[:30])
     if len(sparse) > 30:
         lines.append(f"…and {len(sparse) - 30} more")
     lines.append("\nUse get_contact_details to review, or delete in Google Contacts.")
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_READ_GDOC_MAX_CHARS = 8000
+
 
 async def exec_read_gdoc(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Read a Google Doc by ID or URL."""
@@ -21,17 +23,29 @@ async def exec_read_gdoc(registry: ToolRegistry, inp: dict, user_id: int) -> str
     raw = inp.get("doc_id_or_url", "").strip()
     if not raw:
         return "No document ID or URL provided."
+    cached = registry._gdoc_cache.get(raw)
+    if cached is not None:
+        return cached
 
     try:
-        title, content = await registry._docs.read_document(raw)
+        # One extra character tells us whether the document was cut off.
+        title, content = await registry._docs.read_document(
+            raw, max_chars=_READ_GDOC_MAX_CHARS + 1
+        )
     except Exception as e:
         return f"Could not read document: {e}"
 
     if not content:
-        return f"Document '{title}' is empty."
-    if len(content) > 8000:
-        content = content[:8000] + "\n\n[… truncated — document is longer]"
-    return f"Google Doc: {title}\n\n{content}"
+        output = f"Document '{title}' is empty."
+    else:
+        if len(content) > _READ_GDOC_MAX_CHARS:
+            content = (
+                content[:_READ_GDOC_MAX_CHARS]
+                + "\n\n[… truncated — document is longer]"
+            )
+        output = f"Google Doc: {title}\n\n{content}"
+    registry._gdoc_cache.set(raw, output)
+    return output
 
 
 async def exec_append_to_gdoc(registry: ToolRegistry, inp: dict, user_id: int) -> str:
@@ -49,6 +63,8 @@ async def exec_append_to_gdoc(registry: ToolRegistry, inp: dict, user_id: int) -
 
     try:
         await registry._docs.append_text(doc_id_or_url, text)
-        return "✅ Text appended to document."
     except Exception as e:
         return f"Could not append to doc: {e}"
+    # The same document may be cached under its ID and its URL.
+    registry._gdoc_cache.clear()
+    return "✅ Text appended to document."
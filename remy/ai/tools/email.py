@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from operator import itemgetter
 from typing import TYPE_CHECKING, cast
 
-from ...ai.input_validator import sanitize_memory_injection
+from ...ai.input_validator import sanitize_many
 from ...google.gmail import PRIMARY_TABS_LABEL_IDS
 
 if TYPE_CHECKING:
@@ -14,6 +16,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_LABEL_ID_TTL_SECONDS = 300.0
+
+_EMAIL_TMPL = (
+    "Email [{mid}]\n"
+    "From:    {sender}\n"
+    "To:      {to}\n"
+    "Date:    {date}\n"
+    "Subject: {subj}\n"
+    "Labels:  {labels}\n\n"
+    "[Body]\n{body}"
+)
+
 
 async def exec_triage_inbox(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Start background email triage job (US-email-triage-subagent)."""
@@ -80,6 +94,32 @@ def _scope_to_label_ids_and_description(
     return None, "Inbox"
 
 
+async def _resolve_label_ids_cached(
+    registry: ToolRegistry, names: list[str]
+) -> list[str | None]:
+    """Resolve label names to IDs, memoising results on the registry for a short TTL.
+
+    Misses are resolved in a single GmailClient.resolve_label_ids call.
+    Raises ValueError (from the client) if a custom label does not exist.
+    """
+    cache = registry._label_id_cache
+    now = time.monotonic()
+    misses: list[str] = []
+    for name in names:
+        hit = cache.get(name.lower())
+        if hit is None or hit[1] <= now:
+            misses.append(name)
+
+    if misses:
+        async with registry._sem_gmail:
+            resolved = await registry._gmail.resolve_label_ids(misses)
+        expires = now + _LABEL_ID_TTL_SECONDS
+        for name, lid in zip(misses, resolved):
+            cache[name.lower()] = (lid, expires)
+
+    return [cache[name.lower()][0] for name in names]
+
+
 async def exec_read_emails(registry: ToolRegistry, inp: dict) -> str:
     """Fetch unread emails from Gmail, optionally beyond Inbox."""
     if registry._gmail is None:
@@ -92,23 +132,37 @@ async def exec_read_emails(registry: ToolRegistry, inp: dict) -> str:
 
     try:
         if summary_only:
-            data = await registry._gmail.get_unread_summary(label_ids=label_ids)
+            async with registry._sem_gmail:
+                data = await registry._gmail.get_unread_summary(label_ids=label_ids)
             count = data.get("count", 0)
             senders = data.get("senders", [])
             if not count:
                 return f"No unread emails in {scope_desc}."
             sender_str = ", ".join(senders[:5]) if senders else "various"
             return f"Unread in {scope_desc}: {count}\nTop senders: {sender_str}"
-        emails = await registry._gmail.get_unread(limit=limit, label_ids=label_ids)
+        async with registry._sem_gmail:
+            emails = await registry._gmail.get_unread(limit=limit, label_ids=label_ids)
         if not emails:
             return f"No unread emails in {scope_desc}."
-        lines = [f"Unread in {scope_desc} ({len(emails)} shown):"]
-        for m in emails:
-            subj = sanitize_memory_injection(m.get("subject", "(no subject)"))
-            sender = sanitize_memory_injection(m.get("from_addr", "unknown"))
-            snippet = sanitize_memory_injection((m.get("snippet") or "")[:150])
-            lines.append(f"• From: {sender}\n  Subject: {subj}\n  {snippet}")
-        return "\n\n".join(lines)
+        # One sanitiser pass over every field, then regroup three per email.
+        fields = iter(
+            sanitize_many(
+                [
+                    field
+                    for m in emails
+                    for field in (
+                        m.get("subject", "(no subject)"),
+                        m.get("from_addr", "unknown"),
+                        (m.get("snippet") or "")[:150],
+                    )
+                ]
+            )
+        )
+        body = "\n\n".join(
+            f"• From: {sender}\n  Subject: {subj}\n  {snippet}"
+            for subj, sender, snippet in zip(fields, fields, fields)
+        )
+        return f"Unread in {scope_desc} ({len(emails)} shown):\n\n{body}"
     except Exception as e:
         return f"Could not fetch emails: {e}"
 
@@ -126,62 +180,93 @@ async def exec_search_gmail(registry: ToolRegistry, inp: dict) -> str:
     label_ids = None
     if label_names:
         try:
-            label_ids = await registry._gmail.resolve_label_ids(label_names)
+            label_ids = await _resolve_label_ids_cached(registry, label_names)
         except ValueError as e:
             return str(e)
     try:
-        emails = await registry._gmail.search(
-            query,
-            max_results=max_results,
-            include_body=include_body,
-            label_ids=label_ids,
-        )
+        async with registry._sem_gmail:
+            emails = await registry._gmail.search(
+                query,
+                max_results=max_results,
+                include_body=include_body,
+                label_ids=label_ids,
+            )
         scope = f" in {', '.join(label_names)}" if label_names else ""
         if not emails:
             return f"No emails found for query: {query}{scope}"
-        lines = [f"Search results for '{query}'{scope} ({len(emails)} found):"]
-        for m in emails:
-            subj = sanitize_memory_injection(m.get("subject", "(no subject)"))
-            sender = sanitize_memory_injection(m.get("from_addr", "unknown"))
-            date = m.get("date", "")
-            mid = m.get("id", "")
-            snippet = sanitize_memory_injection((m.get("snippet") or "")[:150])
-            entry = (
-                f"• [{mid}] {date}\n  From: {sender}\n  Subject: {subj}\n  {snippet}"
+        fields = iter(
+            sanitize_many(
+                [
+                    field
+                    for m in emails
+                    for field in (
+                        m.get("subject", "(no subject)"),
+                        m.get("from_addr", "unknown"),
+                        (m.get("snippet") or "")[:150],
+                        (m.get("body") or "") if include_body else "",
+                    )
+                ]
             )
-            if include_body and m.get("body"):
-                body = sanitize_memory_injection(m["body"])
-                entry += f"\n\n  [Body]\n{body}"
-            lines.append(entry)
-        return "\n\n".join(lines)
+        )
+        results = "\n\n".join(
+            f"• [{m.get('id', '')}] {m.get('date', '')}\n"
+            f"  From: {sender}\n  Subject: {subj}\n  {snippet}"
+            + (f"\n\n  [Body]\n{body}" if body else "")
+            for m, subj, sender, snippet, body in zip(
+                emails, fields, fields, fields, fields
+            )
+        )
+        return (
+            f"Search results for '{query}'{scope} ({len(emails)} found):\n\n{results}"
+        )
     except Exception as e:
         return f"Gmail search failed: {e}"
 
 
+def _format_full_email(m: dict) -> str:
+    subj, sender, to, body = sanitize_many(
+        [
+            m.get("subject", "(no subject)"),
+            m.get("from_addr", "unknown"),
+            m.get("to", ""),
+            m.get("body", m.get("snippet", "")),
+        ]
+    )
+    return _EMAIL_TMPL.format(
+        mid=m.get("id", ""),
+        sender=sender,
+        to=to,
+        date=m.get("date", ""),
+        subj=subj,
+        labels=", ".join(m.get("labels", [])),
+        body=body,
+    )
+
+
 async def exec_read_email(registry: ToolRegistry, inp: dict) -> str:
-    """Read a single email in full, including its body."""
+    """Read one or more emails in full, including their bodies."""
     if registry._gmail is None:
         return "Gmail not configured. Run scripts/setup_google_auth.py to set it up."
-    message_id = str(inp.get("message_id", "")).strip()
+    message_ids = [str(mid).strip() for mid in inp.get("message_ids") or []]
+    message_ids = [mid for mid in message_ids if mid][:20]
+    if len(message_ids) > 1:
+        try:
+            async with registry._sem_gmail:
+                emails = await registry._gmail.get_messages_batch(
+                    message_ids, include_body=True
+                )
+            return "\n\n---\n\n".join(_format_full_email(m) for m in emails)
+        except Exception as e:
+            return f"Could not read emails {', '.join(message_ids)}: {e}"
+
+    message_id = message_ids[0] if message_ids else ""
+    message_id = message_id or str(inp.get("message_id", "")).strip()
     if not message_id:
         return "Please provide a message_id."
     try:
-        m = await registry._gmail.get_message(message_id, include_body=True)
-        subj = sanitize_memory_injection(m.get("subject", "(no subject)"))
-        sender = sanitize_memory_injection(m.get("from_addr", "unknown"))
-        to = sanitize_memory_injection(m.get("to", ""))
-        date = m.get("date", "")
-        labels = ", ".join(m.get("labels", []))
-        body = sanitize_memory_injection(m.get("body", m.get("snippet", "")))
-        return (
-            f"Email [{message_id}]\n"
-            f"From:    {sender}\n"
-            f"To:      {to}\n"
-            f"Date:    {date}\n"
-            f"Subject: {subj}\n"
-            f"Labels:  {labels}\n\n"
-            f"[Body]\n{body}"
-        )
+        async with registry._sem_gmail:
+            m = await registry._gmail.get_message(message_id, include_body=True)
+        return _format_full_email({**m, "id": message_id})
     except Exception as e:
         return f"Could not read email {message_id}: {e}"
 
@@ -191,18 +276,22 @@ async def exec_list_gmail_labels(registry: ToolRegistry, inp: dict) -> str:
     if registry._gmail is None:
         return "Gmail not configured. Run scripts/setup_google_auth.py to set it up."
     try:
-        labels = await registry._gmail.list_labels()
-        system = [lb for lb in labels if lb["type"] == "system"]
-        user = [lb for lb in labels if lb["type"] != "system"]
+        async with registry._sem_gmail:
+            labels = await registry._gmail.list_labels()
+        system: list[dict] = []
+        user: list[dict] = []
+        for lb in labels:
+            (system if lb["type"] == "system" else user).append(lb)
+        by_name = itemgetter("name")
         lines = ["Gmail labels:"]
         if system:
+            system.sort(key=by_name)
             lines.append("\nSystem labels:")
-            for lb in sorted(system, key=lambda x: x["name"]):
-                lines.append(f"  {lb['id']:20s}  {lb['name']}")
+            lines.extend(f"  {lb['id']:20s}  {lb['name']}" for lb in system)
         if user:
+            user.sort(key=by_name)
             lines.append("\nUser labels:")
-            for lb in sorted(user, key=lambda x: x["name"]):
-                lines.append(f"  {lb['id']:20s}  {lb['name']}")
+            lines.extend(f"  {lb['id']:20s}  {lb['name']}" for lb in user)
         return "\n".join(lines)
     except Exception as e:
         return f"Could not list labels: {e}"
@@ -221,7 +310,7 @@ async def exec_label_emails(registry: ToolRegistry, inp: dict) -> str:
         return "Please provide add_labels or remove_labels (or both)."
 
     # Approval gate: bulk delete >5, bulk label >10 (US-approval-gates)
-    from ..bot.handlers.callbacks import (
+    from ...bot.handlers.callbacks import (
         _gmail_delete_threshold,
         _gmail_label_threshold,
         store_bulk_email_approval,
@@ -248,11 +337,12 @@ async def exec_label_emails(registry: ToolRegistry, inp: dict) -> str:
         )
 
     try:
-        count = await registry._gmail.modify_labels(
-            message_ids,
-            add_label_ids=add_labels or None,
-            remove_label_ids=remove_labels or None,
-        )
+        async with registry._sem_gmail:
+            count = await registry._gmail.modify_labels(
+                message_ids,
+                add_label_ids=add_labels or None,
+                remove_label_ids=remove_labels or None,
+            )
         parts = []
         if add_labels:
             parts.append(f"added {add_labels}")
@@ -271,7 +361,9 @@ async def exec_create_gmail_label(registry: ToolRegistry, inp: dict) -> str:
     if not name:
         return "Please provide a label name."
     try:
-        result = await registry._gmail.create_label(name)
+        async with registry._sem_gmail:
+            result = await registry._gmail.create_label(name)
+        registry._label_id_cache.clear()
         return (
             f"✅ Label created: **{result['name']}** (ID: `{result['id']}`)\n"
             f"Use label_emails with this ID to apply it to messages."
@@ -291,9 +383,10 @@ async def exec_create_email_draft(registry: ToolRegistry, inp: dict) -> str:
     if not to or not subject or not body:
         return "Draft requires 'to', 'subject', and 'body'."
     try:
-        result = await registry._gmail.create_draft(
-            to=to, subject=subject, body=body, cc=cc
-        )
+        async with registry._sem_gmail:
+            result = await registry._gmail.create_draft(
+                to=to, subject=subject, body=body, cc=cc
+            )
         return (
             f"✅ Draft saved to Gmail Drafts.\n"
             f"To: {to}\n"
@@ -314,7 +407,8 @@ async def exec_classify_promotional_emails(registry: ToolRegistry, inp: dict) ->
 
     err: Exception | None = None
     try:
-        promos = await registry._gmail.classify_promotional(limit=limit)
+        async with registry._sem_gmail:
+            promos = await registry._gmail.classify_promotional(limit=limit)
     except Exception as e:
         err = e
     if err is not None:
@@ -324,8 +418,10 @@ async def exec_classify_promotional_emails(registry: ToolRegistry, inp: dict) ->
         return "✅ No promotional emails detected."
 
     lines = [f"🗑 {len(promos)} promotional email(s) found:\n"]
-    for item in promos[:10]:
-        lines.append(f"• {item['subject'][:80]}\n  _From: {item['from_addr'][:60]}_")
+    lines.extend(
+        f"• {item['subject'][:80]}\n  _From: {item['from_addr'][:60]}_"
+        for item in promos[:10]
+    )
     if len(promos) > 10:
         lines.append(f"…and {len(promos) - 10} more")
     lines.append(
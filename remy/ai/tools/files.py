@@ -3,20 +3,97 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import fnmatch
 import glob as glob_module
+import heapq
 import logging
 import os
 import time
+from collections.abc import Iterator
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ...ai.input_validator import sanitize_file_path
 from ...config import settings
+from ...file_link import create_token, encode_path_param
+from ...utils.ttl_cache import TTLCache
 
 if TYPE_CHECKING:
     from .registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+_READ_FILE_MAX_CHARS = 50000
+
+# (extensions, icon, label) groups used to classify files in Downloads scans
+_EXT_GROUPS: tuple[tuple[tuple[str, ...], str, str], ...] = (
+    (("jpg", "jpeg", "png", "gif", "bmp", "webp", "heic", "svg"), "🖼", "Images"),
+    (("mp4", "mov", "avi", "mkv", "m4v", "wmv", "flv"), "🎥", "Videos"),
+    (("mp3", "m4a", "wav", "flac", "aac", "ogg"), "🎵", "Audio"),
+    (
+        (
+            "pdf",
+            "doc",
+            "docx",
+            "xls",
+            "xlsx",
+            "ppt",
+            "pptx",
+            "txt",
+            "pages",
+            "numbers",
+            "key",
+        ),
+        "📄",
+        "Documents",
+    ),
+    (("zip", "tar", "gz", "bz2", "7z", "rar", "dmg", "pkg", "iso"), "📦", "Archives"),
+    (
+        (
+            "py",
+            "js",
+            "ts",
+            "java",
+            "cpp",
+            "c",
+            "h",
+            "go",
+            "rs",
+            "sh",
+            "json",
+            "yaml",
+            "yml",
+            "toml",
+        ),
+        "💻",
+        "Code",
+    ),
+)
+# Flattened extension -> (icon, label) lookup
+_EXT_TABLE: dict[str, tuple[str, str]] = {
+    ext: (icon, label) for exts, icon, label in _EXT_GROUPS for ext in exts
+}
+_EXT_OTHER = ("📁", "Other")
+
+# Line breaks and tabs in search snippets become spaces
+_SNIPPET_WS = str.maketrans("\n\r\t", "   ")
+
+_MSG_INDEX_DISABLED = "File indexing is disabled in configuration."
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB")
+_BYTE_DIVISORS = (1, 1024, 1024**2, 1024**3)
+
+# Downloads age buckets: upper bounds in seconds, and one label per bucket
+_AGE_LIMITS = (86400, 7 * 86400, 30 * 86400)
+AGE_BUCKET_LABELS = (
+    "Today (<1d)",
+    "This week (<7d)",
+    "This month (<30d)",
+    "Old (>30d)",
+)
+
 # US-lazy-service-init: run initial file index on first file-tool use, not at startup
 _file_initial_index_lock = asyncio.Lock()
 _file_initial_index_scheduled = False
@@ -55,8 +132,6 @@ async def _ensure_initial_index_started(indexer):
 
 def _sanitize_path(raw: str) -> tuple[str | None, str | None]:
     """Expand ~ and validate path is within allowed base dirs."""
-    from ...ai.input_validator import sanitize_file_path
-
     expanded = str(Path(raw).expanduser())
     path_obj, err = sanitize_file_path(expanded, settings.allowed_base_dirs)
     if err:
@@ -81,18 +156,23 @@ async def exec_read_file(registry: ToolRegistry, inp: dict) -> str:
         return f"Cannot read file: {err}"
 
     def _read():
+        # Read one char past the limit to detect truncation without loading
+        # the rest of the file; report the full size from fstat instead.
         with open(safe_path, encoding="utf-8", errors="replace") as f:
-            return f.read()
+            return f.read(_READ_FILE_MAX_CHARS + 1), os.fstat(f.fileno()).st_size
 
     try:
-        content = await asyncio.to_thread(_read)
+        content, total_bytes = await asyncio.to_thread(_read)
     except FileNotFoundError:
         return f"File not found: {safe_path}"
     except Exception as e:
         return f"Could not read file: {e}"
 
-    if len(content) > 50000:
-        content = content[:50000] + f"\n\n[… truncated — {len(content)} chars total]"
+    if len(content) > _READ_FILE_MAX_CHARS:
+        content = (
+            content[:_READ_FILE_MAX_CHARS]
+            + f"\n\n[… truncated — {total_bytes:,} bytes total]"
+        )
     return f"Contents of {safe_path}:\n\n{content}"
 
 
@@ -129,8 +209,6 @@ async def exec_get_file_download_link(registry: ToolRegistry, inp: dict) -> str:
     )
     expiry_ts = int(time.time()) + expires_minutes * 60
 
-    from ...file_link import create_token, encode_path_param
-
     token = create_token(safe_path, expiry_ts, secret)
     path_param = encode_path_param(safe_path)
     url = f"{base_url}/files?path={path_param}&token={token}"
@@ -157,7 +235,10 @@ async def exec_list_directory(registry: ToolRegistry, inp: dict) -> str:
             return None, f"Path does not exist: {safe_path}"
         if not p.is_dir():
             return None, f"Not a directory: {safe_path}"
-        all_entries = sorted(p.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
+        # DirEntry caches the dirent type, so sorting and the 📁/📄 prefix
+        # cost no extra stat() calls (except for symlinks).
+        with os.scandir(safe_path) as it:
+            all_entries = sorted(it, key=lambda x: (x.is_file(), x.name.lower()))
         lines = []
         for entry in all_entries[:100]:
             prefix = "📁 " if entry.is_dir() else "📄 "
@@ -186,8 +267,6 @@ async def exec_list_directory(registry: ToolRegistry, inp: dict) -> str:
 
 async def exec_write_file(registry: ToolRegistry, inp: dict) -> str:
     """Write (create or overwrite) a text file."""
-    from ...config import settings
-
     raw = inp.get("path", "").strip()
     content = inp.get("content", "")
     if not raw:
@@ -200,7 +279,7 @@ async def exec_write_file(registry: ToolRegistry, inp: dict) -> str:
     # Approval gate: large file writes require confirmation (US-approval-gates)
     threshold = settings.approval_file_write_threshold_bytes
     if len(content.encode("utf-8")) > threshold:
-        from ..bot.handlers.callbacks import store_pending_file_write
+        from ...bot.handlers.callbacks import store_pending_file_write
 
         user_id: int = getattr(registry, "_current_user_id", 0)
         token = store_pending_file_write(
@@ -222,6 +301,7 @@ async def exec_write_file(registry: ToolRegistry, inp: dict) -> str:
         size = await asyncio.to_thread(_write)
     except Exception as e:
         return f"Could not write file: {e}"
+    forget_dir_files(safe_path)
 
     return f"✅ Written {len(content):,} chars to {safe_path} ({size:,} bytes on disk)."
 
@@ -238,20 +318,23 @@ async def exec_append_file(registry: ToolRegistry, inp: dict) -> str:
         return f"Cannot append to file: {err}"
 
     def _append():
-        p = Path(safe_path)
-        if p.exists():
-            existing = p.read_text(encoding="utf-8")
-            sep = "" if (not existing or existing.endswith("\n")) else "\n"
-        else:
-            sep = ""
-        with open(safe_path, "a", encoding="utf-8") as f:
-            f.write(sep + content)
-        return p.stat().st_size
+        # Only the last byte is needed to decide on a separator newline.
+        fd = os.open(safe_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            size = os.fstat(fd).st_size
+            sep = b"\n" if size and os.pread(fd, 1, size - 1) != b"\n" else b""
+            data = memoryview(sep + content.encode("utf-8"))
+            while data:
+                data = data[os.write(fd, data) :]
+            return os.fstat(fd).st_size
+        finally:
+            os.close(fd)
 
     try:
         size = await asyncio.to_thread(_append)
     except Exception as e:
         return f"Could not append to file: {e}"
+    forget_dir_files(safe_path)
 
     return (
         f"✅ Appended {len(content):,} chars to {safe_path} "
@@ -259,26 +342,91 @@ async def exec_append_file(registry: ToolRegistry, inp: dict) -> str:
     )
 
 
+def _iter_name_matches(base: str, pattern: str) -> Iterator[str]:
+    """
+    Yield paths under base whose name matches pattern, like glob's base/**/pattern.
+
+    Walks with os.scandir and an explicit stack, without following symlinked
+    directories. As with glob, hidden entries only match a pattern starting
+    with "." and hidden directories are not descended into.
+    """
+    match_hidden = pattern.startswith(".")
+    stack = [base]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                hidden = entry.name.startswith(".")
+                if (match_hidden or not hidden) and fnmatch.fnmatch(
+                    entry.name, pattern
+                ):
+                    yield entry.path
+                if not hidden and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def _base_matching_files(
+    pattern: str, base: str, bases: list[str], limit: int
+) -> list[str]:
+    """Up to limit sanitized matches for pattern under a single base."""
+    if os.sep in pattern or "/" in pattern:
+        matches = glob_module.iglob(os.path.join(base, "**", pattern), recursive=True)
+    else:
+        matches = _iter_name_matches(base, pattern)
+    results: list[str] = []
+    for match in matches:
+        safe, err = sanitize_file_path(match, bases)
+        if safe and not err:
+            results.append(safe)
+            if len(results) >= limit:
+                break
+    return results
+
+
+def find_matching_files(pattern: str, bases: list[str], limit: int = 20) -> list[str]:
+    """
+    Return up to limit sanitized paths under bases matching a filename glob.
+
+    Stops walking as soon as limit paths pass sanitize_file_path. Patterns
+    containing a path separator fall back to a lazy recursive iglob.
+    Blocking — run it in a thread.
+    """
+    results: list[str] = []
+    for base in bases:
+        results += _base_matching_files(pattern, base, bases, limit - len(results))
+        if len(results) >= limit:
+            break
+    return results
+
+
+async def gather_matching_files(
+    pattern: str, bases: list[str], limit: int = 20
+) -> list[str]:
+    """
+    find_matching_files() with each base walked in its own worker thread.
+
+    Wall time is that of the slowest base rather than the sum of all of them;
+    results keep base order and are capped at limit.
+    """
+    per_base = await asyncio.gather(
+        *(
+            asyncio.to_thread(_base_matching_files, pattern, base, bases, limit)
+            for base in bases
+        )
+    )
+    return [path for paths in per_base for path in paths][:limit]
+
+
 async def exec_find_files(registry: ToolRegistry, inp: dict) -> str:
     """Search for files by filename pattern (glob) under allowed directories."""
     pattern = inp.get("pattern", "").strip()
     if not pattern:
         return "Please provide a filename pattern (e.g. '*.pdf', 'config*')."
 
-    raw_results = []
-    for base in settings.allowed_base_dirs:
-        raw_results.extend(
-            glob_module.glob(os.path.join(base, "**", pattern), recursive=True)
-        )
-
-    from ...ai.input_validator import sanitize_file_path
-
-    results = []
-    for r in raw_results:
-        safe, err = sanitize_file_path(r, settings.allowed_base_dirs)
-        if safe and not err:
-            results.append(safe)
-    results = results[:20]
+    results = await gather_matching_files(pattern, settings.allowed_base_dirs)
 
     if not results:
         return f"No files matching '{pattern}' found."
@@ -286,147 +434,187 @@ async def exec_find_files(registry: ToolRegistry, inp: dict) -> str:
     return f"📂 Files matching '{pattern}':\n\n" + "\n".join(results)
 
 
-async def exec_scan_downloads(registry: ToolRegistry) -> str:
-    """Analyse the ~/Downloads folder."""
-    downloads = Path.home() / "Downloads"
-    if not downloads.exists():
-        return "Downloads folder not found."
+def classify_extension(ext: str) -> tuple[str, str]:
+    """Return (icon, label) for a file extension, with or without the dot."""
+    return _EXT_TABLE.get(ext.lower().lstrip("."), _EXT_OTHER)
 
-    try:
-        files = [f for f in downloads.iterdir() if f.is_file()]
-    except Exception as e:
-        return f"Could not scan Downloads: {e}"
 
-    if not files:
-        return "✅ Downloads folder is empty."
+def age_bucket(age: float) -> int:
+    """Index into AGE_BUCKET_LABELS for a file age in seconds."""
+    return bisect.bisect_right(_AGE_LIMITS, age)
 
-    now = time.time()
-    total_bytes = 0
 
-    _EXTS: list[tuple[frozenset, str, str]] = [
-        (
-            frozenset(["jpg", "jpeg", "png", "gif", "bmp", "webp", "heic", "svg"]),
-            "🖼",
-            "Images",
-        ),
-        (frozenset(["mp4", "mov", "avi", "mkv", "m4v", "wmv", "flv"]), "🎥", "Videos"),
-        (frozenset(["mp3", "m4a", "wav", "flac", "aac", "ogg"]), "🎵", "Audio"),
-        (
-            frozenset(
-                [
-                    "pdf",
-                    "doc",
-                    "docx",
-                    "xls",
-                    "xlsx",
-                    "ppt",
-                    "pptx",
-                    "txt",
-                    "pages",
-                    "numbers",
-                    "key",
-                ]
-            ),
-            "📄",
-            "Documents",
-        ),
-        (
-            frozenset(["zip", "tar", "gz", "bz2", "7z", "rar", "dmg", "pkg", "iso"]),
-            "📦",
-            "Archives",
-        ),
-        (
-            frozenset(
-                [
-                    "py",
-                    "js",
-                    "ts",
-                    "java",
-                    "cpp",
-                    "c",
-                    "h",
-                    "go",
-                    "rs",
-                    "sh",
-                    "json",
-                    "yaml",
-                    "yml",
-                    "toml",
-                ]
-            ),
-            "💻",
-            "Code",
-        ),
-    ]
+def format_bytes(b: int) -> str:
+    """Compact human-readable size: B, KB, MB or GB."""
+    # Each unit is 10 bits wider than the last, so bit_length picks the unit.
+    i = min((b.bit_length() - 1) // 10, 3) if b > 0 else 0
+    if i == 3:
+        return f"{b / _BYTE_DIVISORS[3]:.1f}GB"
+    return f"{b // _BYTE_DIVISORS[i]}{_BYTE_UNITS[i]}"
+
+
+def stat_dir_files(path: str) -> list[tuple[str, int, float]]:
+    """
+    Return (name, size, mtime) for each regular file directly inside path.
+
+    Blocking (one os.scandir pass plus a stat per file) — run it in a thread.
+    """
+    files = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file():
+                st = entry.stat()
+                files.append((entry.name, st.st_size, st.st_mtime))
+    return files
+
+
+def first_dir_names(path: str, n: int = 50) -> tuple[int, list[str]]:
+    """
+    Return (entry count, the n alphabetically first entry names) for path.
+
+    Blocking — run it in a thread. Uses a bounded heap, so a huge directory
+    is never sorted or held in memory as a whole.
+    """
+    total = 0
 
-    def _classify(ext: str) -> tuple[str, str]:
-        ext = ext.lower().lstrip(".")
-        for exts, icon, label in _EXTS:
-            if ext in exts:
-                return icon, label
-        return "📁", "Other"
-
-    def _fmt_bytes(b: int) -> str:
-        if b < 1024:
-            return f"{b}B"
-        if b < 1024 * 1024:
-            return f"{b // 1024}KB"
-        if b < 1024**3:
-            return f"{b // (1024 * 1024)}MB"
-        return f"{b / (1024**3):.1f}GB"
-
-    type_counts: dict[str, tuple[str, int, int]] = {}
-    age_buckets = {
-        "Today (<1d)": 0,
-        "This week (<7d)": 0,
-        "This month (<30d)": 0,
-        "Old (>30d)": 0,
-    }
-    oldest: list[tuple[float, str, int]] = []
-
-    for f in files:
-        stat = f.stat()
-        total_bytes += stat.st_size
-        icon, label = _classify(f.suffix)
-        prev = type_counts.get(label, (icon, 0, 0))
-        type_counts[label] = (icon, prev[1] + 1, prev[2] + stat.st_size)
-        age = now - stat.st_mtime
-        if age < 86400:
-            age_buckets["Today (<1d)"] += 1
-        elif age < 7 * 86400:
-            age_buckets["This week (<7d)"] += 1
-        elif age < 30 * 86400:
-            age_buckets["This month (<30d)"] += 1
+    def _names(it: Iterator[os.DirEntry]) -> Iterator[str]:
+        nonlocal total
+        for entry in it:
+            total += 1
+            yield entry.name
+
+    with os.scandir(path) as it:
+        names = heapq.nsmallest(n, _names(it))
+    return total, names
+
+
+# path -> (directory st_mtime_ns at scan time, stat_dir_files result)
+_DIR_CACHE: TTLCache[tuple[int, list[tuple[str, int, float]]]] = TTLCache(
+    maxsize=16, ttl=30.0
+)
+
+
+def _scan_if_changed(
+    path: str, known_mtime: int | None
+) -> tuple[int, list[tuple[str, int, float]] | None]:
+    """Return (dir mtime, stat_dir_files result), or (mtime, None) if unchanged."""
+    dir_mtime = os.stat(path).st_mtime_ns
+    if dir_mtime == known_mtime:
+        return dir_mtime, None
+    return dir_mtime, stat_dir_files(path)
+
+
+async def cached_dir_files(path: str) -> list[tuple[str, int, float]]:
+    """
+    stat_dir_files() with a short TTL cache keyed on the directory's mtime.
+
+    Adding, removing or renaming an entry bumps the directory mtime, so a
+    single stat() decides whether a recent scan can be reused. In-place
+    rewrites don't, which is why the write tools call forget_dir_files().
+    path must be fully resolved, as _sanitize_path and downloads_dir() return
+    it, so that forget_dir_files() clears the same key.
+    The stat and any rescan run in one worker thread, off the event loop.
+    The returned list is shared with the cache — don't mutate it.
+    """
+    cached = _DIR_CACHE.get(path)
+    dir_mtime, files = await asyncio.to_thread(
+        _scan_if_changed, path, cached[0] if cached is not None else None
+    )
+    if files is None:
+        return cached[1]
+    _DIR_CACHE.set(path, (dir_mtime, files))
+    return files
+
+
+def downloads_dir() -> Path:
+    """~/Downloads with symlinks resolved, matching sanitized write paths."""
+    return (Path.home() / "Downloads").resolve()
+
+
+def forget_dir_files(file_path: str) -> None:
+    """Drop the cached listing for the directory containing file_path."""
+    _DIR_CACHE.pop(os.path.dirname(file_path))
+
+
+def summarise_downloads(
+    files: list[tuple[str, int, float]], now: float, heading: str = "{}"
+) -> str:
+    """
+    Render the Downloads report (types, ages, oldest files) for stat_dir_files rows.
+
+    heading formats the section titles, e.g. "*{}*" for Telegram Markdown.
+    """
+    total_bytes = 0
+
+    # label -> [icon, count, bytes], updated in place
+    type_counts: dict[str, list] = {}
+    age_counts = [0] * len(AGE_BUCKET_LABELS)
+
+    for name, size, mtime in files:
+        total_bytes += size
+        # rfind skips splitext's generic path handling; dot > 0 keeps
+        # dotfiles like ".bashrc" extension-less, as splitext does.
+        dot = name.rfind(".")
+        icon, label = classify_extension(name[dot + 1 :] if dot > 0 else "")
+        counts = type_counts.get(label)
+        if counts is None:
+            type_counts[label] = [icon, 1, size]
         else:
-            age_buckets["Old (>30d)"] += 1
-        oldest.append((stat.st_mtime, f.name, stat.st_size))
+            counts[1] += 1
+            counts[2] += size
+        age_counts[age_bucket(now - mtime)] += 1
 
     lines = [
-        f"📦 Downloads Scan — {len(files)} files ({_fmt_bytes(total_bytes)} total)\n"
+        (
+            f"📦 {heading.format('Downloads Scan')} — {len(files)} files "
+            f"({format_bytes(total_bytes)} total)\n"
+        )
     ]
 
-    lines.append("Type breakdown:")
-    for label, (icon, count, nbytes) in sorted(
-        type_counts.items(), key=lambda x: -x[1][2]
-    ):
-        lines.append(f"  {icon} {label}: {count} file(s), {_fmt_bytes(nbytes)}")
+    lines.append(heading.format("Type breakdown:"))
+    lines.extend(
+        f"  {icon} {label}: {count} file(s), {format_bytes(nbytes)}"
+        for label, (icon, count, nbytes) in sorted(
+            type_counts.items(), key=lambda x: -x[1][2]
+        )
+    )
 
-    lines.append("\nAge breakdown:")
-    for bucket, count in age_buckets.items():
-        if count:
-            suffix = " — consider cleanup" if "Old" in bucket else ""
-            lines.append(f"  • {bucket}: {count} file(s){suffix}")
+    lines.append("\n" + heading.format("Age breakdown:"))
+    lines.extend(
+        f"  • {bucket}: {count} file(s)"
+        + (" — consider cleanup" if "Old" in bucket else "")
+        for bucket, count in zip(AGE_BUCKET_LABELS, age_counts)
+        if count
+    )
 
-    oldest_sorted = sorted(oldest, key=lambda x: x[0])[:8]
+    oldest_sorted = heapq.nsmallest(8, files, key=itemgetter(2))
     if oldest_sorted:
-        lines.append("\nOldest files:")
-        for mtime, name, nbytes in oldest_sorted:
-            age_days = int((now - mtime) / 86400)
-            lines.append(f"  • {name} ({age_days}d old, {_fmt_bytes(nbytes)})")
+        lines.append("\n" + heading.format("Oldest files:"))
+        lines.extend(
+            f"  • {name} ({int((now - mtime) / 86400)}d old, {format_bytes(nbytes)})"
+            for name, nbytes, mtime in oldest_sorted
+        )
 
     return "\n".join(lines)
 
 
+async def exec_scan_downloads(registry: ToolRegistry) -> str:
+    """Analyse the ~/Downloads folder."""
+    downloads = downloads_dir()
+    if not downloads.exists():
+        return "Downloads folder not found."
+
+    try:
+        files = await cached_dir_files(str(downloads))
+    except Exception as e:
+        return f"Could not scan Downloads: {e}"
+
+    if not files:
+        return "✅ Downloads folder is empty."
+
+    return summarise_downloads(files, time.time())
+
+
 async def exec_organize_directory(registry: ToolRegistry, inp: dict) -> str:
     """Analyse a directory and suggest how to organise its files into folders."""
     path_arg = inp.get("path", "").strip()
@@ -442,17 +630,17 @@ async def exec_organize_directory(registry: ToolRegistry, inp: dict) -> str:
         return "Not a directory."
 
     try:
-        entries = sorted([f.name for f in p.iterdir()])
+        _, names = await asyncio.to_thread(first_dir_names, safe_path, 50)
     except Exception as e:
         return f"Could not list directory: {e}"
 
-    if not entries:
+    if not names:
         return "Directory is empty."
 
     if registry._claude_client is None:
         return "Claude not available for organisation suggestions."
 
-    listing = "\n".join(entries[:50])
+    listing = "\n".join(names)
     try:
         suggestions = await registry._claude_client.complete(
             messages=[
@@ -489,9 +677,7 @@ async def exec_clean_directory(registry: ToolRegistry, inp: dict) -> str:
         return "Not a directory."
 
     try:
-        files = sorted(
-            [f for f in p.iterdir() if f.is_file()], key=lambda x: x.stat().st_mtime
-        )
+        files = await cached_dir_files(safe_path)
     except Exception as e:
         return f"Could not list directory: {e}"
 
@@ -502,13 +688,10 @@ async def exec_clean_directory(registry: ToolRegistry, inp: dict) -> str:
         return "Claude not available for cleanup suggestions."
 
     now = time.time()
-    file_lines = []
-    for f in files[:30]:
-        stat = f.stat()
-        age_days = int((now - stat.st_mtime) / 86400)
-        size_kb = stat.st_size // 1024
-        file_lines.append(f"• {f.name} ({size_kb}KB, {age_days}d old)")
-    listing = "\n".join(file_lines)
+    listing = "\n".join(
+        f"• {name} ({size // 1024}KB, {int((now - mtime) / 86400)}d old)"
+        for name, size, mtime in heapq.nsmallest(30, files, key=itemgetter(2))
+    )
 
     try:
         suggestions = await registry._claude_client.complete(
@@ -530,20 +713,27 @@ async def exec_clean_directory(registry: ToolRegistry, inp: dict) -> str:
         return f"Could not generate suggestions: {e}"
 
 
+def _search_snippet(content: str) -> str:
+    """First 200 chars of an indexed chunk, flattened onto one line."""
+    snippet = content[:200].translate(_SNIPPET_WS)
+    if len(content) > 200:
+        return snippet.lstrip() + "…"
+    return snippet.strip()
+
+
 async def exec_search_files(registry: ToolRegistry, inp: dict) -> str:
     """Search indexed files for content matching a query."""
-    from ...config import get_settings
-
-    if registry._file_indexer is None:
+    indexer = registry._file_indexer
+    if indexer is None:
         return (
             "File indexing not available. "
             "The file index may not be configured or enabled."
         )
 
-    if not registry._file_indexer.enabled:
-        return "File indexing is disabled in configuration."
+    if not indexer.enabled:
+        return _MSG_INDEX_DISABLED
 
-    await _ensure_initial_index_started(registry._file_indexer)
+    await _ensure_initial_index_started(indexer)
 
     query = inp.get("query", "").strip()
     if not query:
@@ -552,12 +742,11 @@ async def exec_search_files(registry: ToolRegistry, inp: dict) -> str:
     limit = min(int(inp.get("limit", 5)), 10)
     path_filter = inp.get("path_filter", "").strip() or None
 
-    settings = get_settings()
     timeout_s = settings.search_files_timeout_seconds
 
     try:
         results = await asyncio.wait_for(
-            registry._file_indexer.search(query, limit=limit, path_filter=path_filter),
+            indexer.search(query, limit=limit, path_filter=path_filter),
             timeout=timeout_s,
         )
     except asyncio.TimeoutError:
@@ -580,39 +769,30 @@ async def exec_search_files(registry: ToolRegistry, inp: dict) -> str:
             msg += f" (searched in {path_filter})"
         return msg
 
-    lines = [f'📂 File search results for "{query}":']
-    lines.append("")
-
-    for i, result in enumerate(results, 1):
-        path = result.get("path", "unknown")
-        chunk_idx = result.get("chunk_index", 0)
-        content = result.get("content_text", "")
-
-        if len(content) > 200:
-            content = content[:200] + "…"
-
-        content = content.replace("\n", " ").strip()
-
-        lines.append(f"{i}. {path} (chunk {chunk_idx})")
-        lines.append(f'   "{content}"')
-        lines.append("")
-
-    lines.append("Use read_file to see the full content of any file.")
-    return "\n".join(lines)
+    body = "".join(
+        f"{i}. {result.get('path', 'unknown')} (chunk {result.get('chunk_index', 0)})\n"
+        f'   "{_search_snippet(result.get("content_text", ""))}"\n\n'
+        for i, result in enumerate(results, 1)
+    )
+    return (
+        f'📂 File search results for "{query}":\n\n{body}'
+        "Use read_file to see the full content of any file."
+    )
 
 
 async def exec_index_status(registry: ToolRegistry) -> str:
     """Show the current state of the file index."""
-    if registry._file_indexer is None:
+    indexer = registry._file_indexer
+    if indexer is None:
         return "File indexing not available. The file index may not be configured."
 
-    if not registry._file_indexer.enabled:
-        return "File indexing is disabled in configuration."
+    if not indexer.enabled:
+        return _MSG_INDEX_DISABLED
 
-    await _ensure_initial_index_started(registry._file_indexer)
+    await _ensure_initial_index_started(indexer)
 
     try:
-        status = await registry._file_indexer.get_status()
+        status = await indexer.get_status()
     except Exception as e:
         return f"Could not get index status: {e}"
 
@@ -5,8 +5,22 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import islice
 from typing import TYPE_CHECKING
 
+from ...config import settings
+from ...diagnostics import (
+    _since_dt,
+    get_diag_summary,
+    get_error_summary,
+    get_recent_logs,
+    get_session_start,
+    get_session_start_line,
+    log_file_identity,
+)
+from ...memory.para import PARAStore
+
 if TYPE_CHECKING:
     from .registry import ToolRegistry
 
@@ -15,8 +29,6 @@ logger = logging.getLogger(__name__)
 
 async def exec_para_write_note(registry: ToolRegistry, inp: dict) -> str:
     """Write a note to PARA memory: entity items or daily notes (US-para-memory)."""
-    from ...memory.para import PARAStore
-
     where = (inp.get("where") or "").strip().lower()
     content = (inp.get("content") or "").strip()
     if not content:
@@ -48,16 +60,31 @@ async def exec_para_write_note(registry: ToolRegistry, inp: dict) -> str:
         return f"Failed to write PARA note: {e}"
 
 
+async def _session_start(registry: ToolRegistry) -> tuple[int, datetime | None]:
+    """Return (line index, timestamp) of the current session's start marker.
+
+    Memoised on the registry for as long as the log file keeps the same identity,
+    so repeat calls cost one stat() instead of two full scans of the log.
+    """
+    ident = log_file_identity(registry._logs_dir)
+    cached = registry._session_start_cache
+    if (
+        ident is not None
+        and cached is not None
+        and cached[2][:3] == ident[:3]
+        and ident[3] >= cached[2][3]
+    ):
+        return cached[0], cached[1]
+
+    line = await asyncio.to_thread(get_session_start_line, registry._logs_dir)
+    ts = await asyncio.to_thread(get_session_start, registry._logs_dir)
+    if ident is not None:
+        registry._session_start_cache = (line, ts, ident)
+    return line, ts
+
+
 async def exec_get_logs(registry: ToolRegistry, inp: dict) -> str:
     """Read remy's log file for diagnostics."""
-    from ...diagnostics import (
-        get_error_summary,
-        get_recent_logs,
-        get_session_start,
-        get_session_start_line,
-        _since_dt,
-    )
-
     mode = inp.get("mode", "summary")
     lines = min(int(inp.get("lines", 30)), 100)
     since_param = inp.get("since")
@@ -68,10 +95,7 @@ async def exec_get_logs(registry: ToolRegistry, inp: dict) -> str:
     since_dt_val = None
     since_line_val = None
     if since_param == "startup":
-        since_line_val = await asyncio.to_thread(
-            get_session_start_line, registry._logs_dir
-        )
-        ts = await asyncio.to_thread(get_session_start, registry._logs_dir)
+        since_line_val, ts = await _session_start(registry)
         since_label = (
             f"session start ({ts.strftime('%Y-%m-%d %H:%M:%S')})"
             if ts
@@ -99,11 +123,8 @@ async def exec_get_logs(registry: ToolRegistry, inp: dict) -> str:
         )
         return f"Error/warning summary ({since_label}):\n\n{result}"
     else:
-        summary = await asyncio.to_thread(
-            get_error_summary, registry._logs_dir, 5, since_dt_val, since_line_val
-        )
-        tail = await asyncio.to_thread(
-            get_recent_logs, registry._logs_dir, 10, None, since_dt_val, since_line_val
+        summary, tail = await asyncio.to_thread(
+            get_diag_summary, registry._logs_dir, 5, 10, since_dt_val, since_line_val
         )
         return f"Diagnostics summary ({since_label}):\n\n{summary}\n\nRecent log tail (10 lines):\n{tail}"
 
@@ -202,7 +223,6 @@ async def exec_run_board(registry: ToolRegistry, inp: dict, user_id: int) -> str
         return "Board: no topic provided."
 
     from ...agents import sdk_subagents
-    from ...config import settings
 
     if (
         not getattr(settings, "use_sdk_agent", True)
@@ -214,54 +234,70 @@ async def exec_run_board(registry: ToolRegistry, inp: dict, user_id: int) -> str
     return result or "Board analysis did not return a result."
 
 
-async def exec_check_status(registry: ToolRegistry) -> str:
-    """Check the availability of backend services."""
-    import httpx
-
-    lines = []
+async def _probe_claude(registry: ToolRegistry) -> str:
+    if registry._claude_client is None:
+        return "Claude: ⚠️  client not configured"
+    try:
+        available = await registry._claude_client.ping()
+        return f"Claude ({registry._model_complex}): {'✅ online' if available else '❌ offline'}"
+    except Exception as e:
+        return f"Claude: ❌ error ({e})"
 
-    if registry._claude_client is not None:
-        try:
-            available = await registry._claude_client.ping()
-            lines.append(
-                f"Claude ({registry._model_complex}): {'✅ online' if available else '❌ offline'}"
-            )
-        except Exception as e:
-            lines.append(f"Claude: ❌ error ({e})")
-    else:
-        lines.append("Claude: ⚠️  client not configured")
 
-    if registry._mistral_client is not None:
+async def _probe_mistral(registry: ToolRegistry) -> str:
+    try:
         available = await registry._mistral_client.is_available()
-        lines.append(f"Mistral: {'✅ online' if available else '❌ offline'}")
+    except Exception as e:
+        return f"Mistral: ❌ error ({e})"
+    return f"Mistral: {'✅ online' if available else '❌ offline'}"
 
-    if registry._moonshot_client is not None:
-        available = await registry._moonshot_client.is_available()
-        balance = await registry._moonshot_client.get_balance()
-        from ...config import settings
-
-        warn_usd = getattr(settings, "moonshot_balance_warn_usd", 5.0)
-        if balance is not None:
-            low = " ⚠️ low" if warn_usd > 0 and balance < warn_usd else ""
-            lines.append(
-                f"Moonshot: {'✅ online' if available else '❌ offline'} — credits ${balance:.2f}{low}"
-            )
-        else:
-            lines.append(f"Moonshot: {'✅ online' if available else '❌ offline'}")
 
+async def _probe_moonshot(registry: ToolRegistry) -> str:
     try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
+        available, balance = await asyncio.gather(
+            registry._moonshot_client.is_available(),
+            registry._moonshot_client.get_balance(),
+        )
+    except Exception as e:
+        return f"Moonshot: ❌ error ({e})"
+
+    warn_usd = getattr(settings, "moonshot_balance_warn_usd", 5.0)
+    status = "✅ online" if available else "❌ offline"
+    if balance is not None:
+        low = " ⚠️ low" if warn_usd > 0 and balance < warn_usd else ""
+        return f"Moonshot: {status} — credits ${balance:.2f}{low}"
+    return f"Moonshot: {status}"
+
+
+async def _probe_ollama(registry: ToolRegistry) -> str:
+    try:
+        client = registry._get_http_client()
+        async with registry._sem_ollama:
             resp = await client.get(f"{registry._ollama_base_url}/api/tags")
-            if resp.status_code == 200:
-                models = [m.get("name") for m in resp.json().get("models", [])]
-                model_str = ", ".join(models[:5]) or "no models"
-                lines.append(f"Ollama: ✅ online — {model_str}")
-            else:
-                lines.append(f"Ollama: ❌ error ({resp.status_code})")
+        if resp.status_code == 200:
+            models = [m.get("name") for m in resp.json().get("models", [])]
+            model_str = ", ".join(models[:5]) or "no models"
+            return f"Ollama: ✅ online — {model_str}"
+        return f"Ollama: ❌ error ({resp.status_code})"
     except Exception as e:
         logger.debug("Ollama health check failed: %s", e)
-        lines.append("Ollama: ❌ offline")
+        return "Ollama: ❌ offline"
+
+
+async def exec_check_status(registry: ToolRegistry) -> str:
+    """Check the availability of backend services.
+
+    Backends are probed concurrently, so one hung service does not delay the rest.
+    Each probe formats its own status line and never raises.
+    """
+    probes = [_probe_claude(registry)]
+    if registry._mistral_client is not None:
+        probes.append(_probe_mistral(registry))
+    if registry._moonshot_client is not None:
+        probes.append(_probe_moonshot(registry))
+    probes.append(_probe_ollama(registry))
 
+    lines = await asyncio.gather(*probes)
     return "Backend status:\n" + "\n".join(lines)
 
 
@@ -309,113 +345,127 @@ async def exec_manage_memory(registry: ToolRegistry, inp: dict, user_id: int) ->
     return f"Unknown action '{action}'. Use: add, update, or delete."
 
 
-async def exec_manage_goal(registry: ToolRegistry, inp: dict, user_id: int) -> str:
-    """Add, update, complete, abandon, or delete a goal."""
-    if registry._knowledge_store is None:
-        return "Goal store not available."
+_GOAL_NOT_FOUND = "No goal with ID {} found."
+_GOAL_UNKNOWN_ACTION = (
+    "Unknown action '{}'. Use: add, update, complete, abandon, delete, or snooze."
+)
 
-    action = inp.get("action", "").strip()
-    goal_id = inp.get("goal_id")
-    title = (inp.get("title") or "").strip() or None
+
+async def _goal_add(registry: ToolRegistry, inp: dict, user_id: int) -> str:
+    title = (inp.get("title") or "").strip()
+    if not title:
+        return "Please provide a title for the new goal."
+    metadata = {"status": "active"}
     description = inp.get("description")
+    if description:
+        metadata["description"] = description
+    new_id = await registry._knowledge_store.add_item(user_id, "goal", title, metadata)
+    return f"✅ Goal added (ID {new_id}): {title}"
 
-    if action == "add":
-        if not title:
-            return "Please provide a title for the new goal."
-        metadata = {"status": "active"}
-        if description:
-            metadata["description"] = description
-        new_id = await registry._knowledge_store.add_item(
-            user_id, "goal", title, metadata
-        )
-        return f"✅ Goal added (ID {new_id}): {title}"
 
-    elif action == "update":
-        if not goal_id:
-            return "Please provide goal_id to update. Call get_goals to find IDs."
-        if not title and description is None:
-            return "Please provide a new title and/or description."
+async def _goal_update(
+    registry: ToolRegistry, inp: dict, user_id: int, goal_id: int
+) -> str:
+    title = (inp.get("title") or "").strip() or None
+    description = inp.get("description")
+    if not title and description is None:
+        return "Please provide a new title and/or description."
+
+    # Write only the changed fields; description is patched in place with json_set.
+    ks = registry._knowledge_store
+    if title and not await ks.update(user_id, goal_id, title, entity_type="goal"):
+        return _GOAL_NOT_FOUND.format(goal_id)
+    if description is not None and not await ks.set_metadata_key(
+        user_id, goal_id, "description", description, entity_type="goal"
+    ):
+        return _GOAL_NOT_FOUND.format(goal_id)
+
+    parts = []
+    if title:
+        parts.append(f"title → '{title}'")
+    if description is not None:
+        parts.append(f"description → '{description}'")
+    return f"✅ Goal {goal_id} updated: {', '.join(parts)}"
+
+
+async def _goal_set_status(
+    status: str,
+    done_msg: str,
+    registry: ToolRegistry,
+    inp: dict,
+    user_id: int,
+    goal_id: int,
+) -> str:
+    ok = await registry._knowledge_store.set_metadata_key(
+        user_id, goal_id, "status", status, entity_type="goal"
+    )
+    if not ok:
+        return _GOAL_NOT_FOUND.format(goal_id)
+    return f"✅ Goal {goal_id} {done_msg}"
+
+
+async def _goal_delete(
+    registry: ToolRegistry, inp: dict, user_id: int, goal_id: int
+) -> str:
+    deleted = await registry._knowledge_store.delete(user_id, goal_id)
+    if not deleted:
+        return _GOAL_NOT_FOUND.format(goal_id)
+    return f"✅ Goal {goal_id} permanently deleted."
+
+
+async def _goal_snooze(
+    registry: ToolRegistry, inp: dict, user_id: int, goal_id: int
+) -> str:
+    raw_until = (inp.get("until") or "").strip()
+    if raw_until:
+        until = raw_until[:10]
+    else:
+        until_dt = datetime.now(timezone.utc) + timedelta(days=7)
+        until = until_dt.strftime("%Y-%m-%d")
+    if registry._knowledge_store is not None:
+        ok = await registry._knowledge_store.snooze_goal(user_id, goal_id, until)
+    elif registry._goal_store is not None:
+        ok = await registry._goal_store.snooze(user_id, goal_id, until)
+    else:
+        return "Snooze is not available (goal store not configured)."
+    if not ok:
+        return _GOAL_NOT_FOUND.format(goal_id)
+    return f"✅ Goal {goal_id} snoozed. It won't appear in evening check-ins until {until}."
+
+
+# action -> (handler, verb used when goal_id is missing)
+_GOAL_ACTIONS = {
+    "update": (_goal_update, "update"),
+    "complete": (
+        partial(_goal_set_status, "completed", "marked as completed. Nice work! 🎉"),
+        "mark complete",
+    ),
+    "abandon": (
+        partial(_goal_set_status, "abandoned", "marked as abandoned."),
+        "abandon",
+    ),
+    "delete": (_goal_delete, "delete"),
+    "snooze": (_goal_snooze, "snooze"),
+}
 
-        items = await registry._knowledge_store.get_by_type(user_id, "goal", limit=100)
-        target = next((i for i in items if i.id == int(goal_id)), None)
-        if not target:
-            return f"No goal with ID {goal_id} found."
 
-        new_meta = target.metadata.copy()
-        if description is not None:
-            new_meta["description"] = description
+async def exec_manage_goal(registry: ToolRegistry, inp: dict, user_id: int) -> str:
+    """Add, update, complete, abandon, or delete a goal."""
+    if registry._knowledge_store is None:
+        return "Goal store not available."
 
-        updated = await registry._knowledge_store.update(
-            user_id, int(goal_id), title, new_meta
-        )
-        if not updated:
-            return f"No goal with ID {goal_id} found."
-
-        parts = []
-        if title:
-            parts.append(f"title → '{title}'")
-        if description is not None:
-            parts.append(f"description → '{description}'")
-        return f"✅ Goal {goal_id} updated: {', '.join(parts)}"
-
-    elif action == "complete":
-        if not goal_id:
-            return (
-                "Please provide goal_id to mark complete. Call get_goals to find IDs."
-            )
-        items = await registry._knowledge_store.get_by_type(user_id, "goal", limit=100)
-        target = next((i for i in items if i.id == int(goal_id)), None)
-        if not target:
-            return f"No goal with ID {goal_id} found."
-
-        new_meta = target.metadata.copy()
-        new_meta["status"] = "completed"
-        await registry._knowledge_store.update(user_id, int(goal_id), metadata=new_meta)
-        return f"✅ Goal {goal_id} marked as completed. Nice work! 🎉"
-
-    elif action == "abandon":
-        if not goal_id:
-            return "Please provide goal_id to abandon. Call get_goals to find IDs."
-        items = await registry._knowledge_store.get_by_type(user_id, "goal", limit=100)
-        target = next((i for i in items if i.id == int(goal_id)), None)
-        if not target:
-            return f"No goal with ID {goal_id} found."
-
-        new_meta = target.metadata.copy()
-        new_meta["status"] = "abandoned"
-        await registry._knowledge_store.update(user_id, int(goal_id), metadata=new_meta)
-        return f"✅ Goal {goal_id} marked as abandoned."
+    action = inp.get("action", "").strip()
+    if action == "add":
+        return await _goal_add(registry, inp, user_id)
 
-    elif action == "delete":
-        if not goal_id:
-            return "Please provide goal_id to delete. Call get_goals to find IDs."
-        deleted = await registry._knowledge_store.delete(user_id, int(goal_id))
-        if not deleted:
-            return f"No goal with ID {goal_id} found."
-        return f"✅ Goal {goal_id} permanently deleted."
-
-    elif action == "snooze":
-        if not goal_id:
-            return "Please provide goal_id to snooze. Call get_goals to find IDs."
-        raw_until = (inp.get("until") or "").strip()
-        if raw_until:
-            until = raw_until[:10]
-        else:
-            until_dt = datetime.now(timezone.utc) + timedelta(days=7)
-            until = until_dt.strftime("%Y-%m-%d")
-        if registry._knowledge_store is not None:
-            ok = await registry._knowledge_store.snooze_goal(
-                user_id, int(goal_id), until
-            )
-        elif registry._goal_store is not None:
-            ok = await registry._goal_store.snooze(user_id, int(goal_id), until)
-        else:
-            return "Snooze is not available (goal store not configured)."
-        if not ok:
-            return f"No goal with ID {goal_id} found."
-        return f"✅ Goal {goal_id} snoozed. It won't appear in evening check-ins until {until}."
-
-    return f"Unknown action '{action}'. Use: add, update, complete, abandon, delete, or snooze."
+    entry = _GOAL_ACTIONS.get(action)
+    if entry is None:
+        return _GOAL_UNKNOWN_ACTION.format(action)
+    handler, verb = entry
+    goal_id = inp.get("goal_id")
+    if not goal_id:
+        return f"Please provide goal_id to {verb}. Call get_goals to find IDs."
+    return await handler(registry, inp, user_id, int(goal_id))
 
 
 async def exec_get_memory_summary(registry: ToolRegistry, user_id: int) -> str:
@@ -423,6 +473,11 @@ async def exec_get_memory_summary(registry: ToolRegistry, user_id: int) -> str:
     if registry._knowledge_store is None:
         return "Memory system not available."
 
+    key = (user_id, "memory_summary")
+    cached = registry._summary_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
         summary = await registry._knowledge_store.get_memory_summary(user_id)
     except Exception as e:
@@ -440,7 +495,7 @@ async def exec_get_memory_summary(registry: ToolRegistry, user_id: int) -> str:
     lines.append(f"  Recent (last 7 days): {recent} facts")
 
     if categories:
-        cat_parts = [f"{cat} ({cnt})" for cat, cnt in list(categories.items())[:6]]
+        cat_parts = [f"{cat} ({cnt})" for cat, cnt in islice(categories.items(), 6)]
         lines.append(f"  Categories: {', '.join(cat_parts)}")
 
     if oldest:
@@ -455,4 +510,6 @@ async def exec_get_memory_summary(registry: ToolRegistry, user_id: int) -> str:
     if stale > 0:
         lines.append(f"  ⚠️ Potentially stale (>90 days, not referenced): {stale} facts")
 
-    return "\n".join(lines)
+    output = "\n".join(lines)
+    registry._summary_cache.set(key, output)
+    return output
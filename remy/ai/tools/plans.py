@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable, Iterator
+from functools import wraps
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,12 +12,42 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_STATUS_EMOJI = {
+    "pending": "⬜",
+    "in_progress": "🔄",
+    "done": "✅",
+    "skipped": "⏭️",
+    "blocked": "🚫",
+}
 
+_MSG_PLAN_NA = "Plan tracking not available."
+
+# Step statuses shown in list_plans progress summaries, in display order.
+_PROGRESS_LABELS = (
+    ("done", "done"),
+    ("in_progress", "in progress"),
+    ("pending", "pending"),
+    ("blocked", "blocked"),
+)
+
+
+def _requires_plan_store(
+    func: Callable[..., Awaitable[str]],
+) -> Callable[..., Awaitable[str]]:
+    """Return _MSG_PLAN_NA without running the executor when no plan store is set."""
+
+    @wraps(func)
+    async def wrapper(registry: ToolRegistry, *args, **kwargs) -> str:
+        if registry._plan_store is None:
+            return _MSG_PLAN_NA
+        return await func(registry, *args, **kwargs)
+
+    return wrapper
+
+
+@_requires_plan_store
 async def exec_create_plan(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Create a new multi-step plan."""
-    if registry._plan_store is None:
-        return "Plan tracking not available."
-
     title = inp.get("title", "").strip()
     description = inp.get("description", "").strip() or None
     steps = inp.get("steps", [])
@@ -81,11 +113,9 @@ async def exec_create_plan(registry: ToolRegistry, inp: dict, user_id: int) -> s
     )
 
 
+@_requires_plan_store
 async def exec_get_plan(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Retrieve a plan by ID or title."""
-    if registry._plan_store is None:
-        return "Plan tracking not available."
-
     plan_id = inp.get("plan_id")
     title = inp.get("title", "").strip()
 
@@ -123,49 +153,39 @@ async def exec_get_plan(registry: ToolRegistry, inp: dict, user_id: int) -> str:
         except Exception:
             pass
 
-    _STATUS_EMOJI = {
-        "pending": "⬜",
-        "in_progress": "🔄",
-        "done": "✅",
-        "skipped": "⏭️",
-        "blocked": "🚫",
-    }
-
-    lines = [
-        f"📋 **{plan['title']}** (ID {plan['id']})",
-        f"Status: {plan['status']}",
-    ]
+    return "\n".join(_iter_plan_lines(plan))
+
+
+def _iter_plan_lines(plan: dict) -> Iterator[str]:
+    """Yield the get_plan output lines: header, then each step and its attempts."""
+    yield f"📋 **{plan['title']}** (ID {plan['id']})"
+    yield f"Status: {plan['status']}"
     if plan.get("goal_title"):
-        lines.append(f"Goal: {plan['goal_title']} (ID {plan.get('goal_id')})")
+        yield f"Goal: {plan['goal_title']} (ID {plan.get('goal_id')})"
     if plan.get("description"):
-        lines.append(f"Description: {plan['description']}")
-    lines.append(
-        f"Created: {plan['created_at'][:10]} | Updated: {plan['updated_at'][:10]}"
-    )
-    lines.append("")
+        yield f"Description: {plan['description']}"
+    yield f"Created: {plan['created_at'][:10]} | Updated: {plan['updated_at'][:10]}"
+    yield ""
 
     for step in plan.get("steps", []):
         emoji = _STATUS_EMOJI.get(step["status"], "❓")
-        lines.append(
-            f"{step['position']}. {emoji} [{step['status']}] {step['title']} (step ID {step['id']})"
-        )
+        yield f"{step['position']}. {emoji} [{step['status']}] {step['title']} (step ID {step['id']})"
         if step.get("notes"):
-            lines.append(f"   Notes: {step['notes']}")
+            yield f"   Notes: {step['notes']}"
         for attempt in step.get("attempts", []):
-            lines.append(
-                f"   → {attempt['attempted_at'][:16]}: {attempt['outcome']}"
-                + (f" — {attempt['notes']}" if attempt.get("notes") else "")
+            yield f"   → {attempt['attempted_at'][:16]}: {attempt['outcome']}" + (
+                f" — {attempt['notes']}" if attempt.get("notes") else ""
             )
 
-    return "\n".join(lines)
-
 
+@_requires_plan_store
 async def exec_list_plans(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """List the user's plans with step progress and last activity."""
-    if registry._plan_store is None:
-        return "Plan tracking not available."
-
     status = inp.get("status", "active")
+    key = (user_id, "list_plans", status)
+    cached = registry._summary_cache.get(key)
+    if cached is not None:
+        return cached
 
     try:
         plans = await registry._plan_store.list_plans(user_id, status)
@@ -195,43 +215,36 @@ async def exec_list_plans(registry: ToolRegistry, inp: dict, user_id: int) -> st
             return "No plans found. Use create_plan to make one."
         return f"No {status} plans found. Use create_plan to make one, or list_plans with status='all' to see all."
 
-    lines = [f"📋 Plans ({status}): {len(plans)}"]
-    lines.append("")
+    lines = [f"📋 Plans ({status}): {len(plans)}", ""]
 
     for plan in plans:
         counts = plan.get("step_counts", {})
-        done = counts.get("done", 0)
-        in_progress = counts.get("in_progress", 0)
-        pending = counts.get("pending", 0)
-        blocked = counts.get("blocked", 0)
-        total = plan.get("total_steps", 0)
-
-        progress_parts = []
-        if done:
-            progress_parts.append(f"{done} done")
-        if in_progress:
-            progress_parts.append(f"{in_progress} in progress")
-        if pending:
-            progress_parts.append(f"{pending} pending")
-        if blocked:
-            progress_parts.append(f"{blocked} blocked")
-        progress = ", ".join(progress_parts) if progress_parts else "no steps"
+        progress = (
+            ", ".join(
+                f"{counts[s]} {label}" for s, label in _PROGRESS_LABELS if counts.get(s)
+            )
+            or "no steps"
+        )
 
         lines.append(f"**{plan['title']}** (ID {plan['id']})")
         if plan.get("goal_title"):
             lines.append(f"  Goal: {plan['goal_title']}")
-        lines.append(f"  [{total} steps — {progress}]")
-        lines.append(f"  Last activity: {plan['updated_at'][:10]}")
-        lines.append("")
+        lines.extend(
+            (
+                f"  [{plan.get('total_steps', 0)} steps — {progress}]",
+                f"  Last activity: {plan['updated_at'][:10]}",
+                "",
+            )
+        )
 
-    return "\n".join(lines)
+    output = "\n".join(lines)
+    registry._summary_cache.set(key, output)
+    return output
 
 
+@_requires_plan_store
 async def exec_update_plan_step(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Update the status of a plan step and/or log a new attempt."""
-    if registry._plan_store is None:
-        return "Plan tracking not available."
-
     step_id = inp.get("step_id")
     status = inp.get("status")
     attempt_outcome = inp.get("attempt_outcome", "").strip()
@@ -274,13 +287,11 @@ async def exec_update_plan_step(registry: ToolRegistry, inp: dict, user_id: int)
     return f"✅ Step {step_id} updated: " + "; ".join(results)
 
 
+@_requires_plan_store
 async def exec_update_plan_status(
     registry: ToolRegistry, inp: dict, user_id: int
 ) -> str:
     """Mark an entire plan as complete or abandoned."""
-    if registry._plan_store is None:
-        return "Plan tracking not available."
-
     plan_id = inp.get("plan_id")
     status = inp.get("status")
 
@@ -304,11 +315,9 @@ async def exec_update_plan_status(
     return f"✅ Plan {plan_id} marked as {status}."
 
 
+@_requires_plan_store
 async def exec_update_plan(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Set or clear a plan's linked goal (goal–plan hierarchy)."""
-    if registry._plan_store is None:
-        return "Plan tracking not available."
-
     plan_id = inp.get("plan_id")
     if plan_id is None:
         return "Please provide plan_id. Use list_plans to find plan IDs."
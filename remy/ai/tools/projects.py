@@ -2,22 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 from datetime import datetime as _dt
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ...ai.input_validator import sanitize_file_path
+from ...config import settings
+from ...models import Fact
+
 if TYPE_CHECKING:
     from .registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
 
+def scan_tree(root: str) -> tuple[int, float]:
+    """
+    Return (file_count, latest_mtime) for every file under root.
+
+    One os.scandir pass with an explicit stack; DirEntry caches the type from
+    the directory read, so each file costs a single stat. Like Path.rglob,
+    symlinked directories are not descended into and unreadable ones are skipped.
+    """
+    count = 0
+    latest = 0.0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        count += 1
+                        latest = max(latest, entry.stat().st_mtime)
+        except OSError:
+            continue
+    return count, latest
+
+
+def describe_project(path: str) -> str:
+    """Status line for one tracked project path. Blocking — run in a thread."""
+    if not os.path.isdir(path):
+        return f"• {path} _(not found)_"
+    try:
+        file_count, latest = scan_tree(path)
+    except Exception as e:
+        logger.debug("Failed to get project stats for %s: %s", path, e)
+        return f"• {path}"
+    if not file_count:
+        return f"• {path}\n  (empty)"
+    mod_str = _dt.fromtimestamp(latest).strftime("%Y-%m-%d %H:%M")
+    return f"• {path}\n  {file_count} files, last modified {mod_str}"
+
+
+async def describe_projects(paths: list[str]) -> list[str]:
+    """Scan several project trees concurrently, one worker thread per path."""
+    return list(
+        await asyncio.gather(*(asyncio.to_thread(describe_project, p) for p in paths))
+    )
+
+
 async def exec_set_project(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Set a project directory to track."""
-    from ...ai.input_validator import sanitize_file_path
-    from ...config import settings
-
     path_arg = inp.get("path", "").strip()
     if not path_arg:
         return "Please provide a project path."
@@ -43,8 +93,6 @@ async def exec_set_project(registry: ToolRegistry, inp: dict, user_id: int) -> s
             metadata={"category": "project"},
         )
     elif registry._fact_store is not None:
-        from ...models import Fact
-
         fact = Fact(category="project", content=sanitized)
         await registry._fact_store.upsert(user_id, [fact])
 
@@ -70,25 +118,5 @@ async def exec_get_project_status(registry: ToolRegistry, user_id: int) -> str:
         return "No projects tracked yet. Tell me about a project to track it."
 
     lines = ["📁 Tracked projects:\n"]
-    for f in facts:
-        path = f.get("content", "")
-        p = Path(path)
-        if p.is_dir():
-            try:
-                all_files = [x for x in p.rglob("*") if x.is_file()]
-                file_count = len(all_files)
-                if all_files:
-                    latest = max(x.stat().st_mtime for x in all_files)
-                    mod_str = _dt.fromtimestamp(latest).strftime("%Y-%m-%d %H:%M")
-                    lines.append(
-                        f"• {path}\n  {file_count} files, last modified {mod_str}"
-                    )
-                else:
-                    lines.append(f"• {path}\n  (empty)")
-            except Exception as e:
-                logger.debug("Failed to get project stats for %s: %s", path, e)
-                lines.append(f"• {path}")
-        else:
-            lines.append(f"• {path} _(not found)_")
-
+    lines.extend(await describe_projects([f.get("content", "") for f in facts]))
     return "\n".join(lines)
@@ -7,9 +7,19 @@ tool executor functions and dispatches tool calls from the Anthropic API.
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import inspect
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
+import httpx
+
+from ...exceptions import RemyError
+from ...utils.ttl_cache import TTLCache
 from .context import ToolContext
 from .schemas import TOOL_SCHEMAS
 
@@ -19,6 +29,240 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _HandlerSpec:
+    """
+    Where a tool's executor lives and which dispatch arguments it takes.
+
+    Every executor receives the registry first, then (in this order) whichever
+    of tool_input, user_id, chat_id and message_id its flags ask for. Modules
+    are imported on first call, as the executors import the registry.
+    """
+
+    module: str
+    fn: str
+    needs_input: bool = True
+    needs_user: bool = False
+    needs_chat: bool = False
+    needs_message: bool = False
+
+
+# Called as handler(registry, tool_input, user_id, chat_id, message_id); may
+# return a coroutine (most executors) or a plain string (get_current_time).
+_Handler = Callable[["ToolRegistry", dict, int, "int | None", "int | None"], Any]
+
+# Bad-input failures (int("abc"), missing keys) are routine when the model
+# guesses arguments; log them without a traceback.
+_BENIGN_EXCS = (ValueError, LookupError)
+
+_HANDLER_SPECS: dict[str, _HandlerSpec] = {
+    # Time
+    "get_current_time": _HandlerSpec(
+        "time", "exec_get_current_time", needs_input=False
+    ),
+    # Memory / status
+    "get_logs": _HandlerSpec("memory", "exec_get_logs"),
+    "get_goals": _HandlerSpec("memory", "exec_get_goals", needs_user=True),
+    "get_facts": _HandlerSpec("memory", "exec_get_facts", needs_user=True),
+    "run_board": _HandlerSpec("memory", "exec_run_board", needs_user=True),
+    "check_status": _HandlerSpec("memory", "exec_check_status", needs_input=False),
+    "manage_memory": _HandlerSpec("memory", "exec_manage_memory", needs_user=True),
+    "para_write_note": _HandlerSpec("memory", "exec_para_write_note"),
+    "manage_goal": _HandlerSpec("memory", "exec_manage_goal", needs_user=True),
+    "get_memory_summary": _HandlerSpec(
+        "memory", "exec_get_memory_summary", needs_input=False, needs_user=True
+    ),
+    "get_counter": _HandlerSpec("counters", "exec_get_counter", needs_user=True),
+    "set_counter": _HandlerSpec("counters", "exec_set_counter", needs_user=True),
+    "increment_counter": _HandlerSpec(
+        "counters", "exec_increment_counter", needs_user=True
+    ),
+    "reset_counter": _HandlerSpec("counters", "exec_reset_counter", needs_user=True),
+    # Calendar
+    "calendar_events": _HandlerSpec("calendar", "exec_calendar_events"),
+    "create_calendar_event": _HandlerSpec("calendar", "exec_create_calendar_event"),
+    # Email
+    "read_emails": _HandlerSpec("email", "exec_read_emails"),
+    "search_gmail": _HandlerSpec("email", "exec_search_gmail"),
+    "read_email": _HandlerSpec("email", "exec_read_email"),
+    "list_gmail_labels": _HandlerSpec("email", "exec_list_gmail_labels"),
+    "label_emails": _HandlerSpec("email", "exec_label_emails"),
+    "create_gmail_label": _HandlerSpec("email", "exec_create_gmail_label"),
+    "create_email_draft": _HandlerSpec("email", "exec_create_email_draft"),
+    "classify_promotional_emails": _HandlerSpec(
+        "email", "exec_classify_promotional_emails"
+    ),
+    # Contacts
+    "search_contacts": _HandlerSpec("contacts", "exec_search_contacts"),
+    "upcoming_birthdays": _HandlerSpec("contacts", "exec_upcoming_birthdays"),
+    "get_contact_details": _HandlerSpec("contacts", "exec_get_contact_details"),
+    "update_contact_note": _HandlerSpec("contacts", "exec_update_contact_note"),
+    "find_sparse_contacts": _HandlerSpec(
+        "contacts", "exec_find_sparse_contacts", needs_input=False
+    ),
+    # Files
+    "read_file": _HandlerSpec("files", "exec_read_file"),
+    "get_file_download_link": _HandlerSpec("files", "exec_get_file_download_link"),
+    "list_directory": _HandlerSpec("files", "exec_list_directory"),
+    "write_file": _HandlerSpec("files", "exec_write_file"),
+    "append_file": _HandlerSpec("files", "exec_append_file"),
+    "find_files": _HandlerSpec("files", "exec_find_files"),
+    "scan_downloads": _HandlerSpec("files", "exec_scan_downloads", needs_input=False),
+    "organize_directory": _HandlerSpec("files", "exec_organize_directory"),
+    "clean_directory": _HandlerSpec("files", "exec_clean_directory"),
+    "search_files": _HandlerSpec("files", "exec_search_files"),
+    "index_status": _HandlerSpec("files", "exec_index_status", needs_input=False),
+    # Git (read-only)
+    "git_log": _HandlerSpec("git", "exec_git_log"),
+    "git_show_commit": _HandlerSpec("git", "exec_git_show_commit"),
+    "git_diff": _HandlerSpec("git", "exec_git_diff"),
+    "git_status": _HandlerSpec("git", "exec_git_status"),
+    # Web
+    "web_search": _HandlerSpec("web", "exec_web_search"),
+    "hand_off_to_researcher": _HandlerSpec(
+        "web", "exec_hand_off_to_researcher", needs_user=True
+    ),
+    "triage_inbox": _HandlerSpec("email", "exec_triage_inbox", needs_user=True),
+    "price_check": _HandlerSpec("web", "exec_price_check"),
+    # Automations
+    "schedule_reminder": _HandlerSpec(
+        "automations", "exec_schedule_reminder", needs_user=True
+    ),
+    "list_reminders": _HandlerSpec(
+        "automations", "exec_list_reminders", needs_input=False, needs_user=True
+    ),
+    "remove_reminder": _HandlerSpec(
+        "automations", "exec_remove_reminder", needs_user=True
+    ),
+    "set_one_time_reminder": _HandlerSpec(
+        "automations", "exec_set_one_time_reminder", needs_user=True
+    ),
+    "breakdown_task": _HandlerSpec("automations", "exec_breakdown_task"),
+    "grocery_list": _HandlerSpec("automations", "exec_grocery_list", needs_user=True),
+    # Plans
+    "create_plan": _HandlerSpec("plans", "exec_create_plan", needs_user=True),
+    "get_plan": _HandlerSpec("plans", "exec_get_plan", needs_user=True),
+    "list_plans": _HandlerSpec("plans", "exec_list_plans", needs_user=True),
+    "update_plan_step": _HandlerSpec("plans", "exec_update_plan_step", needs_user=True),
+    "update_plan_status": _HandlerSpec(
+        "plans", "exec_update_plan_status", needs_user=True
+    ),
+    "update_plan": _HandlerSpec("plans", "exec_update_plan", needs_user=True),
+    # Analytics
+    "get_stats": _HandlerSpec("analytics", "exec_get_stats", needs_user=True),
+    "get_goal_status": _HandlerSpec(
+        "analytics", "exec_get_goal_status", needs_input=False, needs_user=True
+    ),
+    "generate_retrospective": _HandlerSpec(
+        "analytics", "exec_generate_retrospective", needs_user=True
+    ),
+    "consolidate_memory": _HandlerSpec(
+        "analytics", "exec_consolidate_memory", needs_input=False, needs_user=True
+    ),
+    "list_background_jobs": _HandlerSpec(
+        "analytics", "exec_list_background_jobs", needs_user=True
+    ),
+    "get_sms_messages": _HandlerSpec(
+        "sms_wallet", "exec_get_sms_messages", needs_user=True
+    ),
+    "get_wallet_transactions": _HandlerSpec(
+        "sms_wallet", "exec_get_wallet_transactions", needs_user=True
+    ),
+    "get_costs": _HandlerSpec("analytics", "exec_get_costs", needs_user=True),
+    # Google Docs
+    "read_gdoc": _HandlerSpec("docs", "exec_read_gdoc", needs_user=True),
+    "append_to_gdoc": _HandlerSpec("docs", "exec_append_to_gdoc", needs_user=True),
+    # Bookmarks
+    "save_bookmark": _HandlerSpec("bookmarks", "exec_save_bookmark", needs_user=True),
+    "list_bookmarks": _HandlerSpec("bookmarks", "exec_list_bookmarks", needs_user=True),
+    # Projects
+    "set_project": _HandlerSpec("projects", "exec_set_project", needs_user=True),
+    "get_project_status": _HandlerSpec(
+        "projects", "exec_get_project_status", needs_input=False, needs_user=True
+    ),
+    # Session / Privacy
+    "compact_conversation": _HandlerSpec(
+        "session", "exec_compact_conversation", needs_input=False, needs_user=True
+    ),
+    "delete_conversation": _HandlerSpec(
+        "session", "exec_delete_conversation", needs_input=False, needs_user=True
+    ),
+    "set_proactive_chat": _HandlerSpec(
+        "session",
+        "exec_set_proactive_chat",
+        needs_input=False,
+        needs_user=True,
+        needs_chat=True,
+    ),
+    "end_session": _HandlerSpec("session", "exec_end_session", needs_user=True),
+    "help": _HandlerSpec("session", "exec_help", needs_user=True),
+    # Special tools
+    "trigger_reindex": _HandlerSpec(
+        "session", "exec_trigger_reindex", needs_input=False
+    ),
+    "start_privacy_audit": _HandlerSpec(
+        "session", "exec_start_privacy_audit", needs_input=False
+    ),
+    "react_to_message": _HandlerSpec(
+        "session", "exec_react_to_message", needs_chat=True, needs_message=True
+    ),
+    "run_claude_code": _HandlerSpec(
+        "claude_code", "exec_run_claude_code", needs_user=True
+    ),
+    "run_python": _HandlerSpec("run_python", "exec_run_python", needs_user=True),
+    "suggest_actions": _HandlerSpec(
+        "session", "exec_suggest_actions", needs_input=False
+    ),
+}
+
+
+def _specialise(spec: _HandlerSpec) -> _Handler:
+    """Build the dispatch closure for one tool from its calling convention."""
+    module = f"{__package__}.{spec.module}"
+
+    def fn():
+        return getattr(importlib.import_module(module), spec.fn)
+
+    match (spec.needs_input, spec.needs_user, spec.needs_chat, spec.needs_message):
+        case (False, False, False, False):
+            return lambda reg, inp, uid, cid, mid: fn()(reg)
+        case (True, False, False, False):
+            return lambda reg, inp, uid, cid, mid: fn()(reg, inp)
+        case (True, True, False, False):
+            return lambda reg, inp, uid, cid, mid: fn()(reg, inp, uid)
+        case (False, True, False, False):
+            return lambda reg, inp, uid, cid, mid: fn()(reg, uid)
+        case (False, True, True, False):
+            return lambda reg, inp, uid, cid, mid: fn()(reg, uid, cid)
+        case (True, False, True, True):
+            return lambda reg, inp, uid, cid, mid: fn()(reg, inp, cid, mid)
+        case _:
+            raise ValueError(f"Unsupported calling convention for {spec.fn}")
+
+
+# Tools that write to the knowledge store or plans; running one drops cached
+# summaries.
+_SUMMARY_WRITE_TOOLS = frozenset(
+    {
+        "manage_memory",
+        "manage_goal",
+        "consolidate_memory",
+        "save_bookmark",
+        "set_project",
+        "grocery_list",
+        "create_plan",
+        "update_plan_step",
+        "update_plan_status",
+        "update_plan",
+    }
+)
+
+# Built once per process and shared by every ToolRegistry instance.
+_HANDLERS: dict[str, _Handler] = {
+    name: _specialise(spec) for name, spec in _HANDLER_SPECS.items()
+}
+
+
 class ToolRegistry:
     """
     Holds references to all tool executor functions and dispatches tool calls
@@ -34,6 +278,42 @@ class ToolRegistry:
         self._current_bot = None
         self._current_chat_id: int | None = None
         self._current_thread_id: int | None = None
+        # Shared keep-alive client for local HTTP probes (Ollama); created lazily
+        self._http_client: httpx.AsyncClient | None = None
+        # Gmail label name (lowercased) → (label ID, expiry monotonic timestamp)
+        self._label_id_cache: dict[str, tuple[str | None, float]] = {}
+        # (session start line, session start timestamp, log file identity)
+        self._session_start_cache: tuple[int, datetime | None, tuple] | None = None
+        # Formatted results for repeat web_search / price_check queries
+        self._web_search_cache: TTLCache[str] = TTLCache(maxsize=512, ttl=300)
+        self._price_check_cache: TTLCache[str] = TTLCache(maxsize=512, ttl=300)
+        # Formatted memory/goal/plan/stats summaries, keyed by (user_id, tool, *args);
+        # cleared whenever a _SUMMARY_WRITE_TOOLS tool runs
+        self._summary_cache: TTLCache[str] = TTLCache(maxsize=128, ttl=10)
+        # Formatted Google reads, keyed by (tool, *args); each is cleared by the
+        # tool that writes to the same backend
+        self._calendar_cache: TTLCache[str] = TTLCache(maxsize=64, ttl=60)
+        self._contacts_cache: TTLCache[str] = TTLCache(maxsize=256, ttl=300)
+        self._gdoc_cache: TTLCache[str] = TTLCache(maxsize=32, ttl=600)
+        # Per-backend caps on in-flight outbound calls from tool executors
+        self._sem_gmail = asyncio.Semaphore(4)
+        self._sem_calendar = asyncio.Semaphore(4)
+        self._sem_ollama = asyncio.Semaphore(2)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=2.0,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Release pooled connections. Safe to call more than once."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     @property
     def _logs_dir(self) -> str:
@@ -164,387 +444,22 @@ class ToolRegistry:
             tool_name,
             user_id,
         )
+        handler = _HANDLERS.get(tool_name)
+        if handler is None:
+            return f"Unknown tool: {tool_name}"
         try:
-            match tool_name:
-                # Time
-                case "get_current_time":
-                    from .time import exec_get_current_time
-
-                    return exec_get_current_time(self)
-
-                # Memory / status
-                case "get_logs":
-                    from .memory import exec_get_logs
-
-                    return await exec_get_logs(self, tool_input)
-                case "get_goals":
-                    from .memory import exec_get_goals
-
-                    return await exec_get_goals(self, tool_input, user_id)
-                case "get_facts":
-                    from .memory import exec_get_facts
-
-                    return await exec_get_facts(self, tool_input, user_id)
-                case "run_board":
-                    from .memory import exec_run_board
-
-                    return await exec_run_board(self, tool_input, user_id)
-                case "check_status":
-                    from .memory import exec_check_status
-
-                    return await exec_check_status(self)
-                case "manage_memory":
-                    from .memory import exec_manage_memory
-
-                    return await exec_manage_memory(self, tool_input, user_id)
-                case "para_write_note":
-                    from .memory import exec_para_write_note
-
-                    return await exec_para_write_note(self, tool_input)
-                case "manage_goal":
-                    from .memory import exec_manage_goal
-
-                    return await exec_manage_goal(self, tool_input, user_id)
-                case "get_memory_summary":
-                    from .memory import exec_get_memory_summary
-
-                    return await exec_get_memory_summary(self, user_id)
-                case "get_counter":
-                    from .counters import exec_get_counter
-
-                    return await exec_get_counter(self, tool_input, user_id)
-                case "set_counter":
-                    from .counters import exec_set_counter
-
-                    return await exec_set_counter(self, tool_input, user_id)
-                case "increment_counter":
-                    from .counters import exec_increment_counter
-
-                    return await exec_increment_counter(self, tool_input, user_id)
-                case "reset_counter":
-                    from .counters import exec_reset_counter
-
-                    return await exec_reset_counter(self, tool_input, user_id)
-
-                # Calendar
-                case "calendar_events":
-                    from .calendar import exec_calendar_events
-
-                    return await exec_calendar_events(self, tool_input)
-                case "create_calendar_event":
-                    from .calendar import exec_create_calendar_event
-
-                    return await exec_create_calendar_event(self, tool_input)
-
-                # Email
-                case "read_emails":
-                    from .email import exec_read_emails
-
-                    return await exec_read_emails(self, tool_input)
-                case "search_gmail":
-                    from .email import exec_search_gmail
-
-                    return await exec_search_gmail(self, tool_input)
-                case "read_email":
-                    from .email import exec_read_email
-
-                    return await exec_read_email(self, tool_input)
-                case "list_gmail_labels":
-                    from .email import exec_list_gmail_labels
-
-                    return await exec_list_gmail_labels(self, tool_input)
-                case "label_emails":
-                    from .email import exec_label_emails
-
-                    return await exec_label_emails(self, tool_input)
-                case "create_gmail_label":
-                    from .email import exec_create_gmail_label
-
-                    return await exec_create_gmail_label(self, tool_input)
-                case "create_email_draft":
-                    from .email import exec_create_email_draft
-
-                    return await exec_create_email_draft(self, tool_input)
-                case "classify_promotional_emails":
-                    from .email import exec_classify_promotional_emails
-
-                    return await exec_classify_promotional_emails(self, tool_input)
-
-                # Contacts
-                case "search_contacts":
-                    from .contacts import exec_search_contacts
-
-                    return await exec_search_contacts(self, tool_input)
-                case "upcoming_birthdays":
-                    from .contacts import exec_upcoming_birthdays
-
-                    return await exec_upcoming_birthdays(self, tool_input)
-                case "get_contact_details":
-                    from .contacts import exec_get_contact_details
-
-                    return await exec_get_contact_details(self, tool_input)
-                case "update_contact_note":
-                    from .contacts import exec_update_contact_note
-
-                    return await exec_update_contact_note(self, tool_input)
-                case "find_sparse_contacts":
-                    from .contacts import exec_find_sparse_contacts
-
-                    return await exec_find_sparse_contacts(self)
-
-                # Files
-                case "read_file":
-                    from .files import exec_read_file
-
-                    return await exec_read_file(self, tool_input)
-                case "get_file_download_link":
-                    from .files import exec_get_file_download_link
-
-                    return await exec_get_file_download_link(self, tool_input)
-                case "list_directory":
-                    from .files import exec_list_directory
-
-                    return await exec_list_directory(self, tool_input)
-                case "write_file":
-                    from .files import exec_write_file
-
-                    return await exec_write_file(self, tool_input)
-                case "append_file":
-                    from .files import exec_append_file
-
-                    return await exec_append_file(self, tool_input)
-                case "find_files":
-                    from .files import exec_find_files
-
-                    return await exec_find_files(self, tool_input)
-                case "scan_downloads":
-                    from .files import exec_scan_downloads
-
-                    return await exec_scan_downloads(self)
-                case "organize_directory":
-                    from .files import exec_organize_directory
-
-                    return await exec_organize_directory(self, tool_input)
-                case "clean_directory":
-                    from .files import exec_clean_directory
-
-                    return await exec_clean_directory(self, tool_input)
-                case "search_files":
-                    from .files import exec_search_files
-
-                    return await exec_search_files(self, tool_input)
-                case "index_status":
-                    from .files import exec_index_status
-
-                    return await exec_index_status(self)
-
-                # Git (read-only)
-                case "git_log":
-                    from .git import exec_git_log
-
-                    return await exec_git_log(self, tool_input)
-                case "git_show_commit":
-                    from .git import exec_git_show_commit
-
-                    return await exec_git_show_commit(self, tool_input)
-                case "git_diff":
-                    from .git import exec_git_diff
-
-                    return await exec_git_diff(self, tool_input)
-                case "git_status":
-                    from .git import exec_git_status
-
-                    return await exec_git_status(self, tool_input)
-
-                # Web
-                case "web_search":
-                    from .web import exec_web_search
-
-                    return await exec_web_search(self, tool_input)
-                case "hand_off_to_researcher":
-                    from .web import exec_hand_off_to_researcher
-
-                    return await exec_hand_off_to_researcher(self, tool_input, user_id)
-                case "triage_inbox":
-                    from .email import exec_triage_inbox
-
-                    return await exec_triage_inbox(self, tool_input, user_id)
-                case "price_check":
-                    from .web import exec_price_check
-
-                    return await exec_price_check(self, tool_input)
-
-                # Automations
-                case "schedule_reminder":
-                    from .automations import exec_schedule_reminder
-
-                    return await exec_schedule_reminder(self, tool_input, user_id)
-                case "list_reminders":
-                    from .automations import exec_list_reminders
-
-                    return await exec_list_reminders(self, user_id)
-                case "remove_reminder":
-                    from .automations import exec_remove_reminder
-
-                    return await exec_remove_reminder(self, tool_input, user_id)
-                case "set_one_time_reminder":
-                    from .automations import exec_set_one_time_reminder
-
-                    return await exec_set_one_time_reminder(self, tool_input, user_id)
-                case "breakdown_task":
-                    from .automations import exec_breakdown_task
-
-                    return await exec_breakdown_task(self, tool_input)
-                case "grocery_list":
-                    from .automations import exec_grocery_list
-
-                    return await exec_grocery_list(self, tool_input, user_id)
-
-                # Plans
-                case "create_plan":
-                    from .plans import exec_create_plan
-
-                    return await exec_create_plan(self, tool_input, user_id)
-                case "get_plan":
-                    from .plans import exec_get_plan
-
-                    return await exec_get_plan(self, tool_input, user_id)
-                case "list_plans":
-                    from .plans import exec_list_plans
-
-                    return await exec_list_plans(self, tool_input, user_id)
-                case "update_plan_step":
-                    from .plans import exec_update_plan_step
-
-                    return await exec_update_plan_step(self, tool_input, user_id)
-                case "update_plan_status":
-                    from .plans import exec_update_plan_status
-
-                    return await exec_update_plan_status(self, tool_input, user_id)
-                case "update_plan":
-                    from .plans import exec_update_plan
-
-                    return await exec_update_plan(self, tool_input, user_id)
-
-                # Analytics
-                case "get_stats":
-                    from .analytics import exec_get_stats
-
-                    return await exec_get_stats(self, tool_input, user_id)
-                case "get_goal_status":
-                    from .analytics import exec_get_goal_status
-
-                    return await exec_get_goal_status(self, user_id)
-                case "generate_retrospective":
-                    from .analytics import exec_generate_retrospective
-
-                    return await exec_generate_retrospective(self, tool_input, user_id)
-                case "consolidate_memory":
-                    from .analytics import exec_consolidate_memory
-
-                    return await exec_consolidate_memory(self, user_id)
-                case "list_background_jobs":
-                    from .analytics import exec_list_background_jobs
-
-                    return await exec_list_background_jobs(self, tool_input, user_id)
-                case "get_sms_messages":
-                    from .sms_wallet import exec_get_sms_messages
-
-                    return await exec_get_sms_messages(self, tool_input, user_id)
-                case "get_wallet_transactions":
-                    from .sms_wallet import exec_get_wallet_transactions
-
-                    return await exec_get_wallet_transactions(self, tool_input, user_id)
-                case "get_costs":
-                    from .analytics import exec_get_costs
-
-                    return await exec_get_costs(self, tool_input, user_id)
-
-                # Google Docs
-                case "read_gdoc":
-                    from .docs import exec_read_gdoc
-
-                    return await exec_read_gdoc(self, tool_input, user_id)
-                case "append_to_gdoc":
-                    from .docs import exec_append_to_gdoc
-
-                    return await exec_append_to_gdoc(self, tool_input, user_id)
-
-                # Bookmarks
-                case "save_bookmark":
-                    from .bookmarks import exec_save_bookmark
-
-                    return await exec_save_bookmark(self, tool_input, user_id)
-                case "list_bookmarks":
-                    from .bookmarks import exec_list_bookmarks
-
-                    return await exec_list_bookmarks(self, tool_input, user_id)
-
-                # Projects
-                case "set_project":
-                    from .projects import exec_set_project
-
-                    return await exec_set_project(self, tool_input, user_id)
-                case "get_project_status":
-                    from .projects import exec_get_project_status
-
-                    return await exec_get_project_status(self, user_id)
-
-                # Session / Privacy
-                case "compact_conversation":
-                    from .session import exec_compact_conversation
-
-                    return await exec_compact_conversation(self, user_id)
-                case "delete_conversation":
-                    from .session import exec_delete_conversation
-
-                    return await exec_delete_conversation(self, user_id)
-                case "set_proactive_chat":
-                    from .session import exec_set_proactive_chat
-
-                    return await exec_set_proactive_chat(self, user_id, chat_id)
-                case "end_session":
-                    from .session import exec_end_session
-
-                    return await exec_end_session(self, tool_input, user_id)
-                case "help":
-                    from .session import exec_help
-
-                    return await exec_help(self, tool_input, user_id)
-
-                # Special tools
-                case "trigger_reindex":
-                    from .session import exec_trigger_reindex
-
-                    return await exec_trigger_reindex(self)
-                case "start_privacy_audit":
-                    from .session import exec_start_privacy_audit
-
-                    return await exec_start_privacy_audit(self)
-                case "react_to_message":
-                    from .session import exec_react_to_message
-
-                    return await exec_react_to_message(
-                        self, tool_input, chat_id, message_id
-                    )
-                case "run_claude_code":
-                    from .claude_code import exec_run_claude_code
-
-                    return await exec_run_claude_code(self, tool_input, user_id)
-                case "run_python":
-                    from .run_python import exec_run_python
-
-                    return await exec_run_python(self, tool_input, user_id)
-                case "suggest_actions":
-                    return "Attached."
-
-                case _:
-                    return f"Unknown tool: {tool_name}"
-
+            result = handler(self, tool_input, user_id, chat_id, message_id)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except RemyError:
+            raise
+        except _BENIGN_EXCS as exc:
+            logger.warning("Tool %s failed: %s", tool_name, exc)
+            return f"Tool {tool_name} encountered an error: {exc}"
         except Exception as exc:
-            from ...exceptions import RemyError
-
-            if isinstance(exc, RemyError):
-                raise
             logger.error("Tool %s failed: %s", tool_name, exc, exc_info=True)
             return f"Tool {tool_name} encountered an error: {exc}"
+        finally:
+            if tool_name in _SUMMARY_WRITE_TOOLS:
+                self._summary_cache.clear()
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from ...config import save_primary_chat_id
+
 if TYPE_CHECKING:
     from .registry import ToolRegistry
 
@@ -40,10 +43,8 @@ async def exec_set_proactive_chat(
             "Please use the /setmychat command directly to set this chat for briefings."
         )
 
-    from ...config import save_primary_chat_id
-
     try:
-        save_primary_chat_id(chat_id)
+        await asyncio.to_thread(save_primary_chat_id, chat_id)
         return f"✅ This chat is now set for proactive messages (ID: {chat_id})"
     except OSError as e:
         return f"❌ Could not save chat setting: {e}"
@@ -176,9 +177,14 @@ async def exec_react_to_message(
         return f"Could not set reaction: {exc}"
 
 
+def exec_suggest_actions(registry: ToolRegistry) -> str:
+    """Acknowledge suggest_actions; the chat handler reads the buttons from the tool input."""
+    return "Attached."
+
+
 async def exec_help(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     """Show available tools and their descriptions."""
-    from .schemas import TOOL_SCHEMAS
+    from .schemas import TOOL_SPECS, TOOL_SPECS_BY_NAME
 
     category = inp.get("category", "").strip().lower()
 
@@ -254,11 +260,14 @@ async def exec_help(registry: ToolRegistry, inp: dict, user_id: int) -> str:
     }
 
     if category and category in _CATEGORY_MAP:
-        tool_names = set(_CATEGORY_MAP[category])
-        filtered = [t for t in TOOL_SCHEMAS if t["name"] in tool_names]
+        filtered = [
+            TOOL_SPECS_BY_NAME[name]
+            for name in _CATEGORY_MAP[category]
+            if name in TOOL_SPECS_BY_NAME
+        ]
         lines = [f"**{category.title()} Tools** ({len(filtered)}):\n"]
         for tool in filtered:
-            lines.append(f"• **{tool['name']}**: {tool['description'][:100]}")
+            lines.append(f"• **{tool.name}**: {tool.description[:100]}")
         return "\n".join(lines)
 
     lines = ["**Available Tool Categories:**\n"]
@@ -266,6 +275,6 @@ async def exec_help(registry: ToolRegistry, inp: dict, user_id: int) -> str:
         lines.append(f"• **{cat}** ({len(tools)} tools)")
 
     lines.append("\n\nUse `help(category='...')` to see tools in a specific category.")
-    lines.append(f"\nTotal tools available: {len(TOOL_SCHEMAS)}")
+    lines.append(f"\nTotal tools available: {len(TOOL_SPECS)}")
 
     return "\n".join(lines)
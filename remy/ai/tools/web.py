@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from ...web.search import format_results, web_search
+
 if TYPE_CHECKING:
     from .registry import ToolRegistry
 
@@ -13,15 +15,20 @@ logger = logging.getLogger(__name__)
 
 async def exec_web_search(registry: ToolRegistry, inp: dict) -> str:
     """Search the web using DuckDuckGo and return results."""
-    from ...web.search import web_search, format_results
     query = inp.get("query", "").strip()
     if not query:
         return "No search query provided."
     max_results = min(int(inp.get("max_results", 5)), 10)
-    results = await web_search(query, max_results=max_results)
-    if not results:
-        return "Search unavailable or no results. Try a different query."
-    return f"Search results for '{query}':\n\n" + format_results(results)
+    # Only the formatted results are cached; the header echoes this caller's query.
+    key = (query.lower(), max_results)
+    body = registry._web_search_cache.get(key)
+    if body is None:
+        results = await web_search(query, max_results=max_results)
+        if not results:
+            return "Search unavailable or no results. Try a different query."
+        body = format_results(results)
+        registry._web_search_cache.set(key, body)
+    return f"Search results for '{query}':\n\n{body}"
 
 
 async def exec_hand_off_to_researcher(
@@ -44,12 +51,15 @@ async def exec_hand_off_to_researcher(
 
 async def exec_price_check(registry: ToolRegistry, inp: dict) -> str:
     """Search for current prices of a product or service."""
-    from ...web.search import web_search, format_results
     item = inp.get("item", "").strip()
     if not item:
         return "No item specified."
-    query = f"{item} price Australia 2025"
-    results = await web_search(query, max_results=5)
-    if not results:
-        return f"Could not find price information for '{item}'."
-    return f"Price check for '{item}':\n\n" + format_results(results)
+    key = item.lower()
+    body = registry._price_check_cache.get(key)
+    if body is None:
+        results = await web_search(f"{item} price Australia 2025", max_results=5)
+        if not results:
+            return f"Could not find price information for '{item}'."
+        body = format_results(results)
+        registry._price_check_cache.set(key, body)
+    return f"Price check for '{item}':\n\n{body}"
@@ -8,13 +8,13 @@ Used by TUI runner and (optionally) Telegram chat handler.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Awaitable, Callable
 from zoneinfo import ZoneInfo
 
+from ..ai.json_utils import dumps as json_dumps
 from ..bot.handlers.base import (
     _build_message_from_turn,
     _sanitize_messages_for_claude,
@@ -141,7 +141,7 @@ class MessageProcessingService:
         from ..constants import TOOL_TURN_PREFIX
 
         for assistant_blocks, result_blocks in tool_turns:
-            asst_serialised = TOOL_TURN_PREFIX + json.dumps(assistant_blocks)
+            asst_serialised = TOOL_TURN_PREFIX + json_dumps(assistant_blocks)
             await conv_store.append_turn(
                 user_id,
                 session_key,
@@ -151,7 +151,7 @@ class MessageProcessingService:
                     model_used=f"anthropic:{settings.model_complex}",
                 ),
             )
-            usr_serialised = TOOL_TURN_PREFIX + json.dumps(result_blocks)
+            usr_serialised = TOOL_TURN_PREFIX + json_dumps(result_blocks)
             await conv_store.append_turn(
                 user_id, session_key, ConversationTurn(role="user", content=usr_serialised)
             )
@@ -27,6 +27,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_STATUS_EMOJI = {"queued": "⏳", "running": "🔄", "done": "✅", "failed": "❌"}
+
 
 def make_admin_handlers(
     *,
@@ -209,10 +211,10 @@ def make_admin_handlers(
         await update.message.chat.send_action(ChatAction.TYPING)
         sent = await update.message.reply_text("Loading goal status…")
         try:
-            active = await conversation_analyzer.get_active_goals_with_age(user_id)
             since = datetime.now(timezone.utc) - timedelta(days=30)
-            completed = await conversation_analyzer.get_completed_goals_since(
-                user_id, since
+            active, completed = await asyncio.gather(
+                conversation_analyzer.get_active_goals_with_age(user_id),
+                conversation_analyzer.get_completed_goals_since(user_id, since),
             )
             msg = conversation_analyzer.format_goal_status_message(active, completed)
             await sent.edit_text(msg, parse_mode="Markdown")
@@ -285,7 +287,6 @@ def make_admin_handlers(
             await update.message.reply_text("No background jobs yet.")
             return
 
-        _STATUS_EMOJI = {"queued": "⏳", "running": "🔄", "done": "✅", "failed": "❌"}
         lines = ["📋 *Recent background jobs:*\n"]
         for job in jobs:
             emoji = _STATUS_EMOJI.get(job["status"], "❓")
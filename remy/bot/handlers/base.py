@@ -14,18 +14,8 @@ from typing import TYPE_CHECKING
 
 from telegram import Update
 
+from ...ai import json_utils
 from ...ai.input_validator import RateLimiter
-
-# Use orjson when available for faster message serialisation in token estimation
-try:
-    import orjson
-
-    def _msg_to_json(m: dict) -> str:
-        return orjson.dumps(m).decode("utf-8")
-except ImportError:
-
-    def _msg_to_json(m: dict) -> str:
-        return json.dumps(m, ensure_ascii=False)
 from ...config import settings
 from ...constants import TOOL_TURN_PREFIX
 from ...utils.tokens import estimate_tokens
@@ -83,7 +73,7 @@ def _build_message_from_turn(turn: "ConversationTurn") -> dict:
     """
     if turn.content.startswith(_TOOL_TURN_PREFIX):
         try:
-            blocks = json.loads(turn.content[len(_TOOL_TURN_PREFIX) :])
+            blocks = json_utils.loads(turn.content[len(_TOOL_TURN_PREFIX) :])
             return {"role": turn.role, "content": blocks}
         except (json.JSONDecodeError, ValueError):
             pass
@@ -189,7 +179,7 @@ def _trim_messages_to_budget(messages: list[dict]) -> list[dict]:
     history_budget = _get_history_token_budget()
     hard_ceiling = settings.max_input_tokens_per_request
 
-    msg_tokens = [estimate_tokens(_msg_to_json(m)) for m in messages]
+    msg_tokens = [estimate_tokens(json_utils.dumps(m)) for m in messages]
     total_tokens = sum(msg_tokens)
 
     if total_tokens > hard_ceiling * 0.9:
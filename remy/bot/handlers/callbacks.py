@@ -718,6 +718,7 @@ def make_callback_handler(
                 msg = query.message
                 try:
                     from ...ai.input_validator import sanitize_file_path
+                    from ...ai.tools.files import forget_dir_files
 
                     safe_path, err = sanitize_file_path(
                         path, settings.allowed_base_dirs
@@ -731,6 +732,7 @@ def make_callback_handler(
                     if p.exists():
                         shutil.copy2(str(p), str(p) + ".bak")
                     p.write_text(content, encoding="utf-8")
+                    forget_dir_files(safe_path)
                     size_kb = len(content.encode("utf-8")) / 1024
                     if msg:
                         await msg.reply_text(
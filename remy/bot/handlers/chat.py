@@ -9,7 +9,6 @@ from __future__ import annotations
 import asyncio
 import base64
 import io
-import json
 import logging
 import os
 import shutil
@@ -53,6 +52,7 @@ from ...ai.claude_client import (
     ToolStatusChunk,
     ToolTurnComplete,
 )
+from ...ai.json_utils import dumps as json_dumps
 from ...ai.input_validator import (
     validate_message_input,
     sanitize_memory_injection,
@@ -733,7 +733,7 @@ def make_chat_handlers(
 
         persistence_start = time.monotonic()
         for assistant_blocks, result_blocks in tool_turns:
-            asst_serialised = _TOOL_TURN_PREFIX + json.dumps(assistant_blocks)
+            asst_serialised = _TOOL_TURN_PREFIX + json_dumps(assistant_blocks)
             await conv_store.append_turn(
                 user_id,
                 session_key,
@@ -743,7 +743,7 @@ def make_chat_handlers(
                     model_used=f"anthropic:{settings.model_complex}",
                 ),
             )
-            usr_serialised = _TOOL_TURN_PREFIX + json.dumps(result_blocks)
+            usr_serialised = _TOOL_TURN_PREFIX + json_dumps(result_blocks)
             await conv_store.append_turn(
                 user_id,
                 session_key,
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from ...google.contacts import _extract_name, format_contact
 from .base import reject_unauthorized, google_not_configured
 
 if TYPE_CHECKING:
@@ -65,8 +66,6 @@ def make_contacts_handlers(
                 await update.message.reply_text("No contacts found.")
                 return
 
-        from ...google.contacts import format_contact
-
         lines = [f"👥 *{len(people)} contact(s):*\n"]
         for p in people[:20]:
             lines.append(format_contact(p))
@@ -102,8 +101,6 @@ def make_contacts_handlers(
         if not upcoming:
             await update.message.reply_text(f"🎂 No birthdays in the next {days} days.")
             return
-        from ...google.contacts import _extract_name
-
         lines = [f"🎂 *Upcoming birthdays (next {days} days):*\n"]
         for bday_date, person in upcoming:
             name = _extract_name(person) or "(unknown)"
@@ -127,7 +124,9 @@ def make_contacts_handlers(
             return
         query = " ".join(context.args)
         try:
-            people = await google_contacts.search_contacts(query, max_results=5)
+            people = await google_contacts.search_contacts(
+                query, max_results=5, full_details=True
+            )
         except Exception as exc:
             await update.message.reply_text(f"❌ Search failed: {exc}")
             return
@@ -136,18 +135,7 @@ def make_contacts_handlers(
                 f"No contact found matching _{query}_.", parse_mode="Markdown"
             )
             return
-        from ...google.contacts import format_contact, _extract_name
-
-        top = people[0]
-        resource_name = top.get("resourceName", "")
-        try:
-            if resource_name:
-                top = await google_contacts.get_contact(resource_name)
-        except Exception as e:
-            logger.debug(
-                "Failed to fetch full contact details, using search result: %s", e
-            )
-        lines = ["👤 *Contact details:*\n", format_contact(top, verbose=True)]
+        lines = ["👤 *Contact details:*\n", format_contact(people[0], verbose=True)]
         if len(people) > 1:
             others = [_extract_name(p) or "?" for p in people[1:]]
             lines.append(f"\n_Also matched: {', '.join(others)}_")
@@ -179,8 +167,6 @@ def make_contacts_handlers(
                 parse_mode="Markdown",
             )
             return
-        from ...google.contacts import _extract_name
-
         person = people[0]
         resource_name = person.get("resourceName", "")
         name = _extract_name(person) or name_query
@@ -215,12 +201,8 @@ def make_contacts_handlers(
                 "✅ All contacts have at least an email or phone number."
             )
             return
-        from ...google.contacts import _extract_name
-
         lines = [f"🗑 *{len(sparse)} contact(s) with no email or phone:*\n"]
-        for p in sparse[:30]:
-            name = _extract_name(p) or "(no name)"
-            lines.append(f"• {name}")
+        lines.extend(f"• {_extract_name(p) or '(no name)'}" for p in sparse[:30])
         if len(sparse) > 30:
             lines.append(f"…and {len(sparse) - 30} more")
         lines.append(
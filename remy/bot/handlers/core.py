@@ -6,6 +6,7 @@ Contains handlers for basic commands: start, help, cancel, status, setmychat, br
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -176,7 +177,7 @@ def make_core_handlers(
 
         chat_id = update.effective_chat.id
         try:
-            save_primary_chat_id(chat_id)
+            await asyncio.to_thread(save_primary_chat_id, chat_id)
             await update.message.reply_text(
                 f"This chat is now set for proactive messages. (ID: {chat_id})"
             )
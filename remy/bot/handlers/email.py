@@ -155,10 +155,10 @@ def make_email_handlers(
         message_ids = [p["id"] for p in promos]
         token = store_pending_archive(user_id, message_ids)
         lines = [f"🗑 *{len(promos)} promotional email(s) found:*\n"]
-        for item in promos[:10]:
-            lines.append(
-                f"• {item['subject'][:80]}\n  _From: {item['from_addr'][:60]}_"
-            )
+        lines.extend(
+            f"• {item['subject'][:80]}\n  _From: {item['from_addr'][:60]}_"
+            for item in promos[:10]
+        )
         if len(promos) > 10:
             lines.append(f"…and {len(promos) - 10} more")
         lines.append(f"\nTap [Confirm] to archive all {len(promos)} emails.")
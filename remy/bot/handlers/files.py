@@ -6,10 +6,12 @@ Contains handlers for file reading, writing, listing, searching, and project man
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
 import os
 import time
-from datetime import datetime as _dt
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -18,6 +20,14 @@ from telegram.ext import ContextTypes
 
 from .base import reject_unauthorized, _pending_writes
 from ...ai.input_validator import sanitize_file_path
+from ...ai.tools.files import (
+    cached_dir_files,
+    downloads_dir,
+    first_dir_names,
+    gather_matching_files,
+    summarise_downloads,
+)
+from ...ai.tools.projects import describe_projects
 from ...config import settings
 
 if TYPE_CHECKING:
@@ -153,19 +163,7 @@ def make_file_handlers(
             await update.message.reply_text("Usage: /find <glob-pattern>")
             return
         pattern = context.args[0]
-        import glob
-
-        raw_results = []
-        for base in settings.allowed_base_dirs:
-            raw_results.extend(
-                glob.glob(os.path.join(base, "**", pattern), recursive=True)
-            )
-        results = []
-        for r in raw_results:
-            safe, err = sanitize_file_path(r, settings.allowed_base_dirs)
-            if safe and not err:
-                results.append(safe)
-        results = results[:20]
+        results = await gather_matching_files(pattern, settings.allowed_base_dirs)
         if not results:
             await update.message.reply_text("No matching files found.")
         else:
@@ -216,26 +214,7 @@ def make_file_handlers(
         if not facts:
             await update.message.reply_text("No project set yet.")
             return
-        lines = []
-        for f in facts:
-            path = f["content"]
-            p = Path(path)
-            if p.is_dir():
-                try:
-                    all_files = [x for x in p.rglob("*") if x.is_file()]
-                    file_count = len(all_files)
-                    if all_files:
-                        latest = max(x.stat().st_mtime for x in all_files)
-                        mod_str = _dt.fromtimestamp(latest).strftime("%Y-%m-%d %H:%M")
-                        lines.append(
-                            f"• {path}\n  {file_count} files, last modified {mod_str}"
-                        )
-                    else:
-                        lines.append(f"• {path}\n  (empty)")
-                except Exception:
-                    lines.append(f"• {path}")
-            else:
-                lines.append(f"• {path} _(not found)_")
+        lines = await describe_projects([f["content"] for f in facts])
         await update.message.reply_text(
             "Tracked projects:\n" + "\n".join(lines),
             parse_mode="Markdown",
@@ -249,12 +228,12 @@ def make_file_handlers(
             return
         if await reject_unauthorized(update):
             return
-        downloads = Path.home() / "Downloads"
+        downloads = downloads_dir()
         if not downloads.exists():
             await update.message.reply_text("Downloads folder not found.")
             return
         try:
-            files = [f for f in downloads.iterdir() if f.is_file()]
+            files = await cached_dir_files(str(downloads))
         except Exception as exc:
             await update.message.reply_text(f"❌ Could not scan Downloads: {exc}")
             return
@@ -262,137 +241,7 @@ def make_file_handlers(
             await update.message.reply_text("✅ Downloads folder is empty.")
             return
 
-        now = time.time()
-        total_bytes = 0
-
-        _EXTS: list[tuple[frozenset, str, str]] = [
-            (
-                frozenset(["jpg", "jpeg", "png", "gif", "bmp", "webp", "heic", "svg"]),
-                "🖼",
-                "Images",
-            ),
-            (
-                frozenset(["mp4", "mov", "avi", "mkv", "m4v", "wmv", "flv"]),
-                "🎥",
-                "Videos",
-            ),
-            (frozenset(["mp3", "m4a", "wav", "flac", "aac", "ogg"]), "🎵", "Audio"),
-            (
-                frozenset(
-                    [
-                        "pdf",
-                        "doc",
-                        "docx",
-                        "xls",
-                        "xlsx",
-                        "ppt",
-                        "pptx",
-                        "txt",
-                        "pages",
-                        "numbers",
-                        "key",
-                    ]
-                ),
-                "📄",
-                "Documents",
-            ),
-            (
-                frozenset(
-                    ["zip", "tar", "gz", "bz2", "7z", "rar", "dmg", "pkg", "iso"]
-                ),
-                "📦",
-                "Archives",
-            ),
-            (
-                frozenset(
-                    [
-                        "py",
-                        "js",
-                        "ts",
-                        "java",
-                        "cpp",
-                        "c",
-                        "h",
-                        "go",
-                        "rs",
-                        "sh",
-                        "json",
-                        "yaml",
-                        "yml",
-                        "toml",
-                    ]
-                ),
-                "💻",
-                "Code",
-            ),
-        ]
-
-        def _classify(ext: str) -> tuple[str, str]:
-            ext = ext.lower().lstrip(".")
-            for exts, icon, label in _EXTS:
-                if ext in exts:
-                    return icon, label
-            return "📁", "Other"
-
-        def _fmt_bytes(b: int) -> str:
-            if b < 1024:
-                return f"{b}B"
-            if b < 1024 * 1024:
-                return f"{b // 1024}KB"
-            if b < 1024**3:
-                return f"{b // (1024 * 1024)}MB"
-            return f"{b / (1024**3):.1f}GB"
-
-        type_counts: dict[str, tuple[str, int, int]] = {}
-        age_buckets = {
-            "Today (<1d)": 0,
-            "This week (<7d)": 0,
-            "This month (<30d)": 0,
-            "Old (>30d)": 0,
-        }
-        oldest: list[tuple[float, str, int]] = []
-
-        for f in files:
-            stat = f.stat()
-            total_bytes += stat.st_size
-            icon, label = _classify(f.suffix)
-            prev = type_counts.get(label, (icon, 0, 0))
-            type_counts[label] = (icon, prev[1] + 1, prev[2] + stat.st_size)
-            age = now - stat.st_mtime
-            if age < 86400:
-                age_buckets["Today (<1d)"] += 1
-            elif age < 7 * 86400:
-                age_buckets["This week (<7d)"] += 1
-            elif age < 30 * 86400:
-                age_buckets["This month (<30d)"] += 1
-            else:
-                age_buckets["Old (>30d)"] += 1
-            oldest.append((stat.st_mtime, f.name, stat.st_size))
-
-        lines = [
-            f"📦 *Downloads Scan* — {len(files)} files ({_fmt_bytes(total_bytes)} total)\n"
-        ]
-
-        lines.append("*Type breakdown:*")
-        for label, (icon, count, nbytes) in sorted(
-            type_counts.items(), key=lambda x: -x[1][2]
-        ):
-            lines.append(f"  {icon} {label}: {count} file(s), {_fmt_bytes(nbytes)}")
-
-        lines.append("\n*Age breakdown:*")
-        for bucket, count in age_buckets.items():
-            if count:
-                suffix = " — consider cleanup" if "Old" in bucket else ""
-                lines.append(f"  • {bucket}: {count} file(s){suffix}")
-
-        oldest_sorted = sorted(oldest, key=lambda x: x[0])[:8]
-        if oldest_sorted:
-            lines.append("\n*Oldest files:*")
-            for mtime, name, nbytes in oldest_sorted:
-                age_days = int((now - mtime) / 86400)
-                lines.append(f"  • {name} ({age_days}d old, {_fmt_bytes(nbytes)})")
-
-        msg = "\n".join(lines)
+        msg = summarise_downloads(files, time.time(), heading="*{}*")
         if len(msg) > 4000:
             msg = msg[:4000] + "…"
         await update.message.reply_text(msg, parse_mode="Markdown")
@@ -416,21 +265,21 @@ def make_file_handlers(
             await update.message.reply_text("❌ Not a directory.")
             return
         try:
-            entries = sorted([f.name for f in p.iterdir()])
+            total, names = await asyncio.to_thread(first_dir_names, sanitized, 50)
         except Exception as exc:
             await update.message.reply_text(f"❌ Could not list directory: {exc}")
             return
-        if not entries:
+        if not names:
             await update.message.reply_text("Directory is empty.")
             return
         if claude_client is None:
             await update.message.reply_text("Claude not available for suggestions.")
             return
         await update.message.reply_text(
-            f"🤔 Analysing {len(entries)} items in `{p.name}`…",
+            f"🤔 Analysing {total} items in `{p.name}`…",
             parse_mode="Markdown",
         )
-        listing = "\n".join(entries[:50])
+        listing = "\n".join(names)
         try:
             suggestions = await claude_client.complete(
                 messages=[
@@ -475,9 +324,7 @@ def make_file_handlers(
             await update.message.reply_text("❌ Not a directory.")
             return
         try:
-            files = sorted(
-                [f for f in p.iterdir() if f.is_file()], key=lambda x: x.stat().st_mtime
-            )
+            files = await cached_dir_files(sanitized)
         except Exception as exc:
             await update.message.reply_text(f"❌ Could not list directory: {exc}")
             return
@@ -492,13 +339,10 @@ def make_file_handlers(
             parse_mode="Markdown",
         )
         now = time.time()
-        file_lines = []
-        for f in files[:30]:
-            stat = f.stat()
-            age_days = int((now - stat.st_mtime) / 86400)
-            size_kb = stat.st_size // 1024
-            file_lines.append(f"• {f.name} ({size_kb}KB, {age_days}d old)")
-        listing = "\n".join(file_lines)
+        listing = "\n".join(
+            f"• {name} ({size // 1024}KB, {int((now - mtime) / 86400)}d old)"
+            for name, size, mtime in heapq.nsmallest(30, files, key=itemgetter(2))
+        )
         try:
             suggestions = await claude_client.complete(
                 messages=[
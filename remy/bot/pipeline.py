@@ -28,6 +28,7 @@ from ..ai.claude_client import (
     ToolStatusChunk,
     ToolTurnComplete,
 )
+from ..ai.json_utils import dumps as json_dumps
 from ..config import settings
 from ..models import ConversationTurn
 from .working_message import WORKING_PLACEHOLDER, tool_status_text
@@ -449,7 +450,7 @@ async def run_proactive_trigger(
 
         # Save tool turns (multi-block) with sentinel prefix
         for assistant_blocks, result_blocks in tool_turns:
-            asst_serialised = _TOOL_TURN_PREFIX + json.dumps(assistant_blocks)
+            asst_serialised = _TOOL_TURN_PREFIX + json_dumps(assistant_blocks)
             await conv_store.append_turn(
                 user_id,
                 session_key,
@@ -459,7 +460,7 @@ async def run_proactive_trigger(
                     model_used=f"anthropic:{settings.model_complex}",
                 ),
             )
-            usr_serialised = _TOOL_TURN_PREFIX + json.dumps(result_blocks)
+            usr_serialised = _TOOL_TURN_PREFIX + json_dumps(result_blocks)
             await conv_store.append_turn(
                 user_id,
                 session_key,
@@ -442,12 +442,20 @@ def get_settings() -> "Settings":
 
 
 def save_primary_chat_id(chat_id: int) -> None:
-    """Save the primary chat ID for proactive messages (used by /setmychat and set_proactive_chat)."""
+    """Save the primary chat ID for proactive messages (used by /setmychat and set_proactive_chat).
+
+    Blocking; async callers should run it via asyncio.to_thread.
+    """
     settings = get_settings()
     path = settings.primary_chat_file
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w") as f:
+    # Write-then-rename so a crash mid-write never leaves a truncated file.
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
         f.write(str(chat_id))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 _settings: Settings | None = None
@@ -16,10 +16,12 @@ from .runner import (
     format_diagnostics_output,
 )
 from .logs import (
+    get_diag_summary,
     get_error_summary,
     get_recent_logs,
     get_session_start,
     get_session_start_line,
+    log_file_identity,
     since_dt,
     _since_dt,
 )
@@ -44,10 +46,12 @@ __all__ = [
     "format_diagnostics_output",
     "is_diagnostics_trigger",
     "DIAGNOSTICS_TRIGGER",
+    "get_diag_summary",
     "get_error_summary",
     "get_recent_logs",
     "get_session_start",
     "get_session_start_line",
+    "log_file_identity",
     "since_dt",
     "_since_dt",
 ]
@@ -3,19 +3,23 @@ Diagnostic utilities for analyzing bot logs and reporting issues.
 """
 
 import logging
+import mmap
+import os
 import re
 from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 # Log line format: "2026-02-26 14:32:45 [LEVEL] logger.name: message"
 _TS_RE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+_LEVEL_RE = re.compile(rb" \[(?:ERROR|WARNING)\] ")
 
 
-def _parse_ts(line: str) -> Optional[datetime]:
+def _parse_ts(line: str) -> datetime | None:
     m = _TS_RE.match(line)
     if m:
         try:
@@ -25,7 +29,7 @@ def _parse_ts(line: str) -> Optional[datetime]:
     return None
 
 
-def since_dt(since: Optional[str]) -> Optional[datetime]:
+def since_dt(since: str | None) -> datetime | None:
     """Convert a since string to a datetime cutoff, or None for no filter."""
     if not since or since == "all":
         return None
@@ -51,6 +55,21 @@ def _log_file(data_dir: str) -> Path:
     return Path(data_dir) / "remy.log"
 
 
+def log_file_identity(data_dir: str) -> tuple[str, int, int, int] | None:
+    """
+    Return (path, device, inode, size) for remy.log, or None if it does not exist.
+
+    Costs a single stat() call — callers use it to validate cached scan results
+    (rotation changes the inode; truncation shrinks the size).
+    """
+    log_file = _log_file(data_dir)
+    try:
+        st = log_file.stat()
+    except OSError:
+        return None
+    return (str(log_file), st.st_dev, st.st_ino, st.st_size)
+
+
 def get_session_start_line(data_dir: str) -> int:
     """
     Return the line index (0-based) of the last 'Starting remy' entry in the log.
@@ -74,7 +93,7 @@ def get_session_start_line(data_dir: str) -> int:
     return result
 
 
-def get_session_start(data_dir: str) -> Optional[datetime]:
+def get_session_start(data_dir: str) -> datetime | None:
     """
     Return the timestamp of the last 'Starting remy' entry for display purposes only.
     Do not use this for filtering — use get_session_start_line instead.
@@ -83,7 +102,7 @@ def get_session_start(data_dir: str) -> Optional[datetime]:
     if not log_file.exists():
         return None
 
-    result: Optional[datetime] = None
+    result: datetime | None = None
     try:
         with open(log_file, "r", encoding="utf-8") as f:
             for i, line in enumerate(f):
@@ -96,40 +115,117 @@ def get_session_start(data_dir: str) -> Optional[datetime]:
     return result
 
 
+@contextmanager
+def _mapped_log(log_file: Path) -> Iterator[bytes | mmap.mmap]:
+    """
+    Map remy.log read-only so scans can search raw bytes in place.
+
+    Only the lines that are actually returned get decoded; everything before
+    the session start or outside the tail is never copied into Python strings.
+    """
+    with open(log_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # empty files cannot be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _line_offset(buf: bytes | mmap.mmap, line_no: int | None) -> int:
+    """Return the byte offset where 0-based line line_no starts."""
+    pos = 0
+    for _ in range(line_no or 0):
+        nl = buf.find(b"\n", pos)
+        if nl < 0:
+            return len(buf)
+        pos = nl + 1
+    return pos
+
+
+def _raw_before(raw: bytes, since: datetime | None) -> bool:
+    if since is None:
+        return False
+    ts = _parse_ts(raw[:19].decode("ascii", errors="replace"))
+    return ts is not None and ts < since
+
+
+def _tail_lines(
+    buf: bytes | mmap.mmap,
+    start: int,
+    lines: int,
+    level: str | None,
+    since: datetime | None,
+) -> list[str]:
+    """Walk backwards from the end of buf collecting up to `lines` matching lines."""
+    tag = f"[{level}]".encode() if level else None
+    picked: list[str] = []
+    end = len(buf)
+    while end > start and len(picked) < lines:
+        nl = buf.rfind(b"\n", start, end - 1)
+        line_start = nl + 1 if nl >= 0 else start
+        raw = buf[line_start:end]
+        end = line_start
+        if tag is not None and tag not in raw:
+            continue
+        if _raw_before(raw, since):
+            continue
+        picked.append(raw.decode("utf-8", errors="replace"))
+    picked.reverse()
+    return picked
+
+
+def _scan_levels(
+    buf: bytes | mmap.mmap,
+    start: int,
+    max_items: int,
+    since: datetime | None,
+) -> tuple[deque[str], deque[str], int, int]:
+    """Collect ERROR/WARNING lines after start by searching the buffer directly."""
+    errors: deque[str] = deque(maxlen=max_items)
+    warnings: deque[str] = deque(maxlen=max_items)
+    error_count = 0
+    warning_count = 0
+
+    pos = start
+    while (m := _LEVEL_RE.search(buf, pos)) is not None:
+        line_start = buf.rfind(b"\n", 0, m.start()) + 1
+        line_end = buf.find(b"\n", m.end())
+        pos = len(buf) if line_end < 0 else line_end + 1
+        raw = buf[line_start:pos]
+        if _raw_before(raw, since):
+            continue
+
+        line = raw.decode("utf-8", errors="replace")
+        if " [ERROR] " in line:
+            errors.append(line)
+            error_count += 1
+        else:
+            warnings.append(line)
+            warning_count += 1
+
+    return errors, warnings, error_count, warning_count
+
+
 def get_recent_logs(
     data_dir: str,
     lines: int = 50,
-    level: Optional[str] = None,
-    since: Optional[datetime] = None,
-    since_line: Optional[int] = None,
+    level: str | None = None,
+    since: datetime | None = None,
+    since_line: int | None = None,
 ) -> str:
-    """Read recent logs from remy.log file efficiently using a deque."""
+    """Read recent logs from remy.log, scanning backwards from the end of the file."""
     log_file = _log_file(data_dir)
 
     if not log_file.exists():
         return "No logs available yet (remy.log not created)"
 
     try:
-        buffer: deque[str] = deque(maxlen=lines)
-        with open(log_file, "r", encoding="utf-8") as f:
-            for i, line in enumerate(f):
-                # Filter by file position (startup session filter)
-                if since_line is not None and i < since_line:
-                    continue
-
-                # Filter by timestamp (relative time filter: 1h/6h/24h)
-                if since is not None:
-                    ts = _parse_ts(line)
-                    if ts is not None and ts < since:
-                        continue
-
-                # Filter by level if specified
-                if level and f"[{level}]" not in line:
-                    continue
-
-                buffer.append(line)
+        with _mapped_log(log_file) as buf:
+            # since_line: startup session filter; since: relative time filter
+            start = _line_offset(buf, since_line)
+            picked = _tail_lines(buf, start, lines, level, since)
 
-        formatted = "".join(buffer)
+        formatted = "".join(picked)
         return formatted or f"No {level or 'recent'} logs found"
 
     except Exception as e:
@@ -139,8 +235,8 @@ def get_recent_logs(
 def get_error_summary(
     data_dir: str,
     max_items: int = 10,
-    since: Optional[datetime] = None,
-    since_line: Optional[int] = None,
+    since: datetime | None = None,
+    since_line: int | None = None,
 ) -> str:
     """Analyze logs efficiently and return a summary of recent errors."""
     log_file = _log_file(data_dir)
@@ -149,45 +245,68 @@ def get_error_summary(
         return "No logs available"
 
     try:
-        errors: deque[str] = deque(maxlen=max_items)
-        warnings: deque[str] = deque(maxlen=max_items)
-        error_count = 0
-        warning_count = 0
+        with _mapped_log(log_file) as buf:
+            start = _line_offset(buf, since_line)
+            found = _scan_levels(buf, start, max_items, since)
 
-        with open(log_file, "r", encoding="utf-8") as f:
-            for i, line in enumerate(f):
-                if since_line is not None and i < since_line:
-                    continue
-
-                if since is not None:
-                    ts = _parse_ts(line)
-                    if ts is not None and ts < since:
-                        continue
-
-                if " [ERROR] " in line:
-                    errors.append(line)
-                    error_count += 1
-                elif " [WARNING] " in line:
-                    warnings.append(line)
-                    warning_count += 1
-
-        summary = []
-        if errors:
-            summary.append(f"🚨 *Recent Errors ({error_count} total)*")
-            for line in errors:
-                if ":" in line:
-                    msg = line.split(":", 2)[-1].strip()
-                    summary.append(f"  • {msg}")
-
-        if warnings:
-            summary.append(f"\n⚠️  *Recent Warnings ({warning_count} total)*")
-            for line in warnings:
-                if ":" in line:
-                    msg = line.split(":", 2)[-1].strip()
-                    summary.append(f"  • {msg}")
-
-        scope = f"since {since.strftime('%H:%M:%S')}" if since else "this session"
-        return "\n".join(summary) if summary else f"No errors or warnings ({scope})"
+        return _format_error_summary(*found, since)
 
     except Exception as e:
         return f"Error analyzing logs: {e}"
+
+
+def _format_error_summary(
+    errors: deque[str],
+    warnings: deque[str],
+    error_count: int,
+    warning_count: int,
+    since: datetime | None,
+) -> str:
+    summary = []
+    if errors:
+        summary.append(f"🚨 *Recent Errors ({error_count} total)*")
+        for line in errors:
+            if ":" in line:
+                msg = line.split(":", 2)[-1].strip()
+                summary.append(f"  • {msg}")
+
+    if warnings:
+        summary.append(f"\n⚠️  *Recent Warnings ({warning_count} total)*")
+        for line in warnings:
+            if ":" in line:
+                msg = line.split(":", 2)[-1].strip()
+                summary.append(f"  • {msg}")
+
+    scope = f"since {since.strftime('%H:%M:%S')}" if since else "this session"
+    return "\n".join(summary) if summary else f"No errors or warnings ({scope})"
+
+
+def get_diag_summary(
+    data_dir: str,
+    max_items: int = 5,
+    tail_lines: int = 10,
+    since: datetime | None = None,
+    since_line: int | None = None,
+) -> tuple[str, str]:
+    """
+    Return (error summary, recent log tail) from a single mapping of the log.
+
+    Equivalent to calling get_error_summary(data_dir, max_items, ...) and
+    get_recent_logs(data_dir, tail_lines, None, ...) but opens the file once.
+    """
+    log_file = _log_file(data_dir)
+
+    if not log_file.exists():
+        return "No logs available", "No logs available yet (remy.log not created)"
+
+    try:
+        with _mapped_log(log_file) as buf:
+            start = _line_offset(buf, since_line)
+            found = _scan_levels(buf, start, max_items, since)
+            tail = _tail_lines(buf, start, tail_lines, None, since)
+
+        summary = _format_error_summary(*found, since)
+        return summary, "".join(tail) or "No recent logs found"
+
+    except Exception as e:
+        return f"Error analyzing logs: {e}", f"Error reading logs: {e}"
@@ -121,14 +121,23 @@ class ContactsClient:
 
         return await with_google_resilience("contacts", lambda: asyncio.to_thread(_sync))
 
-    async def search_contacts(self, query: str, max_results: int = 10) -> list[dict]:
-        """Search contacts by name or email. Returns matching person dicts."""
+    async def search_contacts(
+        self, query: str, max_results: int = 10, full_details: bool = False
+    ) -> list[dict]:
+        """
+        Search contacts by name or email. Returns matching person dicts.
+
+        With full_details, results carry every _PERSON_FIELDS field, so no
+        follow-up get_contact() is needed to show notes, orgs or addresses.
+        """
+        read_mask = _PERSON_FIELDS if full_details else _LIST_FIELDS
+
         def _sync() -> list[dict]:
             svc = self._service()
             resp = svc.people().searchContacts(
                 query=query,
                 pageSize=max_results,
-                readMask=_LIST_FIELDS,
+                readMask=read_mask,
             ).execute()
             return [r.get("person", {}) for r in resp.get("results", [])]
 
@@ -19,16 +19,31 @@ def extract_doc_id(id_or_url: str) -> str:
     return m.group(1) if m else id_or_url
 
 
-def _extract_text(doc: dict) -> str:
-    """Extract plain text from a Docs API document response."""
+# Only the text runs are needed for reading; styles and layout make up most of
+# a full documents.get payload.
+_READ_FIELDS = "title,body(content(paragraph(elements(textRun(content)))))"
+
+
+def _extract_text(doc: dict, max_chars: int | None = None) -> str:
+    """
+    Extract plain text from a Docs API document response.
+
+    With max_chars, stops collecting text runs once that many characters are
+    gathered and returns at most max_chars characters.
+    """
     parts = []
+    total = 0
     for elem in doc.get("body", {}).get("content", []):
         paragraph = elem.get("paragraph")
         if paragraph:
             for pe in paragraph.get("elements", []):
                 tr = pe.get("textRun")
                 if tr:
-                    parts.append(tr.get("content", ""))
+                    content = tr.get("content", "")
+                    parts.append(content)
+                    total += len(content)
+                    if max_chars is not None and total >= max_chars:
+                        return "".join(parts)[:max_chars]
     return "".join(parts)
 
 
@@ -43,17 +58,25 @@ class DocsClient:
         from .auth import get_credentials
         return build("docs", "v1", credentials=get_credentials(self._token_file))
 
-    async def read_document(self, id_or_url: str) -> tuple[str, str]:
+    async def read_document(
+        self, id_or_url: str, max_chars: int | None = None
+    ) -> tuple[str, str]:
         """
         Fetch and return (doc_title, plain_text) for a Google Doc.
+        Only the title and text runs are requested; max_chars caps the text.
         Raises on auth or API errors.
         """
         doc_id = extract_doc_id(id_or_url)
 
         def _sync():
-            doc = self._service().documents().get(documentId=doc_id).execute()
+            doc = (
+                self._service()
+                .documents()
+                .get(documentId=doc_id, fields=_READ_FIELDS)
+                .execute()
+            )
             title = doc.get("title", "(untitled)")
-            text = _extract_text(doc)
+            text = _extract_text(doc, max_chars)
             return title, text
 
         return await with_google_resilience("docs", lambda: asyncio.to_thread(_sync))
@@ -18,6 +18,8 @@ from .base import with_google_resilience
 logger = logging.getLogger(__name__)
 
 _BODY_MAX_CHARS = 3000  # truncation limit for email bodies
+_BATCH_MAX = 100  # Gmail accepts at most 100 calls per batch HTTP request
+_BATCH_MODIFY_MAX = 1000  # messages.batchModify limit on ids per request
 
 # Maps human-readable label names → Gmail API label IDs.
 # None means "no labelIds filter" (i.e. search all mail).
@@ -111,6 +113,60 @@ def _parse_headers(msg: dict) -> dict:
     return {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
 
 
+def _message_entry(message_id: str, msg: dict, include_body: bool) -> dict:
+    """Flatten a Gmail API message resource into the summary dict callers use."""
+    headers = _parse_headers(msg)
+    entry = {
+        "id": message_id,
+        "from_addr": headers.get("From", ""),
+        "to": headers.get("To", ""),
+        "subject": headers.get("Subject", "(no subject)"),
+        "date": headers.get("Date", ""),
+        "snippet": msg.get("snippet", ""),
+        "labels": msg.get("labelIds", []),
+    }
+    if include_body:
+        entry["body"] = _extract_body(msg)
+    return entry
+
+
+def _batch_get_messages(svc, message_ids: list[str], include_body: bool) -> list[dict]:
+    """
+    Fetch several messages with a single multipart batch request
+    (https://www.googleapis.com/batch/gmail/v1).
+
+    Returns message resources in the same order as message_ids. If any
+    sub-request fails, its exception is raised after the batch completes.
+    """
+    if not message_ids:
+        return []
+
+    fetched: dict[str, dict] = {}
+    errors: list[Exception] = []
+
+    def _on_response(request_id, response, exception):
+        if exception is not None:
+            errors.append(exception)
+        else:
+            fetched[request_id] = response
+
+    fmt = "full" if include_body else "metadata"
+    extra = (
+        {} if include_body else {"metadataHeaders": ["From", "To", "Subject", "Date"]}
+    )
+    batch = svc.new_batch_http_request(callback=_on_response)
+    for mid in message_ids:
+        batch.add(
+            svc.users().messages().get(userId="me", id=mid, format=fmt, **extra),
+            request_id=mid,
+        )
+    batch.execute()
+
+    if errors:
+        raise errors[0]
+    return [fetched[mid] for mid in message_ids]
+
+
 class GmailClient:
     """Wraps Gmail API v1 calls."""
 
@@ -250,26 +306,29 @@ class GmailClient:
         ALL_MAIL resolves to None — the caller should treat a None entry as
         "no labelIds filter", i.e. search across all mail.
 
+        The returned list is in the same order as ``names``.
+
         Raises ValueError if a custom label name is not found.
         """
         resolved: list[str | None] = []
-        custom_names: list[str] = []
+        custom_idx: list[int] = []
 
         for name in names:
             upper = name.upper()
             if upper in _SYSTEM_LABELS:
                 resolved.append(_SYSTEM_LABELS[upper])
             else:
-                custom_names.append(name)
+                custom_idx.append(len(resolved))
+                resolved.append(None)
 
-        if custom_names:
+        if custom_idx:
             all_labels = await self.list_labels()
             label_map = {lbl["name"].lower(): lbl["id"] for lbl in all_labels}
-            for name in custom_names:
-                lid = label_map.get(name.lower())
+            for i in custom_idx:
+                lid = label_map.get(names[i].lower())
                 if lid is None:
-                    raise ValueError(f"Label '{name}' not found in Gmail.")
-                resolved.append(lid)
+                    raise ValueError(f"Label '{names[i]}' not found in Gmail.")
+                resolved[i] = lid
 
         return resolved
 
@@ -290,7 +349,8 @@ class GmailClient:
             (OR semantics), de-duplicated by message ID.
 
         If include_body=True, fetches the full plain-text body (truncated to
-        _BODY_MAX_CHARS). Use sparingly — one API call per message.
+        _BODY_MAX_CHARS). Message fetches for each label page are sent as one
+        batch HTTP request, so bodies cost one round-trip rather than one each.
         """
         max_results = min(max_results, 20)
 
@@ -314,39 +374,14 @@ class GmailClient:
                 if label_filter is not None:
                     params["labelIds"] = [label_filter]
                 resp = svc.users().messages().list(**params).execute()
+                ids: list[str] = []
                 for item in resp.get("messages", []):
                     if item["id"] in seen:
                         continue
                     seen.add(item["id"])
-                    fmt = "full" if include_body else "metadata"
-                    msg = (
-                        svc.users()
-                        .messages()
-                        .get(
-                            userId="me",
-                            id=item["id"],
-                            format=fmt,
-                            **(
-                                {"metadataHeaders": ["From", "To", "Subject", "Date"]}
-                                if not include_body
-                                else {}
-                            ),
-                        )
-                        .execute()
-                    )
-                    headers = _parse_headers(msg)
-                    entry = {
-                        "id": item["id"],
-                        "from_addr": headers.get("From", ""),
-                        "to": headers.get("To", ""),
-                        "subject": headers.get("Subject", "(no subject)"),
-                        "date": headers.get("Date", ""),
-                        "snippet": msg.get("snippet", ""),
-                        "labels": msg.get("labelIds", []),
-                    }
-                    if include_body:
-                        entry["body"] = _extract_body(msg)
-                    results.append(entry)
+                    ids.append(item["id"])
+                for mid, msg in zip(ids, _batch_get_messages(svc, ids, include_body)):
+                    results.append(_message_entry(mid, msg, include_body))
 
             return results
 
@@ -371,19 +406,51 @@ class GmailClient:
                 )
                 .execute()
             )
-            headers = _parse_headers(msg)
-            entry = {
-                "id": message_id,
-                "from_addr": headers.get("From", ""),
-                "to": headers.get("To", ""),
-                "subject": headers.get("Subject", "(no subject)"),
-                "date": headers.get("Date", ""),
-                "snippet": msg.get("snippet", ""),
-                "labels": msg.get("labelIds", []),
-            }
-            if include_body:
-                entry["body"] = _extract_body(msg)
-            return entry
+            return _message_entry(message_id, msg, include_body)
+
+        return await with_google_resilience("gmail", lambda: asyncio.to_thread(_sync))
+
+    async def get_messages_batch(
+        self, message_ids: list[str], include_body: bool = True
+    ) -> list[dict]:
+        """
+        Fetch several emails by ID, in the given order.
+
+        IDs are sent in batch HTTP requests of up to _BATCH_MAX calls, so N
+        messages cost ceil(N / 100) round-trips instead of N. If Gmail rejects
+        a batch with a 4xx, that chunk is retried as individual gets.
+        """
+
+        def _sync():
+            from googleapiclient.errors import HttpError  # type: ignore[import]
+
+            svc = self._service()
+            fmt = "full" if include_body else "metadata"
+            results: list[dict] = []
+            for start in range(0, len(message_ids), _BATCH_MAX):
+                chunk = message_ids[start : start + _BATCH_MAX]
+                try:
+                    msgs = _batch_get_messages(svc, chunk, include_body)
+                except HttpError as e:
+                    if not 400 <= e.resp.status < 500:
+                        raise
+                    logger.warning(
+                        "Gmail batch get failed (%s), fetching %d messages singly",
+                        e.resp.status,
+                        len(chunk),
+                    )
+                    msgs = [
+                        svc.users()
+                        .messages()
+                        .get(userId="me", id=mid, format=fmt)
+                        .execute()
+                        for mid in chunk
+                    ]
+                results.extend(
+                    _message_entry(mid, msg, include_body)
+                    for mid, msg in zip(chunk, msgs)
+                )
+            return results
 
         return await with_google_resilience("gmail", lambda: asyncio.to_thread(_sync))
 
@@ -435,7 +502,12 @@ class GmailClient:
         add_label_ids: list[str] | None = None,
         remove_label_ids: list[str] | None = None,
     ) -> int:
-        """Add/remove labels from messages. Returns count modified."""
+        """
+        Add/remove labels from messages. Returns count modified.
+
+        Uses messages.batchModify, so up to _BATCH_MODIFY_MAX messages are
+        updated per request instead of one request per message.
+        """
         body: dict = {}
         if add_label_ids:
             body["addLabelIds"] = add_label_ids
@@ -446,8 +518,11 @@ class GmailClient:
 
         def _sync():
             svc = self._service()
-            for mid in message_ids:
-                svc.users().messages().modify(userId="me", id=mid, body=body).execute()
+            for start in range(0, len(message_ids), _BATCH_MODIFY_MAX):
+                chunk = message_ids[start : start + _BATCH_MODIFY_MAX]
+                svc.users().messages().batchModify(
+                    userId="me", body={"ids": chunk, **body}
+                ).execute()
             return len(message_ids)
 
         return await with_google_resilience("gmail", lambda: asyncio.to_thread(_sync))
@@ -459,6 +459,11 @@ def main() -> None:
 
     bot.application.post_init = _on_post_init
 
+    async def _on_post_shutdown(app):
+        await tool_registry.close()
+
+    bot.application.post_shutdown = _on_post_shutdown
+
     bot.run()
 
 
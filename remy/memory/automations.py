@@ -46,6 +46,35 @@ class AutomationStore:
                 raise RuntimeError("INSERT into automations did not return lastrowid")
             return rid
 
+    async def add_many(
+        self,
+        user_id: int,
+        rows: list[tuple[str, str, str | None, bool]],
+    ) -> list[int]:
+        """Insert several automations in one statement. Returns their row IDs.
+
+        Each row is ``(label, cron, fire_at, mediated)`` with the same meaning as
+        the arguments to :meth:`add`. IDs are returned in input order.
+        """
+        if not rows:
+            return []
+        values = ", ".join(["(?, ?, ?, ?, ?)"] * len(rows))
+        params = [
+            v
+            for label, cron, fire_at, mediated in rows
+            for v in (user_id, label, cron, fire_at, 1 if mediated else 0)
+        ]
+        async with self._db.get_connection() as conn:
+            cursor = await conn.execute(
+                "INSERT INTO automations (user_id, label, cron, fire_at, mediated) "
+                f"VALUES {values} RETURNING id",
+                params,
+            )
+            returned = await cursor.fetchall()
+            await conn.commit()
+        # RETURNING order is unspecified, but rowids are assigned in VALUES order
+        return sorted(r[0] for r in returned)
+
     async def delete(self, automation_id: int) -> None:
         """Delete an automation row unconditionally (used after one-time reminders fire)."""
         async with self._db.get_connection() as conn:
@@ -128,19 +128,24 @@ class BackgroundJobStore:
                     "Marked %d interrupted background job(s) as failed", result.rowcount
                 )
 
-    async def list_recent(self, user_id: int, limit: int = 10) -> list[dict]:
-        """Return the N most recent jobs for a user, newest first."""
+    async def list_recent(
+        self, user_id: int, limit: int = 10, status: str | None = None
+    ) -> list[dict]:
+        """Return the N most recent jobs for a user, newest first.
+
+        When status is given, only jobs in that state are returned.
+        """
         async with self._db.get_connection() as conn:
             cursor = await conn.execute(
                 """
                 SELECT id, job_type, status, input_text, result_text,
                        created_at, completed_at
                 FROM background_jobs
-                WHERE user_id = ?
+                WHERE user_id = ? AND (? IS NULL OR status = ?)
                 ORDER BY created_at DESC
                 LIMIT ?
                 """,
-                (user_id, limit),
+                (user_id, status, status, limit),
             )
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
@@ -352,6 +352,8 @@ _MIGRATIONS = [
         raw_text    TEXT,
         occurred_at TEXT NOT NULL
     );""",
+    # 024: Exact case-insensitive plan title lookup (get_plan_by_title fast path)
+    "CREATE INDEX IF NOT EXISTS idx_plans_user_title ON plans(user_id, lower(title));",
 ]
 
 # Triggers to keep FTS indices in sync with source tables
@@ -409,6 +411,11 @@ CREATE VIRTUAL TABLE IF NOT EXISTS embeddings_vec USING vec0(
 """
 
 
+def _sql_casefold(value: str | None) -> str | None:
+    """SQL casefold(): str.casefold(), passing NULL through."""
+    return value.casefold() if value is not None else None
+
+
 class DatabaseManager:
     """Manages the SQLite connection and schema for remy."""
 
@@ -423,6 +430,10 @@ class DatabaseManager:
 
         self._conn = await aiosqlite.connect(self.db_path)
         self._conn.row_factory = aiosqlite.Row
+        # Unicode-aware matching in SQL; SQLite's own lower() only folds ASCII
+        await self._conn.create_function(
+            "casefold", 1, _sql_casefold, deterministic=True
+        )
 
         # Try loading sqlite-vec for ANN search
         try:
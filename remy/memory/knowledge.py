@@ -10,6 +10,7 @@ Includes semantic deduplication: near-duplicate facts are merged rather than
 creating new rows (US-improved-persistent-memory).
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -340,15 +341,15 @@ class KnowledgeStore:
         async with self._db.get_connection() as conn:
             rows = await conn.execute_fetchall(
                 """
-                SELECT id, entity_type, content, metadata, confidence, created_at,
-                       last_referenced_at, source_session
+                SELECT id, entity_type, content, metadata, confidence
                 FROM knowledge WHERE user_id=? AND entity_type=? AND confidence >= ?
                 ORDER BY created_at DESC LIMIT ?
                 """,
                 (user_id, entity_type, min_confidence, limit),
             )
+            # Rows were validated on insert; skip re-validating each one.
             return [
-                KnowledgeItem(
+                KnowledgeItem.model_construct(
                     id=row["id"],
                     entity_type=row["entity_type"],
                     content=row["content"],
@@ -358,6 +359,25 @@ class KnowledgeStore:
                 for row in rows
             ]
 
+    async def get_by_type_projected(
+        self,
+        user_id: int,
+        entity_type: str,
+        limit: int = 50,
+        min_confidence: float = 0.5,
+    ) -> list[tuple[int, str]]:
+        """Like get_by_type, but return only (id, content) pairs — no metadata JSON."""
+        async with self._db.get_connection() as conn:
+            rows = await conn.execute_fetchall(
+                """
+                SELECT id, content
+                FROM knowledge WHERE user_id=? AND entity_type=? AND confidence >= ?
+                ORDER BY created_at DESC LIMIT ?
+                """,
+                (user_id, entity_type, min_confidence, limit),
+            )
+            return [(row[0], row[1]) for row in rows]
+
     async def get_goals_active(
         self, user_id: int, limit: int = 10
     ) -> list[dict[str, Any]]:
@@ -418,15 +438,42 @@ class KnowledgeStore:
             )
         return out
 
+    async def get_facts_matching(
+        self,
+        user_id: int,
+        category: str,
+        tag: str | None = None,
+        contains: str = "",
+        limit: int = 20,
+    ) -> tuple[int, list[str]]:
+        """Return (match count, newest `limit` contents) for facts in a category.
+
+        Filtering by metadata tag and case-insensitive substring runs in SQL,
+        so only the rows that will be shown are fetched.
+        """
+        async with self._db.get_connection() as conn:
+            rows = await conn.execute_fetchall(
+                """
+                SELECT content, COUNT(*) OVER () AS total
+                FROM knowledge
+                WHERE user_id=? AND entity_type='fact' AND confidence >= 0.5
+                  AND json_extract(metadata, '$.category') = ?
+                  AND (? IS NULL OR json_extract(metadata, '$.tag') = ?)
+                  AND instr(casefold(content), ?) > 0
+                ORDER BY created_at DESC LIMIT ?
+                """,
+                (user_id, category, tag, tag, contains.casefold(), limit),
+            )
+        if not rows:
+            return 0, []
+        return int(rows[0]["total"]), [row["content"] for row in rows]
+
     async def snooze_goal(self, user_id: int, goal_id: int, until: str) -> bool:
         """Set snoozed_until on a goal so it is hidden until that date. Returns True if updated."""
         until_str = str(until).strip()[:10]
-        items = await self.get_by_type(user_id, "goal", limit=200)
-        target = next((i for i in items if i.id == goal_id), None)
-        if not target:
-            return False
-        new_meta = {**target.metadata, "snoozed_until": until_str}
-        return await self.update(user_id, goal_id, metadata=new_meta)
+        return await self.set_metadata_key(
+            user_id, goal_id, "snoozed_until", until_str, entity_type="goal"
+        )
 
     async def get_memory_summary(self, user_id: int) -> dict[str, Any]:
         """Return a structured overview of stored memory for a user.
@@ -503,10 +550,11 @@ class KnowledgeStore:
         self,
         user_id: int,
         item_id: int,
-        content: Optional[str] = None,
-        metadata: Optional[dict] = None,
+        content: str | None = None,
+        metadata: dict | None = None,
+        entity_type: str | None = None,
     ) -> bool:
-        """Update an existing knowledge item."""
+        """Update an existing knowledge item, optionally only if it has entity_type."""
         updates: list[str] = []
         params: list[Any] = []
         if content:
@@ -519,8 +567,11 @@ class KnowledgeStore:
         if not updates:
             return False
 
-        params.extend([item_id, user_id])
-        sql = f"UPDATE knowledge SET {', '.join(updates)}, updated_at=datetime('now') WHERE id=? AND user_id=?"
+        params.extend([item_id, user_id, entity_type, entity_type])
+        sql = (
+            f"UPDATE knowledge SET {', '.join(updates)}, updated_at=datetime('now') "
+            "WHERE id=? AND user_id=? AND (? IS NULL OR entity_type=?)"
+        )
 
         async with self._db.get_connection() as conn:
             cursor = await conn.execute(sql, tuple(params))
@@ -528,6 +579,32 @@ class KnowledgeStore:
             rc = cursor.rowcount
             return rc is not None and rc > 0
 
+    async def set_metadata_key(
+        self,
+        user_id: int,
+        item_id: int,
+        key: str,
+        value: Any,
+        entity_type: str | None = None,
+    ) -> bool:
+        """
+        Set one metadata key in place with a single UPDATE (json_set), leaving
+        the other keys untouched. Returns True if a matching item was updated.
+        """
+        async with self._db.get_connection() as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE knowledge
+                SET metadata=json_set(metadata, '$."' || ? || '"', json(?)),
+                    updated_at=datetime('now')
+                WHERE id=? AND user_id=? AND (? IS NULL OR entity_type=?)
+                """,
+                (key, json.dumps(value), item_id, user_id, entity_type, entity_type),
+            )
+            await conn.commit()
+            rc = cursor.rowcount
+            return rc is not None and rc > 0
+
     async def delete(self, user_id: int, item_id: int) -> bool:
         """Delete a knowledge item."""
         async with self._db.get_connection() as conn:
@@ -539,6 +616,33 @@ class KnowledgeStore:
             rc = cursor.rowcount
             return rc is not None and rc > 0
 
+    async def delete_containing(
+        self, user_id: int, entity_type: str, needle: str
+    ) -> int:
+        """Delete items of one type whose content contains needle (case-insensitive).
+
+        Matching runs in SQL with Unicode case folding, so no rows are fetched.
+        Returns rows deleted.
+        """
+        async with self._db.get_connection() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM knowledge WHERE user_id=? AND entity_type=? "
+                "AND instr(casefold(content), ?) > 0",
+                (user_id, entity_type, needle.casefold()),
+            )
+            await conn.commit()
+        return max(cursor.rowcount or 0, 0)
+
+    async def delete_by_type(self, user_id: int, entity_type: str) -> int:
+        """Delete every knowledge item of one type for a user. Returns rows deleted."""
+        async with self._db.get_connection() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM knowledge WHERE user_id=? AND entity_type=?",
+                (user_id, entity_type),
+            )
+            await conn.commit()
+        return max(cursor.rowcount or 0, 0)
+
     async def supersede_knowledge(
         self,
         user_id: int,
@@ -643,14 +747,12 @@ class KnowledgeStore:
         # 3. Migrate Groceries (batch)
         if grocery_file and os.path.exists(grocery_file):
             try:
-                grocery_items = []
-                with open(grocery_file, encoding="utf-8") as f:
-                    for line in f:
-                        item = line.strip().strip("- ").strip()
-                        if item:
-                            grocery_items.append(
-                                KnowledgeItem(entity_type="shopping_item", content=item)
-                            )
+                grocery_items = [
+                    KnowledgeItem(entity_type="shopping_item", content=item)
+                    for item in await asyncio.to_thread(
+                        _read_legacy_grocery_file, grocery_file
+                    )
+                ]
                 if grocery_items:
                     await self.upsert(user_id, grocery_items)
                     stats["groceries"] = len(grocery_items)
@@ -660,6 +762,17 @@ class KnowledgeStore:
         return stats
 
 
+def _read_legacy_grocery_file(path: str) -> list[str]:
+    """Stream the legacy grocery file line by line, returning its non-empty items."""
+    items = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            item = line.strip().strip("- ").strip()
+            if item:
+                items.append(item)
+    return items
+
+
 async def extract_and_store_knowledge(
     user_id: int,
     message: str,
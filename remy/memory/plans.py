@@ -261,17 +261,31 @@ class PlanStore:
     async def get_plan_by_title(
         self, user_id: int, title: str
     ) -> dict[str, Any] | None:
-        """Find a plan by fuzzy title match. Returns the first match."""
+        """Find a plan by title. Returns the first match.
+
+        An exact case-insensitive match (indexed) wins; otherwise the most
+        recently updated plan whose title contains the text is returned.
+        """
         async with self._db.get_connection() as conn:
             cursor = await conn.execute(
                 """
-                SELECT id FROM plans 
-                WHERE user_id = ? AND LOWER(title) LIKE ?
+                SELECT id FROM plans
+                WHERE user_id = ? AND lower(title) = lower(?)
                 ORDER BY updated_at DESC LIMIT 1
                 """,
-                (user_id, f"%{title.lower()}%"),
+                (user_id, title),
             )
             row = await cursor.fetchone()
+            if not row:
+                cursor = await conn.execute(
+                    """
+                    SELECT id FROM plans
+                    WHERE user_id = ? AND LOWER(title) LIKE ?
+                    ORDER BY updated_at DESC LIMIT 1
+                    """,
+                    (user_id, f"%{title.lower()}%"),
+                )
+                row = await cursor.fetchone()
             if not row:
                 return None
             return await self.get_plan(row["id"])
@@ -358,6 +372,7 @@ class PlanStore:
             plan_rows = await cursor.fetchall()
 
             plans = []
+            counts_by_plan: dict[int, dict[str, int]] = {}
             for plan_row in plan_rows:
                 plan = dict(plan_row)
                 if (
@@ -365,20 +380,24 @@ class PlanStore:
                     and plan.get("knowledge_goal_id") is None
                 ):
                     plan["goal_title"] = None
+                plan["step_counts"] = counts_by_plan[plan["id"]] = {}
+                plans.append(plan)
 
+            if plans:
+                # One grouped query for all plans rather than one per plan.
+                placeholders = ",".join("?" * len(plans))
                 cursor = await conn.execute(
-                    """
-                    SELECT status, COUNT(*) as count
-                    FROM plan_steps WHERE plan_id = ? GROUP BY status
+                    f"""
+                    SELECT plan_id, status, COUNT(*) as count
+                    FROM plan_steps WHERE plan_id IN ({placeholders})
+                    GROUP BY plan_id, status
                     """,
-                    (plan["id"],),
+                    tuple(counts_by_plan),
                 )
-                status_rows = await cursor.fetchall()
-                step_counts = {r["status"]: r["count"] for r in status_rows}
-                plan["step_counts"] = step_counts
-                plan["total_steps"] = sum(step_counts.values())
-
-                plans.append(plan)
+                for r in await cursor.fetchall():
+                    counts_by_plan[r["plan_id"]][r["status"]] = r["count"]
+            for plan in plans:
+                plan["total_steps"] = sum(plan["step_counts"].values())
 
             return plans
 
@@ -0,0 +1,65 @@
+"""
+Small in-process TTL + LRU cache.
+
+Used by tool executors to avoid repeating slow upstream calls (web search,
+Google reads, directory scans) for identical requests within a short window.
+Not thread-safe: intended for use from the asyncio event loop only.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """
+    Mapping with per-entry expiry and least-recently-used eviction.
+
+    Entries expire ``ttl`` seconds after they were stored. When ``maxsize`` is
+    reached, the least recently read or written entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: Hashable, default: V | None = None) -> V | None:
+        """Return the cached value for key, or default if absent or expired."""
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return default
+        expires, value = item
+        if expires <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the oldest entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove key if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,31 @@
+"""Tests for remy.memory.background_jobs — BackgroundJobStore."""
+
+import pytest
+import pytest_asyncio
+
+from remy.memory.background_jobs import BackgroundJobStore
+from remy.memory.database import DatabaseManager
+
+USER_ID = 99
+
+
+@pytest_asyncio.fixture
+async def store(tmp_path):
+    manager = DatabaseManager(db_path=str(tmp_path / "test.db"))
+    await manager.init()
+    yield BackgroundJobStore(manager)
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_list_recent_status_filter_applies_before_limit(store):
+    """A status filter returns matching jobs even when newer jobs of other states fill the limit."""
+    failed_id = await store.create(USER_ID, "research")
+    await store.set_failed(failed_id, "boom")
+    for _ in range(3):
+        job_id = await store.create(USER_ID, "board")
+        await store.set_done(job_id, "ok")
+
+    failed = await store.list_recent(USER_ID, limit=3, status="failed")
+    assert [j["id"] for j in failed] == [failed_id]
+    assert len(await store.list_recent(USER_ID, limit=10)) == 4
@@ -102,6 +102,18 @@ def test_save_primary_chat_id_writes_file(tmp_path):
     assert (tmp_path / "primary_chat_id.txt").read_text().strip() == "999888"
 
 
+def test_save_primary_chat_id_replaces_atomically(tmp_path):
+    """save_primary_chat_id overwrites via a temp file and leaves no .tmp behind."""
+    target = tmp_path / "primary_chat_id.txt"
+    target.write_text("111")
+    mock_settings = MagicMock()
+    mock_settings.primary_chat_file = str(target)
+    with patch("remy.config.get_settings", return_value=mock_settings):
+        save_primary_chat_id(222)
+    assert target.read_text() == "222"
+    assert [p.name for p in tmp_path.iterdir()] == ["primary_chat_id.txt"]
+
+
 def test_sdk_agent_config_defaults(monkeypatch):
     """US-claude-agent-sdk-migration: model_board_analyst, model_deep_researcher, use_sdk_agent exist and default."""
     s = make_settings(monkeypatch)
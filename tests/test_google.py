@@ -82,6 +82,38 @@ def test_extract_text_empty_doc():
     assert _extract_text({}) == ""
 
 
+def test_extract_text_stops_at_max_chars():
+    from remy.google.docs import _extract_text
+
+    runs = [{"textRun": {"content": "abcd"}} for _ in range(5)]
+    doc = {"body": {"content": [{"paragraph": {"elements": runs}}]}}
+    assert _extract_text(doc, max_chars=6) == "abcdab"
+    assert _extract_text(doc, max_chars=100) == "abcd" * 5
+
+
+def test_read_document_requests_text_fields_only():
+    from remy.google.docs import _READ_FIELDS, DocsClient
+
+    svc = MagicMock()
+    svc.documents.return_value.get.return_value.execute.return_value = {
+        "title": "Notes",
+        "body": {
+            "content": [
+                {"paragraph": {"elements": [{"textRun": {"content": "x" * 50}}]}}
+            ]
+        },
+    }
+    client = DocsClient("dummy.json")
+    client._service = lambda: svc
+
+    title, text = asyncio.run(client.read_document("doc1", max_chars=10))
+
+    assert (title, text) == ("Notes", "x" * 10)
+    svc.documents.return_value.get.assert_called_once_with(
+        documentId="doc1", fields=_READ_FIELDS
+    )
+
+
 # ── calendar helpers ──────────────────────────────────────────────────────────
 
 
@@ -187,6 +219,144 @@ def test_gmail_not_promotional():
     assert _is_promotional(normal) is False
 
 
+def test_gmail_resolve_label_ids_preserves_input_order():
+    from remy.google.gmail import GmailClient
+
+    client = GmailClient("dummy.json")
+    client.list_labels = AsyncMock(
+        return_value=[{"id": "Label_7", "name": "Hockey", "type": "user"}]
+    )
+    result = asyncio.run(client.resolve_label_ids(["hockey", "INBOX", "all_mail"]))
+    assert result == ["Label_7", "INBOX", None]
+
+
+class _FakeBatch:
+    """Minimal stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback, responses):
+        self._callback = callback
+        self._responses = responses
+        self.request_ids: list[str] = []
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for rid in reversed(self.request_ids):  # completion order is arbitrary
+            resp = self._responses[rid]
+            if isinstance(resp, Exception):
+                self._callback(rid, None, resp)
+            else:
+                self._callback(rid, resp, None)
+
+
+def _fake_gmail_service(list_ids, responses, batches):
+    svc = MagicMock()
+    svc.users.return_value.messages.return_value.list.return_value.execute.return_value = {
+        "messages": [{"id": i} for i in list_ids]
+    }
+
+    def _new_batch(callback):
+        batch = _FakeBatch(callback, responses)
+        batches.append(batch)
+        return batch
+
+    svc.new_batch_http_request.side_effect = _new_batch
+    return svc
+
+
+def test_gmail_search_fetches_messages_in_one_batch():
+    from remy.google.gmail import GmailClient
+
+    responses = {
+        mid: {
+            "snippet": f"snip {mid}",
+            "payload": {"headers": [{"name": "Subject", "value": f"S{mid}"}]},
+        }
+        for mid in ("a", "b", "c")
+    }
+    batches: list[_FakeBatch] = []
+    client = GmailClient("dummy.json")
+    client._service = lambda: _fake_gmail_service(
+        ["a", "b", "a", "c"], responses, batches
+    )
+
+    results = asyncio.run(client.search("x", include_body=True))
+
+    assert len(batches) == 1
+    assert batches[0].request_ids == ["a", "b", "c"]
+    assert [r["id"] for r in results] == ["a", "b", "c"]
+    assert results[1]["subject"] == "Sb"
+    assert results[2]["body"] == "snip c"
+
+
+def test_gmail_batch_get_raises_sub_request_error():
+    from remy.google.gmail import _batch_get_messages
+
+    batches: list[_FakeBatch] = []
+    svc = _fake_gmail_service([], {"a": {}, "b": RuntimeError("404")}, batches)
+
+    with pytest.raises(RuntimeError, match="404"):
+        _batch_get_messages(svc, ["a", "b"], include_body=False)
+
+
+def test_gmail_get_messages_batch_chunks_by_100():
+    from remy.google.gmail import GmailClient
+
+    ids = [f"m{i}" for i in range(150)]
+    responses = {mid: {"snippet": mid} for mid in ids}
+    batches: list[_FakeBatch] = []
+    client = GmailClient("dummy.json")
+    client._service = lambda: _fake_gmail_service([], responses, batches)
+
+    results = asyncio.run(client.get_messages_batch(ids, include_body=False))
+
+    assert [len(b.request_ids) for b in batches] == [100, 50]
+    assert [r["id"] for r in results] == ids
+    assert results[-1]["snippet"] == "m149"
+
+
+def test_gmail_get_messages_batch_falls_back_to_single_gets_on_4xx():
+    from googleapiclient.errors import HttpError
+
+    from remy.google.gmail import GmailClient
+
+    batches: list[_FakeBatch] = []
+    svc = _fake_gmail_service(
+        [], {"a": HttpError(MagicMock(status=400), b"bad batch"), "b": {}}, batches
+    )
+    svc.users.return_value.messages.return_value.get.return_value.execute.side_effect = [
+        {"snippet": "one"},
+        {"snippet": "two"},
+    ]
+    client = GmailClient("dummy.json")
+    client._service = lambda: svc
+
+    results = asyncio.run(client.get_messages_batch(["a", "b"], include_body=False))
+
+    assert [r["snippet"] for r in results] == ["one", "two"]
+
+
+def test_gmail_modify_labels_uses_batch_modify():
+    from remy.google.gmail import GmailClient
+
+    svc = MagicMock()
+    client = GmailClient("dummy.json")
+    client._service = lambda: svc
+    ids = [f"m{i}" for i in range(1500)]
+
+    count = asyncio.run(client.modify_labels(ids, add_label_ids=["Label_1"]))
+
+    batch_modify = svc.users.return_value.messages.return_value.batchModify
+    assert count == 1500
+    assert [len(c.kwargs["body"]["ids"]) for c in batch_modify.call_args_list] == [
+        1000,
+        500,
+    ]
+    assert batch_modify.call_args.kwargs["body"]["addLabelIds"] == ["Label_1"]
+    svc.users.return_value.messages.return_value.modify.assert_not_called()
+
+
 # ── handler smoke tests ───────────────────────────────────────────────────────
 
 
@@ -49,3 +49,25 @@ async def test_get_for_user_returns_none_when_not_found(automation_store):
     """get_for_user returns None when automation_id does not exist."""
     row = await automation_store.get_for_user(100, 99999)
     assert row is None
+
+
+@pytest.mark.asyncio
+async def test_add_many_returns_ids_in_input_order(automation_store):
+    """add_many inserts every row in one statement and maps IDs back in order."""
+    ids = await automation_store.add_many(
+        100,
+        [
+            ("Meds", "0 8 * * *", None, False),
+            ("Meds", "0 20 * * *", None, True),
+            ("Call", "", "2099-01-01T10:00:00", False),
+        ],
+    )
+    assert await automation_store.add_many(100, []) == []
+
+    rows = {r["id"]: r for r in await automation_store.get_all(100)}
+    saved = [(rows[i]["cron"], rows[i]["fire_at"], rows[i]["mediated"]) for i in ids]
+    assert saved == [
+        ("0 8 * * *", None, 0),
+        ("0 20 * * *", None, 1),
+        ("", "2099-01-01T10:00:00", 0),
+    ]
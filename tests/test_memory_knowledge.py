@@ -73,6 +73,17 @@ async def test_update(db):
     assert json.loads(row["metadata"])["cat"] == "updated"
 
 
+@pytest.mark.asyncio
+async def test_update_respects_entity_type(db):
+    manager, embeddings = db
+    store = KnowledgeStore(manager, embeddings)
+    fact_id = await store.add_item(42, "fact", "Likes tea")
+
+    assert not await store.update(42, fact_id, "Likes coffee", entity_type="goal")
+    assert await store.update(42, fact_id, "Likes coffee", entity_type="fact")
+    assert [i.content for i in await store.get_by_type(42, "fact")] == ["Likes coffee"]
+
+
 @pytest.mark.asyncio
 async def test_delete(db):
     manager, embeddings = db
@@ -86,3 +97,114 @@ async def test_delete(db):
     async with manager.get_connection() as conn:
         rows = await conn.execute_fetchall("SELECT * FROM knowledge WHERE id=?", (item_id,))
     assert len(rows) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_containing_casefolds_in_sql(db):
+    manager, embeddings = db
+    store = KnowledgeStore(manager, embeddings)
+    for content in ["Weißbier", "Milk", "WEISSBIER glasses"]:
+        await store.add_item(42, "shopping_item", content)
+    await store.add_item(42, "fact", "Likes weissbier")
+
+    assert await store.delete_containing(42, "shopping_item", "weissbier") == 2
+    assert [i.content for i in await store.get_by_type(42, "shopping_item")] == ["Milk"]
+    assert await store.delete_containing(42, "shopping_item", "50%") == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_by_type(db):
+    manager, embeddings = db
+    store = KnowledgeStore(manager, embeddings)
+    for i in range(3):
+        await store.add_item(42, "shopping_item", f"item {i}")
+    fact = await store.add_item(42, "fact", "Likes tea")
+
+    assert await store.delete_by_type(42, "shopping_item") == 3
+    assert await store.get_by_type(42, "shopping_item") == []
+    assert [i.id for i in await store.get_by_type(42, "fact")] == [fact]
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_grocery_file(db, tmp_path):
+    manager, embeddings = db
+    store = KnowledgeStore(manager, embeddings)
+    grocery = tmp_path / "grocery_list.txt"
+    grocery.write_text("- milk\n\n- eggs \nbread\n", encoding="utf-8")
+
+    stats = await store.migrate_legacy_data(42, str(grocery))
+
+    assert stats["groceries"] == 3
+    items = await store.get_by_type(42, "shopping_item")
+    assert sorted(i.content for i in items) == ["bread", "eggs", "milk"]
+
+
+@pytest.mark.asyncio
+async def test_get_by_type_returns_populated_items(db):
+    manager, embeddings = db
+    store = KnowledgeStore(manager, embeddings)
+    item_id = await store.add_item(42, "shopping_item", "oat milk", {"qty": 2})
+
+    [item] = await store.get_by_type(42, "shopping_item")
+
+    assert isinstance(item, KnowledgeItem)
+    assert item.model_dump() == {
+        "entity_type": "shopping_item",
+        "content": "oat milk",
+        "metadata": {"qty": 2},
+        "confidence": 1.0,
+        "id": item_id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_by_type_projected(db):
+    manager, embeddings = db
+    store = KnowledgeStore(manager, embeddings)
+    milk = await store.add_item(42, "shopping_item", "milk", {"qty": 2})
+    await store.add_item(42, "fact", "Likes tea")
+
+    assert await store.get_by_type_projected(42, "shopping_item") == [(milk, "milk")]
+
+
+@pytest.mark.asyncio
+async def test_get_facts_matching_filters_in_sql(db):
+    manager, embeddings = db
+    store = KnowledgeStore(manager, embeddings)
+    await store.add_item(42, "fact", "https://a.com — Recipes", {"category": "bookmark"})
+    await store.add_item(
+        42, "fact", "https://b.com recipes", {"category": "bookmark", "tag": "work"}
+    )
+    await store.add_item(42, "fact", "https://c.com", {"category": "bookmark"})
+    await store.add_item(42, "fact", "Likes recipes", {"category": "preference"})
+
+    total, contents = await store.get_facts_matching(42, "bookmark", contains="RECIPES")
+    assert total == 2
+    assert sorted(contents) == ["https://a.com — Recipes", "https://b.com recipes"]
+    assert await store.get_facts_matching(42, "bookmark", tag="work") == (
+        1,
+        ["https://b.com recipes"],
+    )
+    total, contents = await store.get_facts_matching(42, "bookmark", limit=1)
+    assert total == 3 and len(contents) == 1
+    assert await store.get_facts_matching(42, "bookmark", contains="zzz") == (0, [])
+
+
+@pytest.mark.asyncio
+async def test_set_metadata_key_patches_single_key(db):
+    manager, embeddings = db
+    store = KnowledgeStore(manager, embeddings)
+    goal_id = await store.add_item(
+        42, "goal", "Run 10k", {"status": "active", "description": "by June"}
+    )
+    fact_id = await store.add_item(42, "fact", "Likes tea", {"category": "preference"})
+
+    assert await store.set_metadata_key(42, goal_id, "status", "completed", "goal")
+    assert not await store.set_metadata_key(42, fact_id, "status", "completed", "goal")
+    assert not await store.set_metadata_key(42, 9999, "status", "completed")
+
+    [goal] = await store.get_by_type(42, "goal")
+    assert goal.metadata == {"status": "completed", "description": "by June"}
+    assert await store.snooze_goal(42, goal_id, "2026-12-01T00:00")
+    [goal] = await store.get_by_type(42, "goal")
+    assert goal.metadata["snoozed_until"] == "2026-12-01"
@@ -192,7 +192,7 @@ def test_grocery_list_show_empty():
     from tests.conftest import minimal_make_handlers_kwargs
 
     ks = AsyncMock()
-    ks.get_by_type = AsyncMock(return_value=[])
+    ks.get_by_type_projected = AsyncMock(return_value=[])
     with patch("remy.bot.handlers.base.settings") as mock_base_settings:
         mock_base_settings.telegram_allowed_users = [12345]
         handlers = make_handlers(
@@ -212,12 +212,7 @@ def test_grocery_list_add_and_show():
 
     ks = AsyncMock()
     ks.upsert = AsyncMock()
-    ks.get_by_type = AsyncMock(
-        return_value=[
-            MagicMock(content="milk", id=1),
-            MagicMock(content="eggs", id=2),
-        ]
-    )
+    ks.get_by_type_projected = AsyncMock(return_value=[(1, "milk"), (2, "eggs")])
     with patch("remy.bot.handlers.base.settings") as mock_base_settings:
         mock_base_settings.telegram_allowed_users = [12345]
         handlers = make_handlers(
@@ -240,14 +235,7 @@ def test_grocery_list_done():
     from tests.conftest import minimal_make_handlers_kwargs
 
     ks = AsyncMock()
-    ks.get_by_type = AsyncMock(
-        return_value=[
-            MagicMock(content="milk", id=1),
-            MagicMock(content="eggs", id=2),
-            MagicMock(content="bread", id=3),
-        ]
-    )
-    ks.delete = AsyncMock(return_value=True)
+    ks.delete_containing = AsyncMock(return_value=1)
     with patch("remy.bot.handlers.base.settings") as mock_base_settings:
         mock_base_settings.telegram_allowed_users = [12345]
         handlers = make_handlers(
@@ -257,12 +245,12 @@ def test_grocery_list_done():
         )
         update = make_update()
         asyncio.run(handlers["grocery-list"](update, make_context(["done", "eggs"])))
-    assert "Removed" in update.message.last_text
-    ks.delete.assert_called_once_with(12345, 2)
+    assert "Removed 1 item" in update.message.last_text
+    ks.delete_containing.assert_called_once_with(12345, "shopping_item", "eggs")
 
 
 def test_grocery_list_done_by_id():
-    """Unified list shows IDs; /grocery-list done <id> removes by ID without get_by_type."""
+    """Unified list shows IDs; /grocery-list done <id> removes by ID without listing."""
     from remy.bot.handler_deps import MemoryDeps
     from remy.bot.handlers import make_handlers
     from tests.conftest import minimal_make_handlers_kwargs
@@ -288,13 +276,7 @@ def test_grocery_list_clear():
     from tests.conftest import minimal_make_handlers_kwargs
 
     ks = AsyncMock()
-    ks.get_by_type = AsyncMock(
-        return_value=[
-            MagicMock(content="milk", id=1),
-            MagicMock(content="eggs", id=2),
-        ]
-    )
-    ks.delete = AsyncMock()
+    ks.delete_by_type = AsyncMock(return_value=2)
     with patch("remy.bot.handlers.base.settings") as mock_base_settings:
         mock_base_settings.telegram_allowed_users = [12345]
         handlers = make_handlers(
@@ -305,7 +287,8 @@ def test_grocery_list_clear():
         update = make_update()
         asyncio.run(handlers["grocery-list"](update, make_context(["clear"])))
     assert "cleared" in update.message.last_text.lower()
-    assert ks.delete.call_count == 2
+    ks.delete_by_type.assert_called_once_with(12345, "shopping_item")
+    ks.get_by_type_projected.assert_not_called()
 
 
 def test_price_check_no_args():
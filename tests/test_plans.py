@@ -196,6 +196,24 @@ async def test_list_plans_with_step_counts(plan_store):
     assert plans[0]["total_steps"] == 3
 
 
+@pytest.mark.asyncio
+async def test_list_plans_step_counts_per_plan(plan_store):
+    """Step counts are attributed to the right plan when several are listed."""
+    a = await plan_store.create_plan(user_id=123, title="A", steps=["1", "2"])
+    b = await plan_store.create_plan(user_id=123, title="B", steps=["1"])
+    await plan_store.create_plan(user_id=123, title="Empty", steps=[])
+
+    plan_a = await plan_store.get_plan(a)
+    await plan_store.update_step_status(plan_a["steps"][0]["id"], "done")
+
+    by_title = {p["title"]: p for p in await plan_store.list_plans(user_id=123)}
+    assert by_title["A"]["step_counts"] == {"done": 1, "pending": 1}
+    assert by_title["B"]["step_counts"] == {"pending": 1}
+    assert by_title["B"]["id"] == b
+    assert by_title["Empty"]["step_counts"] == {}
+    assert by_title["Empty"]["total_steps"] == 0
+
+
 @pytest.mark.asyncio
 async def test_update_plan_status(plan_store):
     """Test marking a plan as complete."""
@@ -267,6 +285,28 @@ async def test_get_plan_by_title_not_found(plan_store):
     assert plan is None
 
 
+@pytest.mark.asyncio
+async def test_get_plan_by_title_prefers_exact_match(plan_store, db):
+    """An exact (case-insensitive) title beats a more recent substring match."""
+    exact_id = await plan_store.create_plan(user_id=123, title="Fence", steps=["a"])
+    await plan_store.create_plan(user_id=123, title="Paint fence", steps=["a"])
+    async with db.get_connection() as conn:
+        await conn.execute(
+            "UPDATE plans SET updated_at = datetime('now', '-1 day') WHERE id = ?",
+            (exact_id,),
+        )
+        await conn.commit()
+        plan_rows = await conn.execute_fetchall(
+            "EXPLAIN QUERY PLAN SELECT id FROM plans"
+            " WHERE user_id = ? AND lower(title) = lower(?)",
+            (123, "fence"),
+        )
+
+    plan = await plan_store.get_plan_by_title(user_id=123, title="FENCE")
+    assert plan["id"] == exact_id
+    assert "idx_plans_user_title" in " ".join(str(r[-1]) for r in plan_rows)
+
+
 @pytest.mark.asyncio
 async def test_stale_steps(plan_store, db):
     """Test finding stale steps."""
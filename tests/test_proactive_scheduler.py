@@ -89,6 +89,7 @@ def test_parse_cron_invalid_raises():
 
 def test_read_primary_chat_id_returns_none_when_missing(tmp_path):
     with patch("remy.scheduler.proactive.settings") as mock_settings:
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.primary_chat_file = str(tmp_path / "nonexistent.txt")
         result = _read_primary_chat_id()
     assert result is None
@@ -98,6 +99,7 @@ def test_read_primary_chat_id_returns_id(tmp_path):
     chat_file = tmp_path / "primary_chat_id.txt"
     chat_file.write_text("987654321")
     with patch("remy.scheduler.proactive.settings") as mock_settings:
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.primary_chat_file = str(chat_file)
         result = _read_primary_chat_id()
     assert result == 987654321
@@ -107,6 +109,7 @@ def test_read_primary_chat_id_returns_none_for_empty_file(tmp_path):
     chat_file = tmp_path / "primary_chat_id.txt"
     chat_file.write_text("")
     with patch("remy.scheduler.proactive.settings") as mock_settings:
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.primary_chat_file = str(chat_file)
         result = _read_primary_chat_id()
     assert result is None
@@ -116,6 +119,7 @@ def test_read_primary_chat_id_returns_none_for_invalid_content(tmp_path):
     chat_file = tmp_path / "primary_chat_id.txt"
     chat_file.write_text("not-a-number")
     with patch("remy.scheduler.proactive.settings") as mock_settings:
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.primary_chat_file = str(chat_file)
         result = _read_primary_chat_id()
     assert result is None
@@ -137,7 +141,7 @@ async def test_morning_briefing_skipped_when_no_chat_id(db, goal_store, tmp_path
 
 
 @pytest.mark.asyncio
-async def test_morning_briefing_skipped_when_no_allowed_users(db, goal_store):
+async def test_morning_briefing_skipped_when_no_allowed_users(db, goal_store, tmp_path):
     """No send if allowed users list is empty."""
     bot = make_bot()
     sched = make_scheduler(bot, goal_store)
@@ -145,6 +149,7 @@ async def test_morning_briefing_skipped_when_no_allowed_users(db, goal_store):
         patch("remy.scheduler.proactive._read_primary_chat_id", return_value=12345),
         patch("remy.scheduler.proactive.settings") as mock_settings,
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = []
         mock_settings.briefing_cron = "0 7 * * *"
         mock_settings.checkin_cron = "0 19 * * *"
@@ -154,7 +159,7 @@ async def test_morning_briefing_skipped_when_no_allowed_users(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_morning_briefing_sends_with_goals(db, goal_store):
+async def test_morning_briefing_sends_with_goals(db, goal_store, tmp_path):
     """Briefing should include active goal titles."""
     await goal_store.upsert(1, [Goal(title="Launch remy", description="My AI agent")])
 
@@ -164,6 +169,7 @@ async def test_morning_briefing_sends_with_goals(db, goal_store):
         patch("remy.scheduler.proactive._read_primary_chat_id", return_value=12345),
         patch("remy.scheduler.proactive.settings") as mock_settings,
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = [1]
         mock_settings.scheduler_timezone = "Australia/Sydney"
         await sched._morning_briefing()
@@ -184,7 +190,7 @@ async def test_morning_briefing_sends_with_goals(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_morning_briefing_no_goals_message(db, goal_store):
+async def test_morning_briefing_no_goals_message(db, goal_store, tmp_path):
     """With no goals, briefing should mention 'no active goals'."""
     bot = make_bot()
     sched = make_scheduler(bot, goal_store)
@@ -192,6 +198,7 @@ async def test_morning_briefing_no_goals_message(db, goal_store):
         patch("remy.scheduler.proactive._read_primary_chat_id", return_value=99),
         patch("remy.scheduler.proactive.settings") as mock_settings,
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = [1]
         mock_settings.scheduler_timezone = "Australia/Sydney"
         await sched._morning_briefing()
@@ -202,7 +209,7 @@ async def test_morning_briefing_no_goals_message(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_morning_briefing_swallows_send_error(db, goal_store):
+async def test_morning_briefing_swallows_send_error(db, goal_store, tmp_path):
     """A failed Telegram send should not crash the scheduler."""
     bot = make_bot()
     bot.send_message = AsyncMock(side_effect=RuntimeError("Telegram API down"))
@@ -211,6 +218,7 @@ async def test_morning_briefing_swallows_send_error(db, goal_store):
         patch("remy.scheduler.proactive._read_primary_chat_id", return_value=99),
         patch("remy.scheduler.proactive.settings") as mock_settings,
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = [1]
         mock_settings.scheduler_timezone = "Australia/Sydney"
         # Should not raise
@@ -232,7 +240,7 @@ async def test_evening_checkin_skipped_when_no_chat_id(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_evening_checkin_skipped_when_no_stale_goals(db, goal_store):
+async def test_evening_checkin_skipped_when_no_stale_goals(db, goal_store, tmp_path):
     """Fresh goals (updated recently) should NOT trigger a check-in."""
     await goal_store.upsert(1, [Goal(title="Recent goal")])
 
@@ -242,6 +250,7 @@ async def test_evening_checkin_skipped_when_no_stale_goals(db, goal_store):
         patch("remy.scheduler.proactive._read_primary_chat_id", return_value=12345),
         patch("remy.scheduler.proactive.settings") as mock_settings,
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = [1]
         mock_settings.stale_goal_days = 3
         # Don't patch stale detection — goal was just inserted, so not stale
@@ -251,7 +260,7 @@ async def test_evening_checkin_skipped_when_no_stale_goals(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_evening_checkin_sends_for_stale_goals(db, goal_store):
+async def test_evening_checkin_sends_for_stale_goals(db, goal_store, tmp_path):
     """Goals older than settings.stale_goal_days should trigger a check-in message."""
     await goal_store.upsert(1, [Goal(title="Old goal")])
 
@@ -273,6 +282,7 @@ async def test_evening_checkin_sends_for_stale_goals(db, goal_store):
         patch("remy.scheduler.proactive._record_delivery"),
         patch("remy.scheduler.proactive.settings") as mock_settings,
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = [1]
         mock_settings.stale_goal_days = 3
         await sched._evening_checkin()
@@ -283,7 +293,7 @@ async def test_evening_checkin_sends_for_stale_goals(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_evening_checkin_injects_live_counters_into_context(db, goal_store):
+async def test_evening_checkin_injects_live_counters_into_context(db, goal_store, tmp_path):
     """Bug 12: when counter_store is set, evening check-in context includes live counters."""
     await goal_store.upsert(1, [Goal(title="Old goal")])
     stale_ts = (
@@ -329,6 +339,7 @@ async def test_evening_checkin_injects_live_counters_into_context(db, goal_store
             side_effect=capture_compose,
         ),
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = [1]
         mock_settings.stale_goal_days = 3
         await sched._evening_checkin()
@@ -357,11 +368,12 @@ async def test_scheduler_start_and_stop(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_scheduler_start_with_bad_cron_does_not_crash(db, goal_store):
+async def test_scheduler_start_with_bad_cron_does_not_crash(db, goal_store, tmp_path):
     """Invalid cron should log an error and not start the scheduler (legacy mode only)."""
     bot = make_bot()
     sched = make_scheduler(bot, goal_store)
     with patch("remy.scheduler.proactive.settings") as mock_settings:
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.heartbeat_enabled = False
         mock_settings.briefing_cron = "bad cron string"
         mock_settings.checkin_cron = "0 19 * * *"
@@ -494,7 +506,7 @@ async def test_week_at_a_glance_skipped_when_no_chat_id(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_week_at_a_glance_skipped_when_no_allowed_users(db, goal_store):
+async def test_week_at_a_glance_skipped_when_no_allowed_users(db, goal_store, tmp_path):
     """Week-at-a-glance is skipped when telegram_allowed_users is empty."""
     bot = make_bot()
     sched = ProactiveScheduler(bot, goal_store)
@@ -502,6 +514,7 @@ async def test_week_at_a_glance_skipped_when_no_allowed_users(db, goal_store):
         patch("remy.scheduler.proactive._read_primary_chat_id", return_value=12345),
         patch("remy.scheduler.proactive.settings") as mock_settings,
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = []
         mock_settings.scheduler_timezone = "Australia/Sydney"
         await sched._week_at_a_glance_briefing()
@@ -509,7 +522,7 @@ async def test_week_at_a_glance_skipped_when_no_allowed_users(db, goal_store):
 
 
 @pytest.mark.asyncio
-async def test_week_at_a_glance_sends_photo_when_image_generated(db, goal_store):
+async def test_week_at_a_glance_sends_photo_when_image_generated(db, goal_store, tmp_path):
     """When generate_week_image returns (bytes, caption), send_photo is called."""
     bot = make_bot()
     bot.send_photo = AsyncMock()
@@ -519,6 +532,7 @@ async def test_week_at_a_glance_sends_photo_when_image_generated(db, goal_store)
         patch("remy.scheduler.proactive.settings") as mock_settings,
         patch("remy.scheduler.proactive.generate_week_image") as mock_gen,
     ):
+        mock_settings.data_dir = str(tmp_path)
         mock_settings.telegram_allowed_users = [1]
         mock_settings.scheduler_timezone = "Australia/Sydney"
         mock_gen.return_value = (b"\x89PNG\r\n\x1a\n", "Week of 10 Mar.")
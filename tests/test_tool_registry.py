@@ -7,6 +7,7 @@ No real API calls or file I/O.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -100,12 +101,69 @@ def test_tool_schemas_input_schema_type():
         assert "properties" in inp
 
 
+def test_tool_specs_mirror_tool_schemas():
+    """TOOL_SPECS is a typed, slotted, immutable view of TOOL_SCHEMAS."""
+    import dataclasses
+
+    from remy.ai.tools import TOOL_SPECS, ToolSchema
+    from remy.ai.tools.schemas import TOOL_SPECS_BY_NAME
+
+    assert [spec.as_anthropic_dict() for spec in TOOL_SPECS] == TOOL_SCHEMAS
+    assert set(TOOL_SPECS_BY_NAME) == {s["name"] for s in TOOL_SCHEMAS}
+    spec = TOOL_SPECS_BY_NAME["get_logs"]
+    assert isinstance(spec, ToolSchema)
+    assert not hasattr(spec, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spec.name = "other"  # type: ignore[misc]
+
+
 def test_registry_schemas_property():
     """ToolRegistry.schemas returns TOOL_SCHEMAS."""
     reg = make_registry()
     assert reg.schemas is TOOL_SCHEMAS
 
 
+@pytest.mark.asyncio
+async def test_registry_http_client_is_pooled_and_closable():
+    """The probe HTTP client is created lazily, reused, and released by close()."""
+    reg = make_registry()
+    assert reg._http_client is None
+
+    client = reg._get_http_client()
+    assert reg._get_http_client() is client
+
+    await reg.close()
+    assert client.is_closed
+    assert reg._http_client is None
+    await reg.close()  # idempotent
+
+
+@pytest.mark.asyncio
+async def test_calendar_calls_bounded_by_backend_semaphore():
+    """No more than four calendar calls are in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    async def _list_events(days):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    calendar = MagicMock()
+    calendar.list_events = _list_events
+    reg = make_registry(calendar_client=calendar)
+
+    results = await asyncio.gather(
+        *(reg.dispatch("calendar_events", {"days": 1}, USER_ID) for _ in range(10))
+    )
+
+    assert all("No events" in r for r in results)
+    assert peak == 4
+
+
 # --------------------------------------------------------------------------- #
 # 2. StreamEvent dataclasses                                                   #
 # --------------------------------------------------------------------------- #
@@ -182,6 +240,17 @@ def test_build_message_invalid_json_sentinel_falls_back():
     assert isinstance(msg["content"], str)
 
 
+def test_build_message_round_trips_json_utils_serialisation():
+    """Tool turns written with json_utils.dumps (orjson) read back unchanged."""
+    from remy.ai.json_utils import dumps
+
+    blocks = [
+        {"type": "tool_use", "id": "1", "name": "web_search", "input": {"q": "café ☕"}}
+    ]
+    turn = ConversationTurn(role="assistant", content=_TOOL_TURN_PREFIX + dumps(blocks))
+    assert _build_message_from_turn(turn)["content"] == blocks
+
+
 # --------------------------------------------------------------------------- #
 # 4. ToolRegistry.dispatch routing                                             #
 # --------------------------------------------------------------------------- #
@@ -194,20 +263,78 @@ async def test_dispatch_unknown_tool_returns_error():
     assert "Unknown tool" in result
 
 
+def test_every_schema_has_a_handler_with_matching_signature():
+    """Each handler spec names an executor that takes exactly the flagged args."""
+    import importlib
+    import inspect
+
+    from remy.ai.tools.registry import _HANDLER_SPECS
+
+    assert {t["name"] for t in TOOL_SCHEMAS} <= set(_HANDLER_SPECS)
+    for name, spec in _HANDLER_SPECS.items():
+        fn = getattr(importlib.import_module(f"remy.ai.tools.{spec.module}"), spec.fn)
+        expected = 1 + sum(
+            (spec.needs_input, spec.needs_user, spec.needs_chat, spec.needs_message)
+        )
+        assert len(inspect.signature(fn).parameters) == expected, name
+
+
+@pytest.mark.asyncio
+async def test_dispatch_logs_benign_errors_without_traceback(caplog):
+    reg = make_registry()
+    with (
+        patch("remy.ai.tools.time.exec_get_current_time", side_effect=KeyError("tz")),
+        caplog.at_level("WARNING", logger="remy.ai.tools.registry"),
+    ):
+        result = await reg.dispatch("get_current_time", {}, USER_ID)
+    assert result == "Tool get_current_time encountered an error: 'tz'"
+    (record,) = caplog.records
+    assert record.levelname == "WARNING" and record.exc_info is None
+
+
+@pytest.mark.asyncio
+async def test_dispatch_logs_unexpected_errors_with_traceback(caplog):
+    reg = make_registry()
+    with (
+        patch(
+            "remy.ai.tools.time.exec_get_current_time", side_effect=RuntimeError("boom")
+        ),
+        caplog.at_level("WARNING", logger="remy.ai.tools.registry"),
+    ):
+        result = await reg.dispatch("get_current_time", {}, USER_ID)
+    assert "boom" in result
+    (record,) = caplog.records
+    assert record.levelname == "ERROR" and record.exc_info is not None
+
+
+@pytest.mark.asyncio
+async def test_dispatch_forwards_chat_and_message_ids():
+    reg = make_registry()
+    result = await reg.dispatch("suggest_actions", {"actions": []}, USER_ID)
+    assert result == "Attached."
+
+    bot = MagicMock()
+    bot.set_message_reaction = AsyncMock()
+    reg = make_registry(scheduler_ref={"bot": bot})
+    result = await reg.dispatch("react_to_message", {"emoji": "👍"}, USER_ID, 5, 9)
+    assert result == "Reacted with 👍"
+    kwargs = bot.set_message_reaction.call_args.kwargs
+    assert (kwargs["chat_id"], kwargs["message_id"]) == (5, 9)
+
+
 @pytest.mark.asyncio
 async def test_dispatch_get_logs_summary():
-    """dispatch('get_logs') calls get_error_summary and get_recent_logs.
+    """dispatch('get_logs') calls get_diag_summary once for errors and tail.
 
-    startup mode makes 4 calls to asyncio.to_thread:
-        get_session_start_line, get_session_start, get_error_summary, get_recent_logs
+    summary mode makes 3 calls to asyncio.to_thread:
+        get_session_start_line, get_session_start, get_diag_summary
     """
     reg = make_registry(logs_dir="/tmp")
     with patch("remy.ai.tools.memory.asyncio.to_thread") as mock_thread:
         mock_thread.side_effect = [
             0,  # get_session_start_line → int
             None,  # get_session_start → None (no timestamp found)
-            "Error summary",  # get_error_summary
-            "Tail content",  # get_recent_logs
+            ("Error summary", "Tail content"),  # get_diag_summary
         ]
         result = await reg.dispatch("get_logs", {"mode": "summary"}, USER_ID)
     assert "Error summary" in result or "Tail content" in result
@@ -431,19 +558,8 @@ async def test_dispatch_manage_goal_add():
 
 @pytest.mark.asyncio
 async def test_dispatch_manage_goal_complete():
-    from remy.models import KnowledgeItem
-
-    item = KnowledgeItem(
-        id=456,
-        entity_type="goal",
-        content="Launch",
-        metadata={"status": "active"},
-        confidence=1.0,
-    )
-
     ks = MagicMock()
-    ks.get_by_type = AsyncMock(return_value=[item])
-    ks.update = AsyncMock(return_value=True)
+    ks.set_metadata_key = AsyncMock(return_value=True)
     reg = make_registry(knowledge_store=ks)
 
     result = await reg.dispatch(
@@ -451,7 +567,31 @@ async def test_dispatch_manage_goal_complete():
     )
 
     assert "marked as completed" in result
-    ks.update.assert_called_once_with(USER_ID, 456, metadata={"status": "completed"})
+    ks.set_metadata_key.assert_awaited_once_with(
+        USER_ID, 456, "status", "completed", entity_type="goal"
+    )
+
+
+@pytest.mark.asyncio
+async def test_summary_cached_until_a_memory_write():
+    ks = MagicMock()
+    ks.get_memory_summary = AsyncMock(return_value={"total_facts": 3})
+    ks.delete = AsyncMock(return_value=True)
+    reg = make_registry(knowledge_store=ks)
+
+    first = await reg.dispatch("get_memory_summary", {}, USER_ID)
+    second = await reg.dispatch("get_memory_summary", {}, USER_ID)
+    assert first == second and "3 facts" in first
+    assert ks.get_memory_summary.await_count == 1
+
+    await reg.dispatch("manage_goal", {"action": "delete", "goal_id": 1}, USER_ID)
+    await reg.dispatch("get_memory_summary", {}, USER_ID)
+    assert ks.get_memory_summary.await_count == 2
+
+    ks.add_item = AsyncMock(return_value=7)
+    await reg.dispatch("save_bookmark", {"url": "https://example.com"}, USER_ID)
+    await reg.dispatch("get_memory_summary", {}, USER_ID)
+    assert ks.get_memory_summary.await_count == 3
 
 
 @pytest.mark.asyncio
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from remy.ai.tools.analytics import (
     exec_consolidate_memory,
     exec_generate_retrospective,
+    exec_get_costs,
     exec_get_goal_status,
     exec_get_stats,
     exec_list_background_jobs,
 )
+from remy.utils.ttl_cache import TTLCache
 
 
 USER_ID = 42
@@ -24,6 +26,7 @@ def make_registry(**kwargs) -> MagicMock:
     registry._conversation_analyzer = kwargs.get("conversation_analyzer")
     registry._claude_client = kwargs.get("claude_client")
     registry._job_store = kwargs.get("job_store")
+    registry._summary_cache = TTLCache(maxsize=8, ttl=10)
     
     if "proactive_scheduler" in kwargs:
         registry._scheduler_ref = {"proactive_scheduler": kwargs["proactive_scheduler"]}
@@ -82,6 +85,41 @@ class TestExecGetGoalStatus:
         result = await exec_get_goal_status(registry, USER_ID)
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_query_failure_returns_error_and_is_not_cached(self):
+        """A failure in either goal query should return the error message uncached."""
+        analyzer = AsyncMock()
+        analyzer.get_active_goals_with_age = AsyncMock(return_value=[])
+        analyzer.get_completed_goals_since = AsyncMock(side_effect=RuntimeError("db gone"))
+        registry = make_registry(conversation_analyzer=analyzer)
+
+        result = await exec_get_goal_status(registry, USER_ID)
+
+        assert result == "Could not load goal status: db gone"
+        assert (USER_ID, "goal_status") not in registry._summary_cache
+
+
+class TestExecGetCosts:
+    """Tests for exec_get_costs executor."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_period_is_served_from_summary_cache(self):
+        """A second call for the same period should not re-query api_calls."""
+        registry = make_registry(conversation_analyzer=MagicMock(_db=MagicMock()))
+        with patch("remy.ai.tools.analytics.CostAnalyzer") as cls:
+            cls.return_value.get_cost_summary = AsyncMock(return_value="summary")
+            cls.return_value.format_cost_message.return_value = "💰 $1.00"
+
+            first = await exec_get_costs(registry, {"period": "7d"}, USER_ID)
+            second = await exec_get_costs(registry, {"period": "7d"}, USER_ID)
+            await exec_get_costs(registry, {"period": "bogus"}, USER_ID)
+
+        assert first == second == "💰 $1.00"
+        assert [c.args for c in cls.return_value.get_cost_summary.await_args_list] == [
+            (USER_ID, "7d"),
+            (USER_ID, "30d"),
+        ]
+
 
 class TestExecGenerateRetrospective:
     """Tests for exec_generate_retrospective executor."""
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from zoneinfo import ZoneInfo
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from remy.ai.tools.automations import (
+    _BREAKDOWN_SYSTEM,
     exec_breakdown_task,
     exec_grocery_list,
     exec_list_reminders,
@@ -127,6 +128,30 @@ class TestExecScheduleReminder:
             99, USER_ID, "Sobriety check", "0 17 * * *", mediated=True
         )
 
+    @pytest.mark.asyncio
+    async def test_times_create_all_reminders_in_one_store_call(self):
+        store = AsyncMock()
+        store.add_many = AsyncMock(return_value=[5, 6])
+        sched = MagicMock()
+        registry = make_registry(
+            automation_store=store, scheduler_ref={"proactive_scheduler": sched}
+        )
+
+        result = await exec_schedule_reminder(
+            registry,
+            {"label": "Meds", "frequency": "daily", "times": ["08:00", "20:30"]},
+            USER_ID,
+        )
+
+        store.add.assert_not_called()
+        store.add_many.assert_awaited_once_with(
+            USER_ID,
+            [("Meds", "0 8 * * *", None, False), ("Meds", "30 20 * * *", None, False)],
+        )
+        assert sched.add_automation.call_count == 2
+        assert "• ID 5 — fires every day at 08:00" in result
+        assert "• ID 6 — fires every day at 20:30" in result
+
 
 class TestExecListReminders:
     """Tests for exec_list_reminders executor."""
@@ -170,6 +195,23 @@ class TestExecListReminders:
         assert "daily" in result.lower()
         assert "09:00" in result
 
+    @pytest.mark.asyncio
+    async def test_weekly_reminders_share_parsed_cron(self):
+        row = {"fire_at": None, "last_run_at": None, "mediated": 1, "cron": "5 7 * * 1"}
+        store = AsyncMock()
+        store.get_all = AsyncMock(
+            return_value=[
+                {**row, "id": 1, "label": "Bins"},
+                {**row, "id": 2, "label": "Gym"},
+            ]
+        )
+        registry = make_registry(automation_store=store)
+
+        result = await exec_list_reminders(registry, USER_ID)
+
+        assert result.count("every Monday at 07:05") == 2
+        assert "mediated" in result
+
     @pytest.mark.asyncio
     async def test_one_time_reminder_shows_friendly_time(self):
         store = AsyncMock()
@@ -269,6 +311,30 @@ class TestExecSetOneTimeReminder:
         )
         assert "invalid" in result.lower() or "format" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_naive_fire_at_uses_scheduler_timezone(self, monkeypatch):
+        # Two hours from now on a UTC wall clock: already past in UTC+14,
+        # still ahead in UTC-11.
+        fire_at = (datetime.now(UTC) + timedelta(hours=2)).strftime("%Y-%m-%dT%H:%M:%S")
+        store = AsyncMock()
+        store.add = AsyncMock(return_value=1)
+        registry = make_registry(automation_store=store)
+
+        monkeypatch.setenv("SCHEDULER_TIMEZONE", "Pacific/Kiritimati")
+        monkeypatch.setattr("remy.config._settings", None)
+        result = await exec_set_one_time_reminder(
+            registry, {"label": "Call", "fire_at": fire_at}, USER_ID
+        )
+        assert "past" in result.lower()
+
+        monkeypatch.setenv("SCHEDULER_TIMEZONE", "Pacific/Pago_Pago")
+        monkeypatch.setattr("remy.config._settings", None)
+        result = await exec_set_one_time_reminder(
+            registry, {"label": "Call", "fire_at": fire_at}, USER_ID
+        )
+        assert "past" not in result.lower()
+        store.add.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_past_time_rejected(self):
         store = AsyncMock()
@@ -278,6 +344,26 @@ class TestExecSetOneTimeReminder:
         )
         assert "past" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_naive_time_is_local_and_aware_time_is_respected(self):
+        soon_utc = datetime.now(UTC) + timedelta(minutes=30)
+        store = AsyncMock()
+        store.add = AsyncMock(return_value=7)
+        registry = make_registry(automation_store=store)
+
+        # 30 minutes ahead in UTC is hours in the past as Canberra local time
+        naive = soon_utc.replace(tzinfo=None).isoformat(timespec="seconds")
+        result = await exec_set_one_time_reminder(
+            registry, {"label": "Naive", "fire_at": naive}, USER_ID
+        )
+        assert "past" in result.lower()
+
+        aware = soon_utc.isoformat(timespec="seconds")
+        result = await exec_set_one_time_reminder(
+            registry, {"label": "Aware", "fire_at": aware}, USER_ID
+        )
+        assert "ID 7" in result
+
     @pytest.mark.asyncio
     async def test_creates_reminder_with_future_time(self):
         store = AsyncMock()
@@ -328,6 +414,7 @@ class TestExecBreakdownTask:
 
         result = await exec_breakdown_task(registry, {"task": "Plan a party"})
         assert isinstance(result, str)
+        assert claude.complete.await_args.kwargs["system"] == _BREAKDOWN_SYSTEM
 
 
 class TestExecGroceryList:
@@ -349,7 +436,7 @@ class TestExecGroceryList:
     @pytest.mark.asyncio
     async def test_show_action_returns_string(self):
         ks = AsyncMock()
-        ks.get_by_type = AsyncMock(return_value=[])
+        ks.get_by_type_projected = AsyncMock(return_value=[])
         registry = make_registry(knowledge_store=ks)
 
         result = await exec_grocery_list(registry, {"action": "show"}, USER_ID)
@@ -365,6 +452,35 @@ class TestExecGroceryList:
         )
         assert "specify" in result.lower() or "provide" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_add_action_splits_on_commas_and_semicolons(self):
+        ks = AsyncMock()
+        registry = make_registry(knowledge_store=ks)
+
+        result = await exec_grocery_list(
+            registry, {"action": "add", "items": "milk; eggs ,, bread;"}, USER_ID
+        )
+
+        added = [item.content for item in ks.upsert.call_args.args[1]]
+        assert added == ["milk", "eggs", "bread"]
+        assert result == "✅ Added to shopping list: milk, eggs, bread"
+
+    @pytest.mark.asyncio
+    async def test_remove_action_deletes_by_substring_in_store(self):
+        ks = AsyncMock()
+        ks.delete_containing = AsyncMock(return_value=2)
+        registry = make_registry(knowledge_store=ks)
+
+        result = await exec_grocery_list(
+            registry, {"action": "remove", "items": "weissbier"}, USER_ID
+        )
+
+        ks.delete_containing.assert_awaited_once_with(
+            USER_ID, "shopping_item", "weissbier"
+        )
+        ks.get_by_type_projected.assert_not_called()
+        assert "Removed 2 item(s)" in result
+
     @pytest.mark.asyncio
     async def test_unknown_action_returns_error(self):
         ks = AsyncMock()
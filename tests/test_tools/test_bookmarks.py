@@ -142,43 +142,44 @@ class TestExecListBookmarks:
     @pytest.mark.asyncio
     async def test_list_empty_with_knowledge_store(self):
         store = AsyncMock()
-        store.get_by_type = AsyncMock(return_value=[])
+        store.get_facts_matching = AsyncMock(return_value=(0, []))
         registry = make_registry(knowledge_store=store)
         registry._fact_store = None
         result = await exec_list_bookmarks(registry, {}, USER_ID)
         assert "No bookmarks saved" in result
-        store.get_by_type.assert_called_once_with(USER_ID, "fact", limit=50)
+        store.get_facts_matching.assert_called_once_with(
+            USER_ID, "bookmark", tag=None, contains="", limit=20
+        )
 
     @pytest.mark.asyncio
     async def test_list_with_results_from_knowledge_store(self):
-        from remy.models import KnowledgeItem
-
-        items = [
-            KnowledgeItem(
-                entity_type="fact",
-                content="https://a.com — note",
-                metadata={"category": "bookmark"},
-            ),
-            KnowledgeItem(
-                entity_type="fact",
-                content="https://b.com",
-                metadata={"category": "bookmark"},
-            ),
-            KnowledgeItem(
-                entity_type="fact",
-                content="other fact",
-                metadata={"category": "other"},
-            ),
-        ]
         store = AsyncMock()
-        store.get_by_type = AsyncMock(return_value=items)
+        store.get_facts_matching = AsyncMock(
+            return_value=(2, ["https://a.com — note", "https://b.com"])
+        )
         registry = make_registry(knowledge_store=store)
         registry._fact_store = None
         result = await exec_list_bookmarks(registry, {}, USER_ID)
         assert "2 item(s)" in result
         assert "https://a.com" in result
         assert "https://b.com" in result
-        assert "other fact" not in result
+
+    @pytest.mark.asyncio
+    async def test_substring_filter_is_pushed_to_store(self):
+        store = AsyncMock()
+        store.get_facts_matching = AsyncMock(return_value=(25, ["https://a.com"] * 20))
+        registry = make_registry(knowledge_store=store)
+        registry._fact_store = None
+        result = await exec_list_bookmarks(registry, {"filter": "Recipes"}, USER_ID)
+        store.get_facts_matching.assert_called_once_with(
+            USER_ID, "bookmark", tag=None, contains="recipes", limit=20
+        )
+        assert "(filtered) — 25 item(s)" in result
+        assert "…and 5 more" in result
+
+        store.get_facts_matching = AsyncMock(return_value=(0, []))
+        result = await exec_list_bookmarks(registry, {"filter": "nope"}, USER_ID)
+        assert "No bookmarks matching 'nope'" in result
 
     @pytest.mark.asyncio
     async def test_list_empty_with_fact_store(self):
@@ -205,25 +206,16 @@ class TestExecListBookmarks:
     @pytest.mark.asyncio
     async def test_list_filters_by_tag_when_tag_in_allowed_set(self):
         """US-bookmarks-tag-buttons: list_bookmarks with tag=work returns only work bookmarks."""
-        from remy.models import KnowledgeItem
-
-        items = [
-            KnowledgeItem(
-                entity_type="fact",
-                content="https://work.com — work link",
-                metadata={"category": "bookmark", "tag": "work"},
-            ),
-            KnowledgeItem(
-                entity_type="fact",
-                content="https://personal.com",
-                metadata={"category": "bookmark", "tag": "personal"},
-            ),
-        ]
         store = AsyncMock()
-        store.get_by_type = AsyncMock(return_value=items)
+        store.get_facts_matching = AsyncMock(
+            return_value=(1, ["https://work.com — work link"])
+        )
         registry = make_registry(knowledge_store=store)
         registry._fact_store = None
         result = await exec_list_bookmarks(registry, {"tag": "work"}, USER_ID)
+        store.get_facts_matching.assert_called_once_with(
+            USER_ID, "bookmark", tag="work", contains="", limit=20
+        )
         assert "1 item(s)" in result or "work" in result
         assert "https://work.com" in result
         assert "tag: work" in result or "(tag: work)" in result
@@ -7,12 +7,14 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from remy.ai.tools.calendar import exec_calendar_events, exec_create_calendar_event
+from remy.utils.ttl_cache import TTLCache
 
 
 def make_registry(**kwargs) -> MagicMock:
     """Create a mock registry with sensible defaults."""
     registry = MagicMock()
     registry._calendar = kwargs.get("calendar")
+    registry._calendar_cache = TTLCache(maxsize=8, ttl=60)
     return registry
 
 
@@ -47,6 +49,23 @@ class TestExecCalendarEvents:
         
         assert "error" in result.lower() or "could not" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_repeat_read_is_cached_until_an_event_is_created(self):
+        calendar = AsyncMock()
+        calendar.list_events = AsyncMock(return_value=[{"summary": "Standup"}])
+        calendar.format_event = MagicMock(return_value="• Standup")
+        registry = make_registry(calendar=calendar)
+
+        first = await exec_calendar_events(registry, {"days": 3})
+        assert await exec_calendar_events(registry, {"days": 3}) == first
+        calendar.list_events.assert_awaited_once_with(days=3)
+
+        await exec_create_calendar_event(
+            registry, {"title": "Lunch", "date": "2026-06-01", "time": "12:00"}
+        )
+        await exec_calendar_events(registry, {"days": 3})
+        assert calendar.list_events.await_count == 2
+
 
 class TestExecCreateCalendarEvent:
     """Tests for exec_create_calendar_event executor."""
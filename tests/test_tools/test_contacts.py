@@ -13,12 +13,14 @@ from remy.ai.tools.contacts import (
     exec_upcoming_birthdays,
     exec_update_contact_note,
 )
+from remy.utils.ttl_cache import TTLCache
 
 
 def make_registry(**kwargs) -> MagicMock:
     """Create a mock registry with sensible defaults."""
     registry = MagicMock()
     registry._contacts = kwargs.get("contacts")
+    registry._contacts_cache = TTLCache(maxsize=8, ttl=300)
     return registry
 
 
@@ -61,6 +63,23 @@ class TestExecSearchContacts:
         result = await exec_search_contacts(registry, {"query": "John"})
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_repeat_search_is_cached_until_a_note_is_updated(self):
+        person = {"resourceName": "people/1", "names": [{"displayName": "John"}]}
+        contacts = AsyncMock()
+        contacts.search_contacts = AsyncMock(return_value=[person])
+        registry = make_registry(contacts=contacts)
+
+        first = await exec_search_contacts(registry, {"query": "John"})
+        second = await exec_search_contacts(registry, {"query": "john"})
+        assert first.startswith("Contacts matching 'John':")
+        assert second == first.replace("'John'", "'john'")
+        contacts.search_contacts.assert_awaited_once()
+
+        await exec_update_contact_note(registry, {"name": "John", "note": "Hi"})
+        await exec_search_contacts(registry, {"query": "John"})
+        assert contacts.search_contacts.await_count == 3
+
 
 class TestExecUpcomingBirthdays:
     """Tests for exec_upcoming_birthdays executor."""
@@ -113,6 +132,53 @@ class TestExecGetContactDetails:
         assert "no contact" in result.lower() or "not found" in result.lower()
 
 
+    @pytest.mark.asyncio
+    async def test_uses_full_search_result_without_refetch(self):
+        """Details come from a full-field search; no per-contact get_contact."""
+        person = {
+            "resourceName": "people/c1",
+            "names": [{"displayName": "Ada Lovelace"}],
+            "biographies": [{"value": "Met at the conference"}],
+        }
+        contacts = AsyncMock()
+        contacts.search_contacts = AsyncMock(return_value=[person])
+        registry = make_registry(contacts=contacts)
+
+        result = await exec_get_contact_details(registry, {"name": "Ada"})
+
+        contacts.search_contacts.assert_awaited_once_with(
+            "Ada", max_results=5, full_details=True
+        )
+        contacts.get_contact.assert_not_awaited()
+        assert "Ada Lovelace" in result and "Met at the conference" in result
+
+
+    @pytest.mark.asyncio
+    async def test_names_are_searched_concurrently_and_rendered_in_order(self):
+        """Each name gets its own search; failures and misses stay per-name."""
+
+        async def search(name, max_results, full_details):
+            if name == "Bob":
+                raise RuntimeError("quota")
+            if name == "Cy":
+                return []
+            return [{"names": [{"displayName": "Ada Lovelace"}]}]
+
+        contacts = AsyncMock()
+        contacts.search_contacts = AsyncMock(side_effect=search)
+        registry = make_registry(contacts=contacts)
+
+        result = await exec_get_contact_details(
+            registry, {"names": ["Ada", " ", "Bob", "Cy"]}
+        )
+
+        assert contacts.search_contacts.await_count == 3
+        ada, bob, cy = result.split("\n\n---\n\n")
+        assert "Ada Lovelace" in ada
+        assert bob == "Search failed: quota"
+        assert cy == "No contact found matching 'Cy'."
+
+
 class TestExecUpdateContactNote:
     """Tests for exec_update_contact_note executor."""
 
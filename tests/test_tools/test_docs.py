@@ -0,0 +1,58 @@
+"""Tests for remy.ai.tools.docs module."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from remy.ai.tools.docs import exec_append_to_gdoc, exec_read_gdoc
+from remy.utils.ttl_cache import TTLCache
+
+USER_ID = 42
+
+
+def make_registry(**kwargs) -> MagicMock:
+    """Create a mock registry with sensible defaults."""
+    registry = MagicMock()
+    registry._docs = kwargs.get("docs")
+    registry._gdoc_cache = TTLCache(maxsize=8, ttl=600)
+    return registry
+
+
+class TestExecReadGdoc:
+    """Tests for exec_read_gdoc executor."""
+
+    @pytest.mark.asyncio
+    async def test_no_docs_returns_not_configured(self):
+        registry = make_registry(docs=None)
+        result = await exec_read_gdoc(registry, {"doc_id_or_url": "abc"}, USER_ID)
+        assert "not configured" in result.lower()
+
+    @pytest.mark.asyncio
+    async def test_read_error_is_not_cached(self):
+        docs = AsyncMock()
+        docs.read_document = AsyncMock(side_effect=Exception("API Error"))
+        registry = make_registry(docs=docs)
+
+        result = await exec_read_gdoc(registry, {"doc_id_or_url": "abc"}, USER_ID)
+        assert "could not read" in result.lower()
+        assert len(registry._gdoc_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_repeat_read_is_cached_until_text_is_appended(self):
+        docs = AsyncMock()
+        docs.read_document = AsyncMock(return_value=("Notes", "Hello"))
+        registry = make_registry(docs=docs)
+
+        inp = {"doc_id_or_url": "abc"}
+        first = await exec_read_gdoc(registry, inp, USER_ID)
+        assert first == "Google Doc: Notes\n\nHello"
+        assert await exec_read_gdoc(registry, inp, USER_ID) == first
+        docs.read_document.assert_awaited_once()
+
+        await exec_append_to_gdoc(
+            registry, {"doc_id_or_url": "abc", "text": "More"}, USER_ID
+        )
+        await exec_read_gdoc(registry, inp, USER_ID)
+        assert docs.read_document.await_count == 2
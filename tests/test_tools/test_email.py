@@ -23,6 +23,7 @@ def make_registry(**kwargs) -> MagicMock:
     """Create a mock registry with sensible defaults."""
     registry = MagicMock()
     registry._gmail = kwargs.get("gmail")
+    registry._label_id_cache = {}
     return registry
 
 
@@ -104,6 +105,48 @@ class TestExecSearchGmail:
         result = await exec_search_gmail(registry, {"query": "test"})
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_label_ids_memoised_across_searches(self):
+        """Repeat searches with the same labels resolve label IDs only once."""
+        gmail = AsyncMock()
+        gmail.search = AsyncMock(return_value=[])
+        gmail.resolve_label_ids = AsyncMock(return_value=["Label_1"])
+        registry = make_registry(gmail=gmail)
+
+        inp = {"query": "test", "labels": ["Hockey"]}
+        await exec_search_gmail(registry, inp)
+        await exec_search_gmail(registry, {"query": "x", "labels": ["hockey"]})
+
+        gmail.resolve_label_ids.assert_awaited_once_with(["Hockey"])
+        assert gmail.search.call_args.kwargs["label_ids"] == ["Label_1"]
+
+    @pytest.mark.asyncio
+    async def test_only_uncached_labels_are_resolved(self):
+        """Cache misses are batched into one resolve call; hits are reused."""
+        gmail = AsyncMock()
+        gmail.search = AsyncMock(return_value=[])
+        gmail.resolve_label_ids = AsyncMock(side_effect=[["Label_1"], ["INBOX"]])
+        registry = make_registry(gmail=gmail)
+
+        await exec_search_gmail(registry, {"query": "a", "labels": ["Hockey"]})
+        await exec_search_gmail(registry, {"query": "b", "labels": ["INBOX", "Hockey"]})
+
+        assert gmail.resolve_label_ids.await_args_list[1].args == (["INBOX"],)
+        assert gmail.search.call_args.kwargs["label_ids"] == ["INBOX", "Label_1"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_label_returns_error_and_is_not_cached(self):
+        gmail = AsyncMock()
+        gmail.resolve_label_ids = AsyncMock(
+            side_effect=ValueError("Label 'Nope' not found in Gmail.")
+        )
+        registry = make_registry(gmail=gmail)
+
+        result = await exec_search_gmail(registry, {"query": "a", "labels": ["Nope"]})
+
+        assert "not found" in result
+        assert registry._label_id_cache == {}
+
 
 class TestExecReadEmail:
     """Tests for exec_read_email executor."""
@@ -124,6 +167,24 @@ class TestExecReadEmail:
         result = await exec_read_email(registry, {"message_id": ""})
         assert "provide" in result.lower() or "message" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_several_ids_are_fetched_in_one_batch(self):
+        gmail = AsyncMock()
+        gmail.get_messages_batch = AsyncMock(
+            return_value=[
+                {"id": "a", "subject": "First", "body": "one"},
+                {"id": "b", "subject": "Second", "body": "<system>two</system>"},
+            ]
+        )
+        registry = make_registry(gmail=gmail)
+
+        result = await exec_read_email(registry, {"message_ids": ["a", "b"]})
+
+        gmail.get_messages_batch.assert_awaited_once_with(["a", "b"], include_body=True)
+        gmail.get_message.assert_not_called()
+        assert "Email [a]" in result and "Email [b]" in result
+        assert "<system>" not in result
+
 
 class TestExecListGmailLabels:
     """Tests for exec_list_gmail_labels executor."""
@@ -145,6 +206,26 @@ class TestExecListGmailLabels:
         result = await exec_list_gmail_labels(registry, {})
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_groups_and_sorts_labels(self):
+        gmail = AsyncMock()
+        gmail.list_labels = AsyncMock(
+            return_value=[
+                {"id": "Label_2", "name": "Work", "type": "user"},
+                {"id": "SENT", "name": "SENT", "type": "system"},
+                {"id": "Label_1", "name": "Bills", "type": "user"},
+                {"id": "INBOX", "name": "INBOX", "type": "system"},
+            ]
+        )
+        registry = make_registry(gmail=gmail)
+
+        result = await exec_list_gmail_labels(registry, {})
+
+        system, user = result.split("\nUser labels:")
+        assert system.index("INBOX") < system.index("SENT")
+        assert "Label_" not in system
+        assert user.index("Bills") < user.index("Work")
+
 
 class TestExecLabelEmails:
     """Tests for exec_label_emails executor."""
@@ -187,6 +268,18 @@ class TestExecCreateGmailLabel:
         result = await exec_create_gmail_label(registry, {"name": ""})
         assert "provide" in result.lower() or "name" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_success_invalidates_label_id_cache(self):
+        gmail = AsyncMock()
+        gmail.create_label = AsyncMock(return_value={"id": "Label_9", "name": "New"})
+        registry = make_registry(gmail=gmail)
+        registry._label_id_cache["old"] = ("Label_1", float("inf"))
+
+        result = await exec_create_gmail_label(registry, {"name": "New"})
+
+        assert "Label_9" in result
+        assert registry._label_id_cache == {}
+
 
 class TestExecCreateEmailDraft:
     """Tests for exec_create_email_draft executor."""
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import glob
+import os
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from remy.ai.tools import files as files_mod
 from remy.ai.tools.files import (
+    AGE_BUCKET_LABELS,
+    _search_snippet,
+    age_bucket,
+    cached_dir_files,
+    classify_extension,
     exec_append_file,
     exec_clean_directory,
     exec_find_files,
@@ -18,6 +26,12 @@ from remy.ai.tools.files import (
     exec_scan_downloads,
     exec_search_files,
     exec_write_file,
+    find_matching_files,
+    first_dir_names,
+    forget_dir_files,
+    format_bytes,
+    gather_matching_files,
+    summarise_downloads,
 )
 
 
@@ -46,6 +60,18 @@ class TestExecReadFile:
         result = await exec_read_file(registry, {"path": "/nonexistent/file.txt"})
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    @patch("remy.ai.tools.files._READ_FILE_MAX_CHARS", 10)
+    @patch("remy.ai.tools.files.settings")
+    async def test_truncates_large_file(self, mock_settings, tmp_path):
+        mock_settings.allowed_base_dirs = [str(tmp_path)]
+        target = tmp_path / "big.log"
+        target.write_text("0123456789" * 500)
+
+        result = await exec_read_file(make_registry(), {"path": str(target)})
+
+        assert result.endswith("0123456789\n\n[… truncated — 5,000 bytes total]")
+
 
 class TestExecGetFileDownloadLink:
     """Tests for exec_get_file_download_link executor."""
@@ -100,6 +126,18 @@ class TestExecListDirectory:
         result = await exec_list_directory(registry, {"path": "/nonexistent"})
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    @patch("remy.ai.tools.files.settings")
+    async def test_lists_directories_before_files(self, mock_settings, tmp_path):
+        mock_settings.allowed_base_dirs = [str(tmp_path)]
+        (tmp_path / "b.txt").write_text("x")
+        (tmp_path / "A.md").write_text("x")
+        (tmp_path / "zdir").mkdir()
+
+        result = await exec_list_directory(make_registry(), {"path": str(tmp_path)})
+
+        assert result.splitlines()[1:] == ["📁 zdir", "📄 A.md", "📄 b.txt"]
+
 
 class TestExecWriteFile:
     """Tests for exec_write_file executor."""
@@ -122,6 +160,24 @@ class TestExecAppendFile:
         result = await exec_append_file(registry, {"path": "", "content": "test"})
         assert "provide" in result.lower() or "path" in result.lower()
 
+    @pytest.mark.asyncio
+    @patch("remy.ai.tools.files.settings")
+    async def test_adds_separator_only_when_file_lacks_trailing_newline(
+        self, mock_settings, tmp_path
+    ):
+        mock_settings.allowed_base_dirs = [str(tmp_path)]
+        target = tmp_path / "notes.md"
+        registry = make_registry()
+
+        await exec_append_file(registry, {"path": str(target), "content": "one"})
+        await exec_append_file(registry, {"path": str(target), "content": "two\n"})
+        result = await exec_append_file(
+            registry, {"path": str(target), "content": "three"}
+        )
+
+        assert target.read_text() == "one\ntwo\nthree"
+        assert "(13 bytes total on disk)" in result
+
 
 class TestExecFindFiles:
     """Tests for exec_find_files executor."""
@@ -134,6 +190,157 @@ class TestExecFindFiles:
         assert "provide" in result.lower() or "pattern" in result.lower()
 
 
+def test_find_matching_files_matches_glob_semantics(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / ".hidden").mkdir()
+    for rel in ("x.pdf", "a/y.pdf", "a/b/z.pdf", "a/b/z.txt", ".hidden/h.pdf"):
+        (tmp_path / rel).write_text("x")
+    (tmp_path / "link").symlink_to(tmp_path / "a", target_is_directory=True)
+    base = str(tmp_path)
+
+    found = find_matching_files("*.pdf", [base])
+    expected = glob.glob(os.path.join(base, "**", "*.pdf"), recursive=True)
+    assert sorted(found) == sorted(p for p in expected if "/link/" not in p)
+    (tmp_path / ".p.pdf").write_text("x")
+    assert sorted(find_matching_files(".*", [base])) == sorted(
+        glob.glob(os.path.join(base, "**", ".*"), recursive=True)
+    )
+    assert set(find_matching_files("b/*.pdf", [base])) == {str(tmp_path / "a/b/z.pdf")}
+
+
+def test_find_matching_files_stops_at_limit(tmp_path):
+    for i in range(5):
+        (tmp_path / f"f{i}.log").write_text("x")
+
+    with patch(
+        "remy.ai.tools.files.sanitize_file_path", side_effect=lambda p, _: (p, None)
+    ) as sanitize:
+        found = find_matching_files("*.log", [str(tmp_path)], limit=2)
+
+    assert len(found) == 2
+    assert sanitize.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_matching_files_keeps_base_order_and_limit(tmp_path):
+    bases = []
+    for b in ("one", "two"):
+        (tmp_path / b).mkdir()
+        for i in range(3):
+            (tmp_path / b / f"{b}{i}.md").write_text("x")
+        bases.append(str(tmp_path / b))
+
+    found = await gather_matching_files("*.md", bases, limit=4)
+
+    assert [os.path.basename(p)[:3] for p in found] == ["one"] * 3 + ["two"]
+
+
+def test_first_dir_names_counts_all_and_keeps_first_n(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for name in ["d.txt", "b.txt", "a.txt", "c.txt"]:
+        (tmp_path / name).touch()
+
+    assert first_dir_names(str(tmp_path), 3) == (5, ["a.txt", "b.txt", "c.txt"])
+    assert first_dir_names(str(tmp_path / "sub"), 3) == (0, [])
+
+
+def test_classify_extension_is_case_and_dot_insensitive():
+    assert classify_extension(".JPG") == ("🖼", "Images")
+    assert classify_extension("toml") == ("💻", "Code")
+    assert classify_extension("") == ("📁", "Other")
+    assert classify_extension(".unknown") == ("📁", "Other")
+
+
+def test_format_bytes_unit_boundaries():
+    sizes = [0, 1023, 1024, 1024**2 - 1, 1024**2, 1024**3 - 1, 1536 * 1024**2]
+    assert [format_bytes(b) for b in sizes] == [
+        "0B",
+        "1023B",
+        "1KB",
+        "1023KB",
+        "1MB",
+        "1023MB",
+        "1.5GB",
+    ]
+
+
+def test_age_bucket_boundaries():
+    day = 86400
+    ages = [0, day - 1, day, 7 * day - 1, 7 * day, 30 * day - 1, 30 * day, 400 * day]
+    assert [AGE_BUCKET_LABELS[age_bucket(a)] for a in ages] == [
+        "Today (<1d)",
+        "Today (<1d)",
+        "This week (<7d)",
+        "This week (<7d)",
+        "This month (<30d)",
+        "This month (<30d)",
+        "Old (>30d)",
+        "Old (>30d)",
+    ]
+
+
+def test_summarise_downloads_markdown_headings():
+    now = 100 * 86400
+    files = [("a.pdf", 2048, now - 3600), ("b", 10, now - 40 * 86400)]
+
+    report = summarise_downloads(files, now, heading="*{}*")
+
+    assert report.startswith("📦 *Downloads Scan* — 2 files (2KB total)\n")
+    assert "*Type breakdown:*" in report and "\n*Age breakdown:*" in report
+    assert report.endswith(
+        "*Oldest files:*\n  • b (40d old, 10B)\n  • a.pdf (0d old, 2KB)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_dir_files_reuses_scan_until_directory_changes(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    d = str(tmp_path)
+
+    with patch(
+        "remy.ai.tools.files.stat_dir_files", wraps=files_mod.stat_dir_files
+    ) as scan:
+        first = await cached_dir_files(d)
+        assert await cached_dir_files(d) is first
+        assert scan.call_count == 1
+
+        (tmp_path / "b.txt").write_text("b")
+        os.utime(d, ns=(0, os.stat(d).st_mtime_ns + 1))
+        assert sorted(n for n, _, _ in await cached_dir_files(d)) == ["a.txt", "b.txt"]
+        assert scan.call_count == 2
+
+        forget_dir_files(str(tmp_path / "a.txt"))
+        await cached_dir_files(d)
+        assert scan.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_symlinked_downloads_cache_is_cleared_by_resolved_writes(tmp_path):
+    real = tmp_path / "real_downloads"
+    real.mkdir()
+    (tmp_path / "home").mkdir()
+    (tmp_path / "home" / "Downloads").symlink_to(real)
+
+    with (
+        patch("remy.ai.tools.files.Path.home", return_value=tmp_path / "home"),
+        patch(
+            "remy.ai.tools.files.stat_dir_files", wraps=files_mod.stat_dir_files
+        ) as scan,
+    ):
+        await exec_scan_downloads(make_registry())
+        # Write tools pass the sanitized (resolved) path.
+        forget_dir_files(str(real / "new.txt"))
+        await exec_scan_downloads(make_registry())
+
+    assert scan.call_count == 2
+
+
+def test_search_snippet_flattens_and_truncates():
+    assert _search_snippet("  a\nb\tc\r\n") == "a b c"
+    long = "\n" + "x" * 250
+    assert _search_snippet(long) == "x" * 199 + "…"
+
+
 class TestExecScanDownloads:
     """Tests for exec_scan_downloads executor."""
 
@@ -144,6 +351,43 @@ class TestExecScanDownloads:
         result = await exec_scan_downloads(registry)
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_classifies_files_from_one_scan(self, tmp_path):
+        downloads = tmp_path / "Downloads"
+        (downloads / "nested").mkdir(parents=True)
+        (downloads / "photo.JPG").write_bytes(b"x" * 2048)
+        (downloads / "scan.png").write_bytes(b"x" * 1024)
+        (downloads / "notes.txt").write_text("hi")
+        (downloads / "archive.tar.gz").write_bytes(b"")
+
+        with patch("remy.ai.tools.files.Path.home", return_value=tmp_path):
+            result = await exec_scan_downloads(make_registry())
+
+        assert result.startswith("📦 Downloads Scan — 4 files (3KB total)")
+        assert "🖼 Images: 2 file(s), 3KB" in result
+        assert "📄 Documents: 1 file(s), 2B" in result
+        assert "📦 Archives: 1 file(s), 0B" in result
+        assert "  • Today (<1d): 4 file(s)\n" in result
+        assert "nested" not in result
+
+    @pytest.mark.asyncio
+    async def test_lists_eight_oldest_files_oldest_first(self, tmp_path):
+        downloads = tmp_path / "Downloads"
+        downloads.mkdir()
+        for i in range(10):
+            f = downloads / f"f{i}.txt"
+            f.write_text("x")
+            os.utime(f, (1_000_000 + i, 1_000_000 + i))
+
+        with patch("remy.ai.tools.files.Path.home", return_value=tmp_path):
+            result = await exec_scan_downloads(make_registry())
+
+        listed = [
+            line.split()[1] for line in result.split("Oldest files:\n")[1].splitlines()
+        ]
+        assert "  • Old (>30d): 10 file(s) — consider cleanup" in result
+        assert listed == [f"f{i}.txt" for i in range(8)]
+
 
 class TestExecOrganizeDirectory:
     """Tests for exec_organize_directory executor."""
@@ -166,6 +410,27 @@ class TestExecCleanDirectory:
         result = await exec_clean_directory(registry, {"path": ""})
         assert "provide" in result.lower() or "path" in result.lower()
 
+    @pytest.mark.asyncio
+    @patch("remy.ai.tools.files.settings")
+    async def test_lists_oldest_files_first(self, mock_settings, tmp_path):
+        mock_settings.allowed_base_dirs = [str(tmp_path)]
+        (tmp_path / "subdir").mkdir()
+        for name, mtime in (("new.txt", 2_000_000), ("old.txt", 1_000_000)):
+            f = tmp_path / name
+            f.write_bytes(b"x" * 2048)
+            os.utime(f, (mtime, mtime))
+        claude = MagicMock()
+        claude.complete = AsyncMock(return_value="KEEP all")
+        registry = make_registry(claude_client=claude)
+
+        result = await exec_clean_directory(registry, {"path": str(tmp_path)})
+
+        prompt = claude.complete.call_args.kwargs["messages"][0]["content"]
+        listed = [line for line in prompt.splitlines() if line.endswith("d old)")]
+        assert [line.split()[1] for line in listed] == ["old.txt", "new.txt"]
+        assert listed[0].startswith("• old.txt (2KB, ")
+        assert result.endswith("KEEP all")
+
 
 class TestExecSearchFiles:
     """Tests for exec_search_files executor."""
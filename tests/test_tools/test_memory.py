@@ -16,6 +16,7 @@ from remy.ai.tools.memory import (
     exec_manage_memory,
     exec_run_board,
 )
+from remy.utils.ttl_cache import TTLCache
 
 
 USER_ID = 42
@@ -26,6 +27,7 @@ def make_registry(**kwargs) -> MagicMock:
     registry = MagicMock()
     registry._logs_dir = kwargs.get("logs_dir", "/tmp/test_logs")
     registry._knowledge_store = kwargs.get("knowledge_store")
+    registry._summary_cache = TTLCache(maxsize=8, ttl=10)
     registry._goal_store = kwargs.get("goal_store")
     registry._fact_store = kwargs.get("fact_store")
     registry._board_orchestrator = kwargs.get("board_orchestrator")
@@ -34,6 +36,7 @@ def make_registry(**kwargs) -> MagicMock:
     registry._moonshot_client = kwargs.get("moonshot_client")
     registry._ollama_base_url = kwargs.get("ollama_base_url", "http://localhost:11434")
     registry._model_complex = kwargs.get("model_complex", "claude-sonnet-4-6")
+    registry._session_start_cache = None
     return registry
 
 
@@ -48,8 +51,7 @@ class TestExecGetLogs:
             mock_thread.side_effect = [
                 0,  # get_session_start_line
                 None,  # get_session_start
-                "Error summary",
-                "Tail content",
+                ("Error summary", "Tail content"),  # get_diag_summary
             ]
             result = await exec_get_logs(registry, {"mode": "summary"})
 
@@ -92,6 +94,93 @@ class TestExecGetLogs:
         # The result should mention 100 lines (capped), not 500
         assert "100" in result or "logs" in result
 
+    @pytest.mark.asyncio
+    async def test_session_start_scanned_once_while_log_unchanged(self, tmp_path):
+        """Repeat startup-scoped calls reuse the memoised session start."""
+        import remy.ai.tools.memory as memory_tools
+
+        log = tmp_path / "remy.log"
+        log.write_text(
+            "2026-02-26 09:00:00 [INFO] remy.main: Starting remy\n"
+            "2026-02-26 09:00:01 [ERROR] remy.x: boom\n"
+        )
+        registry = make_registry(logs_dir=str(tmp_path))
+
+        with patch.object(
+            memory_tools,
+            "get_session_start_line",
+            wraps=memory_tools.get_session_start_line,
+        ) as scan:
+            await exec_get_logs(registry, {"mode": "errors"})
+            with log.open("a") as f:
+                f.write("2026-02-26 09:00:02 [WARNING] remy.x: later\n")
+            result = await exec_get_logs(registry, {"mode": "errors"})
+
+        assert scan.call_count == 1
+        assert "2026-02-26 09:00:00" in result
+        assert "later" in result
+
+    @pytest.mark.asyncio
+    async def test_session_start_rescanned_after_truncation(self, tmp_path):
+        import remy.ai.tools.memory as memory_tools
+
+        log = tmp_path / "remy.log"
+        log.write_text("2026-02-26 09:00:00 [INFO] remy.main: Starting remy\n" * 3)
+        registry = make_registry(logs_dir=str(tmp_path))
+
+        with patch.object(
+            memory_tools,
+            "get_session_start_line",
+            wraps=memory_tools.get_session_start_line,
+        ) as scan:
+            await exec_get_logs(registry, {"mode": "errors"})
+            log.write_text("2026-02-26 10:00:00 [INFO] remy.main: Starting remy\n")
+            result = await exec_get_logs(registry, {"mode": "errors"})
+
+        assert scan.call_count == 2
+        assert "10:00:00" in result
+
+    def test_diag_summary_matches_separate_scans(self, tmp_path):
+        """get_diag_summary returns the same output as the two separate scans."""
+        from remy.diagnostics import (
+            get_diag_summary,
+            get_error_summary,
+            get_recent_logs,
+        )
+
+        log = tmp_path / "remy.log"
+        log.write_text(
+            "2026-02-26 08:00:00 [ERROR] remy.x: old boom\n"
+            "2026-02-26 09:00:00 [INFO] remy.main: Starting remy\n"
+            "2026-02-26 09:00:01 [ERROR] remy.x: boom\n"
+            "2026-02-26 09:00:02 [WARNING] remy.x: careful\n"
+            + "2026-02-26 09:00:03 [INFO] remy.x: tick\n" * 12
+        )
+        data_dir = str(tmp_path)
+
+        summary, tail = get_diag_summary(data_dir, 5, 10, None, 1)
+
+        assert summary == get_error_summary(data_dir, 5, None, 1)
+        assert tail == get_recent_logs(data_dir, 10, None, None, 1)
+        assert "old boom" not in summary
+
+    def test_recent_logs_reads_tail_without_trailing_newline(self, tmp_path):
+        from remy.diagnostics import get_recent_logs
+
+        log = tmp_path / "remy.log"
+        log.write_text(
+            "2026-02-26 09:00:00 [ERROR] remy.x: first\n"
+            "2026-02-26 09:00:01 [INFO] remy.x: middle\n"
+            "2026-02-26 09:00:02 [ERROR] remy.x: last"
+        )
+
+        assert get_recent_logs(str(tmp_path), 2, "ERROR") == (
+            "2026-02-26 09:00:00 [ERROR] remy.x: first\n"
+            "2026-02-26 09:00:02 [ERROR] remy.x: last"
+        )
+        (tmp_path / "remy.log").write_text("")
+        assert get_recent_logs(str(tmp_path), 5) == "No recent logs found"
+
 
 class TestExecGetGoals:
     """Tests for exec_get_goals executor."""
@@ -281,11 +370,10 @@ class TestExecCheckStatus:
         """Should return 'Backend status' header."""
         registry = make_registry(claude_client=None)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=Exception("Connection refused")
-            )
-            result = await exec_check_status(registry)
+        registry._get_http_client.return_value.get = AsyncMock(
+            side_effect=Exception("Connection refused")
+        )
+        result = await exec_check_status(registry)
 
         assert "Backend status" in result
 
@@ -296,11 +384,10 @@ class TestExecCheckStatus:
         claude.ping = AsyncMock(return_value=True)
         registry = make_registry(claude_client=claude)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=Exception("Connection refused")
-            )
-            result = await exec_check_status(registry)
+        registry._get_http_client.return_value.get = AsyncMock(
+            side_effect=Exception("Connection refused")
+        )
+        result = await exec_check_status(registry)
 
         assert "Claude" in result
         assert "online" in result.lower()
@@ -310,11 +397,10 @@ class TestExecCheckStatus:
         """Should show warning when Claude not configured."""
         registry = make_registry(claude_client=None)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=Exception("Connection refused")
-            )
-            result = await exec_check_status(registry)
+        registry._get_http_client.return_value.get = AsyncMock(
+            side_effect=Exception("Connection refused")
+        )
+        result = await exec_check_status(registry)
 
         assert "Claude" in result
         assert "not configured" in result.lower()
@@ -327,11 +413,10 @@ class TestExecCheckStatus:
         moonshot.get_balance = AsyncMock(return_value=10.5)
         registry = make_registry(claude_client=None, moonshot_client=moonshot)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=Exception("Connection refused")
-            )
-            result = await exec_check_status(registry)
+        registry._get_http_client.return_value.get = AsyncMock(
+            side_effect=Exception("Connection refused")
+        )
+        result = await exec_check_status(registry)
 
         assert "Moonshot" in result
         assert "10.50" in result or "10.5" in result
@@ -345,15 +430,51 @@ class TestExecCheckStatus:
         moonshot.get_balance = AsyncMock(return_value=2.0)
         registry = make_registry(claude_client=None, moonshot_client=moonshot)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=Exception("Connection refused")
-            )
-            result = await exec_check_status(registry)
+        registry._get_http_client.return_value.get = AsyncMock(
+            side_effect=Exception("Connection refused")
+        )
+        result = await exec_check_status(registry)
 
         assert "Moonshot" in result
         assert "low" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_ollama_probe_uses_pooled_client(self):
+        """Ollama probe goes through the registry's shared HTTP client."""
+        registry = make_registry(claude_client=None)
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"models": [{"name": "llama3"}]}
+        registry._get_http_client.return_value.get = AsyncMock(return_value=resp)
+
+        result = await exec_check_status(registry)
+
+        assert "Ollama: ✅ online — llama3" in result
+        registry._get_http_client.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_probe_does_not_hide_other_backends(self):
+        """A backend that raises reports an error line; the rest still report, in order."""
+        mistral = AsyncMock()
+        mistral.is_available = AsyncMock(side_effect=RuntimeError("boom"))
+        moonshot = AsyncMock()
+        moonshot.is_available = AsyncMock(return_value=True)
+        moonshot.get_balance = AsyncMock(return_value=None)
+        registry = make_registry(
+            claude_client=None, mistral_client=mistral, moonshot_client=moonshot
+        )
+        registry._get_http_client.return_value.get = AsyncMock(
+            side_effect=Exception("Connection refused")
+        )
+
+        result = await exec_check_status(registry)
+
+        lines = result.splitlines()
+        assert lines[0] == "Backend status:"
+        assert lines[1].startswith("Claude:")
+        assert lines[2] == "Mistral: ❌ error (boom)"
+        assert lines[3] == "Moonshot: ✅ online"
+        assert lines[4] == "Ollama: ❌ offline"
+
 
 class TestExecManageMemory:
     """Tests for exec_manage_memory executor."""
@@ -485,6 +606,64 @@ class TestExecManageGoal:
         result = await exec_manage_goal(registry, {"action": "unknown"}, USER_ID)
         assert "unknown action" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_update_action_patches_description_in_place(self):
+        ks = AsyncMock()
+        ks.set_metadata_key = AsyncMock(return_value=True)
+        registry = make_registry(knowledge_store=ks)
+
+        result = await exec_manage_goal(
+            registry,
+            {"action": "update", "goal_id": "12", "description": "b"},
+            USER_ID,
+        )
+
+        ks.update.assert_not_awaited()
+        ks.set_metadata_key.assert_awaited_once_with(
+            USER_ID, 12, "description", "b", entity_type="goal"
+        )
+        assert result == "✅ Goal 12 updated: description → 'b'"
+
+    @pytest.mark.asyncio
+    async def test_update_action_title_only_skips_metadata(self):
+        ks = AsyncMock()
+        ks.update = AsyncMock(return_value=False)
+        registry = make_registry(knowledge_store=ks)
+
+        result = await exec_manage_goal(
+            registry, {"action": "update", "goal_id": 7, "title": "New"}, USER_ID
+        )
+
+        ks.update.assert_awaited_once_with(USER_ID, 7, "New", entity_type="goal")
+        ks.set_metadata_key.assert_not_awaited()
+        assert result == "No goal with ID 7 found."
+
+    @pytest.mark.asyncio
+    async def test_abandon_action_sets_status(self):
+        ks = AsyncMock()
+        ks.set_metadata_key = AsyncMock(return_value=True)
+        registry = make_registry(knowledge_store=ks)
+
+        result = await exec_manage_goal(
+            registry, {"action": "abandon", "goal_id": 5}, USER_ID
+        )
+
+        ks.set_metadata_key.assert_awaited_once_with(
+            USER_ID, 5, "status", "abandoned", entity_type="goal"
+        )
+        assert result == "✅ Goal 5 marked as abandoned."
+
+    @pytest.mark.asyncio
+    async def test_missing_goal_reports_not_found(self):
+        ks = AsyncMock()
+        ks.delete = AsyncMock(return_value=False)
+        registry = make_registry(knowledge_store=ks)
+
+        result = await exec_manage_goal(
+            registry, {"action": "delete", "goal_id": 99}, USER_ID
+        )
+        assert result == "No goal with ID 99 found."
+
     @pytest.mark.asyncio
     async def test_snooze_action_requires_goal_id(self):
         """Snooze action should require goal_id."""
@@ -14,6 +14,7 @@ from remy.ai.tools.plans import (
     exec_update_plan_status,
     exec_update_plan_step,
 )
+from remy.utils.ttl_cache import TTLCache
 
 
 USER_ID = 42
@@ -25,6 +26,7 @@ def make_registry(**kwargs) -> MagicMock:
     registry._plan_store = kwargs.get("plan_store")
     registry._goal_store = kwargs.get("goal_store")
     registry._knowledge_store = kwargs.get("knowledge_store")  # None by default
+    registry._summary_cache = TTLCache(maxsize=8, ttl=10)
     return registry
 
 
@@ -223,6 +225,50 @@ class TestExecGetPlan:
         assert "Learn Rust" in result
         assert "Install Rust" in result or "Read the book" in result
 
+    @pytest.mark.asyncio
+    async def test_formats_notes_and_attempts(self):
+        """Step notes and attempts are rendered beneath their step."""
+        plan = {
+            "id": 3,
+            "title": "Fix boiler",
+            "status": "active",
+            "created_at": "2026-03-01T10:00:00",
+            "updated_at": "2026-03-02T09:00:00",
+            "steps": [
+                {
+                    "id": 7,
+                    "position": 1,
+                    "title": "Call plumber",
+                    "status": "blocked",
+                    "notes": "Ask about warranty",
+                    "attempts": [
+                        {"attempted_at": "2026-03-01T11:00:00", "outcome": "no answer"},
+                        {
+                            "attempted_at": "2026-03-02T08:30:00",
+                            "outcome": "voicemail",
+                            "notes": "left number",
+                        },
+                    ],
+                },
+            ],
+        }
+        store = AsyncMock()
+        store.get_plan = AsyncMock(return_value=plan)
+        registry = make_registry(plan_store=store)
+
+        result = await exec_get_plan(registry, {"plan_id": 3}, USER_ID)
+
+        assert result == (
+            "📋 **Fix boiler** (ID 3)\n"
+            "Status: active\n"
+            "Created: 2026-03-01 | Updated: 2026-03-02\n"
+            "\n"
+            "1. 🚫 [blocked] Call plumber (step ID 7)\n"
+            "   Notes: Ask about warranty\n"
+            "   → 2026-03-01T11:00: no answer\n"
+            "   → 2026-03-02T08:30: voicemail — left number"
+        )
+
 
 class TestExecListPlans:
     """Tests for exec_list_plans executor."""
@@ -0,0 +1,61 @@
+"""Tests for remy.ai.tools.projects module."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from remy.ai.tools.projects import exec_get_project_status, scan_tree
+
+USER_ID = 42
+
+
+def make_registry(**kwargs) -> MagicMock:
+    """Create a mock registry with sensible defaults."""
+    registry = MagicMock()
+    registry._fact_store = kwargs.get("fact_store")
+    registry._knowledge_store = kwargs.get("knowledge_store")
+    return registry
+
+
+def test_scan_tree_counts_files_and_latest_mtime(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    sub = tmp_path / "src" / "pkg"
+    sub.mkdir(parents=True)
+    (sub / "b.py").write_text("b")
+    os.utime(sub / "b.py", (2_000_000_000, 2_000_000_000))
+    (tmp_path / "link").symlink_to(tmp_path / "src", target_is_directory=True)
+
+    assert scan_tree(str(tmp_path)) == (2, 2_000_000_000)
+
+
+def test_scan_tree_empty_dir(tmp_path):
+    assert scan_tree(str(tmp_path)) == (0, 0.0)
+
+
+class TestExecGetProjectStatus:
+    """Tests for exec_get_project_status executor."""
+
+    @pytest.mark.asyncio
+    async def test_reports_each_project(self, tmp_path):
+        full = tmp_path / "full"
+        full.mkdir()
+        (full / "main.py").write_text("x")
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        missing = tmp_path / "missing"
+        ks = MagicMock()
+        ks.get_facts_by_category = AsyncMock(
+            return_value=[{"content": str(p)} for p in (full, empty, missing)]
+        )
+        registry = make_registry(knowledge_store=ks)
+
+        result = await exec_get_project_status(registry, USER_ID)
+
+        lines = result.split("\n")
+        assert lines[0] == "📁 Tracked projects:"
+        assert f"• {full}" in lines and "1 files, last modified" in result
+        assert f"• {empty}\n  (empty)" in result
+        assert f"• {missing} _(not found)_" in result
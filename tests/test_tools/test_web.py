@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from remy.ai.tools.web import exec_price_check, exec_web_search
+from remy.utils.ttl_cache import TTLCache
+
+_RESULTS = [{"title": "T", "href": "https://x", "body": "B"}]
 
 
 def make_registry(**kwargs) -> MagicMock:
     """Create a mock registry with sensible defaults."""
     registry = MagicMock()
     registry._claude_client = kwargs.get("claude_client")
+    registry._web_search_cache = TTLCache(maxsize=8, ttl=300)
+    registry._price_check_cache = TTLCache(maxsize=8, ttl=300)
     return registry
 
 
@@ -34,6 +39,31 @@ class TestExecWebSearch:
         result = await exec_web_search(registry, {"query": "test"})
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_repeat_query_served_from_cache(self):
+        """Identical queries (ignoring case/whitespace) hit the search backend once."""
+        registry = make_registry()
+        with patch(
+            "remy.ai.tools.web.web_search", AsyncMock(return_value=_RESULTS)
+        ) as search:
+            first = await exec_web_search(registry, {"query": "Python 3.13"})
+            second = await exec_web_search(registry, {"query": "  python 3.13 "})
+
+        assert search.await_count == 1
+        assert first.startswith("Search results for 'Python 3.13'")
+        assert second == first.replace("'Python 3.13'", "'python 3.13'")
+
+    @pytest.mark.asyncio
+    async def test_empty_results_not_cached(self):
+        registry = make_registry()
+        with patch(
+            "remy.ai.tools.web.web_search", AsyncMock(return_value=[])
+        ) as search:
+            await exec_web_search(registry, {"query": "nothing"})
+            await exec_web_search(registry, {"query": "nothing"})
+
+        assert search.await_count == 2
+
 
 class TestExecPriceCheck:
     """Tests for exec_price_check executor."""
@@ -52,3 +82,15 @@ class TestExecPriceCheck:
         # Test with an item that will likely fail but still return a string
         result = await exec_price_check(registry, {"item": "test"})
         assert isinstance(result, str)
+
+    @pytest.mark.asyncio
+    async def test_repeat_item_served_from_cache(self):
+        registry = make_registry()
+        with patch(
+            "remy.ai.tools.web.web_search", AsyncMock(return_value=_RESULTS)
+        ) as search:
+            await exec_price_check(registry, {"item": "AirPods"})
+            result = await exec_price_check(registry, {"item": "airpods"})
+
+        assert search.await_count == 1
+        assert "Price check for 'airpods'" in result
@@ -0,0 +1,56 @@
+"""
+Tests for the in-process TTL/LRU cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from remy.utils.ttl_cache import TTLCache
+
+
+def test_get_returns_stored_value():
+    cache: TTLCache[str] = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", "1")
+    assert cache.get("a") == "1"
+    assert "a" in cache
+    assert cache.get("missing") is None
+    assert cache.get("missing", "d") == "d"
+
+
+def test_entries_expire_after_ttl():
+    cache: TTLCache[str] = TTLCache(maxsize=4, ttl=10)
+    with patch("remy.utils.ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("a", "1")
+    with patch("remy.utils.ttl_cache.time.monotonic", return_value=109.9):
+        assert cache.get("a") == "1"
+    with patch("remy.utils.ttl_cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_and_clear():
+    cache: TTLCache[int] = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.pop("a")
+    cache.pop("not-there")
+    assert "a" not in cache
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)